@@ -1,5 +1,7 @@
 """Tests for Philips quirks."""
 
+import asyncio
+import itertools
 from unittest import mock
 
 import pytest
@@ -631,20 +633,17 @@ def test_PhilipsRemoteCluster_long_press(
 async def test_ButtonPressQueue_presses_without_pause(button_presses):
     """Test ButtonPressQueue presses without pause in between presses."""
 
-    q = ButtonPressQueue()
-    q._ms_threshold = 50
+    q = ButtonPressQueue(threshold=0.05)
     cb = mock.MagicMock()
     for _ in range(button_presses):
         q.press(cb)
 
-    # await cluster.button_press_queue._task
-    # Instead of awaiting the job, significantly extending the time
-    # these tests need, we just abort it and call the callback
-    # ourselves.
-    assert q._task is not None
-    q._task.cancel()
-    q._ms_last_click = 0
-    q._callback(q._click_counter)
+    # Instead of waiting for the threshold, significantly extending the time
+    # these tests need, we just fire the pending handle ourselves.
+    assert q._handle is not None
+    q._handle.cancel()
+    q._fire()
+    assert q._handle is None
     cb.assert_called_once_with(button_presses)
 
 
@@ -658,14 +657,13 @@ async def test_ButtonPressQueue_presses_without_pause(button_presses):
 async def test_ButtonPressQueue_presses_with_pause(press_sequence):
     """Test ButtonPressQueue with pauses in between button press sequences."""
 
-    q = ButtonPressQueue()
-    q._ms_threshold = 50
+    q = ButtonPressQueue(threshold=0.05)
     cb = mock.MagicMock()
 
     for seq in press_sequence:
         for _ in range(seq):
             q.press(cb)
-        await q._task
+        await asyncio.sleep(0.1)
 
     assert cb.call_count == len(press_sequence)
 
@@ -676,6 +674,63 @@ async def test_ButtonPressQueue_presses_with_pause(press_sequence):
     cb.assert_has_calls(calls)
 
 
+async def test_ButtonPressQueue_wall_clock_step():
+    """Test multi press counting ignores wall clock steps."""
+
+    q = ButtonPressQueue(threshold=0.05)
+    cb = mock.MagicMock()
+
+    with mock.patch("time.time", side_effect=itertools.cycle([0, 3600, -3600])):
+        for _ in range(3):
+            q.press(cb)
+        await asyncio.sleep(0.1)
+
+    cb.assert_called_once_with(3)
+
+
+def test_ButtonPressQueue_threshold_per_remote(zigpy_device_from_quirk):
+    """Test the multi press threshold can be configured per remote."""
+
+    class SlowRemoteCluster(PhilipsRemoteCluster):
+        BUTTONS = {1: Button("on", TURN_ON)}
+        MULTI_PRESS_THRESHOLD = 0.6
+
+    device = zigpy_device_from_quirk(PhilipsRWL022)
+    cluster = SlowRemoteCluster(device.endpoints[1])
+    assert cluster.button_press_queue[1].threshold == 0.6
+    assert ButtonPressQueue().threshold == zhaquirks.philips.MULTI_PRESS_THRESHOLD
+
+
+async def test_press_event_templates(zigpy_device_from_quirk):
+    """Test press events are built from per class templates."""
+
+    device = zigpy_device_from_quirk(PhilipsRWL022)
+    cluster = device.endpoints[1].philips_remote_cluster
+    listener = mock.MagicMock()
+    cluster.add_listener(listener)
+
+    hdr = ZCLHeader.cluster(tsn=1, command_id=0)
+    for _ in range(2):
+        cluster.handle_cluster_request(hdr, [1, 0, 1, 0, 8])
+    first, second = (call.args for call in listener.zha_send_event.call_args_list)
+    assert first == second
+    assert first[0] == "on_hold"
+    assert first[1] == {
+        "button": "on",
+        "press_type": "hold",
+        "command_id": 0,
+        "duration": 8,
+        "args": [1, 0, 1, 0, 8],
+    }
+    assert first[1] is not second[1]
+
+    button, press_type = cluster.BUTTONS[1], cluster.PRESS_TYPES[1]
+    action, template = type(cluster)._event_template(button, press_type)
+    assert type(cluster)._event_template(button, press_type)[1] is template
+    with pytest.raises(TypeError):
+        template["button"] = "off"
+
+
 def test_rdm002_triggers():
     """Ensure RDM002 triggers won't break."""
 
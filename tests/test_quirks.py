@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import collections
 import importlib
 import json
@@ -14,7 +15,7 @@ import zigpy.device
 import zigpy.endpoint
 import zigpy.profiles
 import zigpy.quirks as zq
-from zigpy.quirks import CustomDevice, DeviceRegistry
+from zigpy.quirks import CustomCluster, CustomDevice, DeviceRegistry
 from zigpy.quirks.v2 import QuirkBuilder
 import zigpy.types
 from zigpy.zcl import foundation
@@ -144,7 +145,9 @@ def test_dev_from_signature_incomplete_sig(raw_device: zigpy.device.Device) -> N
     BadSigNoModel.from_signature(raw_device, model="model_model")
 
     # require manufacturer, if no signature[MODELS_INFO]
+    # signatures are compiled once, so reset the recipe after changing them
     BadSigNoModel.signature.pop(MODELS_INFO)
+    BadSigNoModel._signature_recipe = None
     with pytest.raises(KeyError):
         BadSigNoModel.from_signature(raw_device, model="model_model")
     BadSigNoModel.signature[MANUFACTURER] = "some manufacturer"
@@ -171,6 +174,7 @@ def test_dev_from_signature_incomplete_sig(raw_device: zigpy.device.Device) -> N
         incomplete_ep = {**ep_sig_complete}
         incomplete_ep.pop(missing_item)
         BadSigIncompleteEp.signature[ENDPOINTS][3] = incomplete_ep
+        BadSigIncompleteEp._signature_recipe = None
         with pytest.raises(KeyError):
             BadSigIncompleteEp.from_signature(raw_device)
 
@@ -286,6 +290,45 @@ def test_dev_from_signature(
         assert list(ep.out_clusters) == ep_data[OUTPUT_CLUSTERS]
 
 
+def test_dev_from_signature_recipe(raw_device: zigpy.device.Device) -> None:
+    """Test that quirk signatures are compiled once per quirk class."""
+
+    class QuirkDevice(zhaquirks.QuickInitDevice):
+        signature = {
+            ENDPOINTS: {
+                1: {
+                    PROFILE_ID: 260,
+                    DEVICE_TYPE: 0x0100,
+                    INPUT_CLUSTERS: [0x0000, 0x0006],
+                    OUTPUT_CLUSTERS: [0x0019],
+                }
+            },
+            MODELS_INFO: (("LUMI", "model_5"),),
+            NODE_DESCRIPTOR: XIAOMI_NODE_DESC,
+        }
+
+    class SubQuirkDevice(QuirkDevice):
+        signature = {**QuirkDevice.signature, MANUFACTURER: "manufacturer_5"}
+
+    device = QuirkDevice.from_signature(raw_device, model="model_5")
+    recipe = QuirkDevice._signature_recipe
+    assert recipe is not None
+
+    basic = device.endpoints[1].basic
+    assert basic.get("manufacturer") == "LUMI"
+    assert basic.get("model") == "model_5"
+
+    other = zigpy.device.Device(mock.MagicMock(), raw_device.ieee, 0x5678)
+    QuirkDevice.from_signature(other, model="model_5")
+    assert QuirkDevice._signature_recipe is recipe
+
+    # Subclasses compile their own signature
+    other = zigpy.device.Device(mock.MagicMock(), raw_device.ieee, 0x5678)
+    SubQuirkDevice.from_signature(other, model="model_5")
+    assert SubQuirkDevice._signature_recipe is not recipe
+    assert other.manufacturer == "manufacturer_5"
+
+
 @pytest.mark.parametrize(
     "quirk",
     (q for q in ALL_QUIRK_CLASSES if issubclass(q, zhaquirks.QuickInitDevice)),
@@ -873,3 +916,323 @@ async def test_local_data_cluster(device_mock) -> None:
         {2: None},
         {},
     )
+
+
+async def test_timer_wheel() -> None:
+    """Test re-arming, cancelling and firing timers on the shared timer wheel."""
+    loop = asyncio.get_running_loop()
+    wheel = zhaquirks.TimerWheel.for_loop()
+    assert zhaquirks.TimerWheel.for_loop(loop) is wheel
+
+    fired = []
+    first = wheel.timer(lambda: fired.append("first"))
+    second = wheel.timer(lambda: fired.append("second"))
+    cancelled = wheel.timer(lambda: fired.append("cancelled"))
+
+    first.rearm(0.05)
+    second.rearm(0.01)
+    cancelled.rearm(0.02)
+    assert len(wheel) == 3
+
+    # re-arming keeps a single entry per timer
+    first.rearm(0.03)
+    assert len(wheel) == 3
+
+    assert cancelled.cancel() is True
+    assert cancelled.cancel() is False
+    assert not cancelled.active
+
+    await asyncio.sleep(0.1)
+    assert fired == ["second", "first"]
+    assert not first.active
+    assert not second.active
+    assert len(wheel) == 0
+
+    # timers can be re-armed from their own callback
+    def _rearm() -> None:
+        fired.append("rearmed")
+        if fired.count("rearmed") < 2:
+            rearmed.rearm(0)
+
+    rearmed = wheel.timer(_rearm)
+    rearmed.rearm(0)
+    await asyncio.sleep(0.01)
+    assert fired.count("rearmed") == 2
+
+
+def test_timer_wheel_reuses_slots() -> None:
+    """Test that cancelling and re-arming into the same slot keeps one heap entry."""
+    loop = mock.Mock()
+    loop.time.return_value = 100.0
+    wheel = zhaquirks.TimerWheel(loop, resolution=1.0)
+    timer = wheel.timer(mock.Mock())
+
+    for _ in range(10):
+        timer.rearm(0.5)
+        timer.cancel()
+
+    assert wheel._slot_heap == [100]
+    assert len(wheel) == 0
+
+
+def test_timer_wheel_early_wakeup() -> None:
+    """Test that timers fire if the loop wakes up within its clock resolution."""
+    loop = mock.Mock()
+    loop.time.return_value = 100.0
+    wheel = zhaquirks.TimerWheel(loop)
+    callback = mock.Mock()
+    wheel.timer(callback).rearm(1)
+
+    loop.time.return_value = 101.0 - zhaquirks.TIMER_CLOCK_RESOLUTION / 2
+    wheel._run()
+
+    assert callback.call_count == 1
+    assert len(wheel) == 0
+
+
+def test_local_data_cluster_update_attributes(zigpy_device_from_quirk) -> None:
+    """Test batched local updates go through _update_attribute."""
+
+    class ScaledOnOffCluster(zhaquirks.LocalDataCluster, zcl.clusters.general.OnOff):
+        def _update_attribute(self, attrid, value):
+            super()._update_attribute(attrid, value * 10)
+
+    device = zigpy_device_from_quirk(zhaquirks.bosch.motion.ISWZPR1WP13)
+    cluster = ScaledOnOffCluster(device.endpoints[5])
+    listener = mock.MagicMock()
+    cluster.add_listener(listener)
+
+    cluster.update_attributes({0x4001: 3, 0x4002: 4})
+
+    assert cluster.get(0x4001) == 30
+    assert cluster.get(0x4002) == 40
+    assert listener.attribute_updated.call_count == 2
+    listener.attribute_updated_batch.assert_called_once_with({0x4001: 30, 0x4002: 40})
+
+
+def test_local_data_cluster_batch_records_stored_values(zigpy_device_from_quirk):
+    """Test batches carry the values stored by clusters further down the MRO."""
+
+    class ConvertingOnOffCluster(CustomCluster, zcl.clusters.general.OnOff):
+        def _update_attribute(self, attrid, value):
+            if value < 0:
+                return
+            super()._update_attribute(attrid, zigpy.types.uint16_t(value))
+
+    class LocalOnOffCluster(zhaquirks.LocalDataCluster, ConvertingOnOffCluster):
+        pass
+
+    device = zigpy_device_from_quirk(zhaquirks.bosch.motion.ISWZPR1WP13)
+    cluster = LocalOnOffCluster(device.endpoints[5])
+    listener = mock.MagicMock()
+    cluster.add_listener(listener)
+
+    cluster.update_attributes({0x4001: 3, 0x4002: -1})
+
+    ((values,), _) = listener.attribute_updated_batch.call_args
+    assert values == {0x4001: 3}
+    assert type(values[0x4001]) is zigpy.types.uint16_t
+
+
+async def test_eventable_cluster_attribute_batch(zigpy_device_from_quirk) -> None:
+    """Test attribute updates of a frame are sent as a single batch event."""
+
+    class BatchedOnOffCluster(zhaquirks.EventableCluster, zcl.clusters.general.OnOff):
+        batch_attribute_updates = True
+
+    device = zigpy_device_from_quirk(zhaquirks.bosch.motion.ISWZPR1WP13)
+    cluster = BatchedOnOffCluster(device.endpoints[5])
+    listener = mock.MagicMock()
+    cluster.add_listener(listener)
+
+    report = foundation.GENERAL_COMMANDS[
+        foundation.GeneralCommand.Report_Attributes
+    ].schema(
+        attribute_reports=[
+            foundation.Attribute(
+                0x0000, foundation.TypeValue(zigpy.types.Bool, zigpy.types.Bool.true)
+            ),
+            foundation.Attribute(
+                0x4001, foundation.TypeValue(zigpy.types.uint16_t, 300)
+            ),
+        ]
+    )
+    cluster.handle_message(
+        foundation.ZCLHeader.general(1, foundation.GeneralCommand.Report_Attributes),
+        report,
+    )
+
+    updates = [
+        {"attribute_id": 0x0000, "attribute_name": "on_off", "value": 1},
+        {"attribute_id": 0x4001, "attribute_name": "on_time", "value": 300},
+    ]
+    assert listener.zha_send_event.call_args_list == [
+        mock.call(const.COMMAND_ATTRIBUTE_UPDATED, updates[0]),
+        mock.call(const.COMMAND_ATTRIBUTE_UPDATED, updates[1]),
+        mock.call(const.COMMAND_ATTRIBUTE_UPDATED_BATCH, {"attributes": updates}),
+    ]
+
+    # updates outside of a frame only send their own event
+    listener.reset_mock()
+    cluster.update_attribute(0x4001, 60)
+    assert listener.zha_send_event.call_args_list == [
+        mock.call(
+            const.COMMAND_ATTRIBUTE_UPDATED,
+            {"attribute_id": 0x4001, "attribute_name": "on_time", "value": 60},
+        )
+    ]
+
+    # read attribute responses are a batch, frames received meanwhile are not
+    # merged into it
+    listener.reset_mock()
+
+    async def read_attributes_raw(attributes, manufacturer=None, **kwargs):
+        cluster.handle_message(
+            foundation.ZCLHeader.general(
+                2, foundation.GeneralCommand.Report_Attributes
+            ),
+            report,
+        )
+        return (
+            [
+                foundation.ReadAttributeRecord(
+                    attrid,
+                    foundation.Status.SUCCESS,
+                    foundation.TypeValue(zigpy.types.uint16_t, 120),
+                )
+                for attrid in attributes
+            ],
+        )
+
+    with mock.patch.object(cluster, "read_attributes_raw", read_attributes_raw):
+        await cluster.read_attributes([0x4001, 0x4002])
+
+    assert listener.attribute_updated_batch.call_args_list == [
+        mock.call({0x0000: 1, 0x4001: 300}),
+        mock.call({0x4001: 120, 0x4002: 120}),
+    ]
+
+    # batching is opt-in
+    listener.reset_mock()
+    BatchedOnOffCluster.batch_attribute_updates = False
+    cluster.update_attribute(0x4001, 30)
+    with cluster.attribute_update_batch():
+        cluster.update_attribute(0x4001, 20)
+        cluster.update_attribute(0x4001, 10)
+    assert [call.args[0] for call in listener.zha_send_event.call_args_list] == [
+        const.COMMAND_ATTRIBUTE_UPDATED,
+        const.COMMAND_ATTRIBUTE_UPDATED,
+        const.COMMAND_ATTRIBUTE_UPDATED,
+        const.COMMAND_ATTRIBUTE_UPDATED_BATCH,
+    ]
+
+
+def test_gesture_events() -> None:
+    """Test sending gesture events with prebuilt payloads."""
+    cluster = mock.MagicMock()
+    events = zhaquirks.GestureEvents(
+        {1: const.BUTTON_1, 2: const.BUTTON_2},
+        {
+            zhaquirks.Gesture.SINGLE: const.COMMAND_SINGLE,
+            zhaquirks.Gesture.LONG_PRESS: const.COMMAND_HOLD,
+        },
+        event_args={"command_id": 0},
+    )
+
+    # unknown buttons and gestures are ignored
+    assert events.emit(cluster, 1, zhaquirks.Gesture.SINGLE, value=3) is True
+    assert events.emit(cluster, 2, zhaquirks.Gesture.LONG_PRESS) is True
+    assert events.emit(cluster, 1, zhaquirks.Gesture.QUINTUPLE) is False
+    assert events.emit(cluster, 3, zhaquirks.Gesture.SINGLE) is False
+
+    assert [call.args[1:] for call in cluster.listener_event.call_args_list] == [
+        (
+            "button_1_single",
+            {"button": "button_1", "press_type": "single", "command_id": 0, "value": 3},
+        ),
+        (
+            "button_2_hold",
+            {"button": "button_2", "press_type": "hold", "command_id": 0},
+        ),
+    ]
+
+    # every event gets its own copy of the payload
+    first = cluster.listener_event.call_args_list[0].args[2]
+    events.emit(cluster, 1, zhaquirks.Gesture.SINGLE)
+    assert "value" not in cluster.listener_event.call_args.args[2]
+    assert first is not cluster.listener_event.call_args.args[2]
+
+
+async def test_gesture_engine() -> None:
+    """Test deriving gestures from press, release and hold primitives."""
+    cluster = mock.MagicMock()
+    events = zhaquirks.GestureEvents(
+        {1: const.BUTTON_1, 2: const.BUTTON_2},
+        {
+            zhaquirks.Gesture.SINGLE: const.COMMAND_SINGLE,
+            zhaquirks.Gesture.DOUBLE: const.COMMAND_DOUBLE,
+            zhaquirks.Gesture.TRIPLE: const.COMMAND_TRIPLE,
+            zhaquirks.Gesture.LONG_PRESS: const.COMMAND_HOLD,
+            zhaquirks.Gesture.LONG_RELEASE: const.COMMAND_RELEASE,
+        },
+        event_args={"command_id": 0},
+    )
+    gestures = zhaquirks.GestureEngine(
+        cluster, events, multi_press_threshold=0.02, long_press_threshold=0.05
+    )
+
+    def sent():
+        calls = [call.args[1:] for call in cluster.listener_event.call_args_list]
+        cluster.listener_event.reset_mock()
+        return calls
+
+    # two clicks within the threshold
+    for _ in range(2):
+        gestures.press(1)
+        gestures.release(1)
+    assert sent() == []
+    await asyncio.sleep(0.04)
+    assert sent() == [
+        (
+            "button_1_double",
+            {"button": "button_1", "press_type": "double", "command_id": 0},
+        )
+    ]
+
+    # the last supported multi press is sent right away
+    for _ in range(3):
+        gestures.press(2)
+        gestures.release(2)
+    assert [action for action, _ in sent()] == ["button_2_triple"]
+
+    # holding the button past the long press threshold
+    gestures.press(1)
+    await asyncio.sleep(0.08)
+    gestures.release(1)
+    assert [action for action, _ in sent()] == ["button_1_hold", "button_1_release"]
+
+    # holds reported by the device flush pending presses, releases without a
+    # press or hold are ignored
+    gestures.press(2)
+    gestures.release(2)
+    gestures.hold(2)
+    gestures.hold(2)
+    gestures.release(2)
+    gestures.release(2)
+    assert [action for action, _ in sent()] == [
+        "button_2_single",
+        "button_2_hold",
+        "button_2_release",
+    ]
+
+    # gestures reported by the device, unknown buttons are ignored
+    assert gestures.emit(1, zhaquirks.Gesture.SINGLE) is True
+    gestures.press(3)
+    gestures.release(3)
+    assert [action for action, _ in sent()] == ["button_1_single"]
+
+    gestures.press(1)
+    gestures.release(1)
+    gestures.cancel()
+    await asyncio.sleep(0.04)
+    assert sent() == []
@@ -0,0 +1,57 @@
+"""Tests for Siglis zigfred quirks."""
+
+from unittest import mock
+
+from zigpy.zcl import foundation
+
+import zhaquirks
+from zhaquirks.siglis.zigfred import (
+    ZIGFRED_CLUSTER_COMMAND_BUTTON_EVENT,
+    ZIGFRED_CLUSTER_ID,
+    ZigfredUno,
+)
+
+zhaquirks.setup()
+
+
+def test_zigfred_button_events(zigpy_device_from_quirk):
+    """Test zigfred button events, with long presses paired up."""
+
+    device = zigpy_device_from_quirk(ZigfredUno)
+    cluster = device.endpoints[5].in_clusters[ZIGFRED_CLUSTER_ID]
+    listener = mock.MagicMock()
+    cluster.add_listener(listener)
+
+    def button_event(button, press_type):
+        hdr = foundation.ZCLHeader.cluster(1, ZIGFRED_CLUSTER_COMMAND_BUTTON_EVENT)
+        cluster.handle_cluster_request(hdr, [press_type << 8 | button])
+
+    button_event(0, 1)
+    button_event(1, 2)
+    # repeated hold reports and a release without a hold are dropped
+    button_event(2, 3)
+    button_event(2, 3)
+    button_event(2, 0)
+    button_event(3, 0)
+    # unknown buttons and press types are ignored
+    button_event(4, 1)
+    button_event(0, 4)
+
+    assert [call.args for call in listener.zha_send_event.call_args_list] == [
+        (
+            "button_1_remote_button_short_press",
+            {"button": "button_1", "press_type": "remote_button_short_press"},
+        ),
+        (
+            "button_2_remote_button_double_press",
+            {"button": "button_2", "press_type": "remote_button_double_press"},
+        ),
+        (
+            "button_3_remote_button_long_press",
+            {"button": "button_3", "press_type": "remote_button_long_press"},
+        ),
+        (
+            "button_3_remote_button_long_release",
+            {"button": "button_3", "press_type": "remote_button_long_release"},
+        ),
+    ]
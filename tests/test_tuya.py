@@ -8,11 +8,13 @@ from unittest import mock
 import pytest
 from zigpy.device import Device
 from zigpy.profiles import zha
+import zigpy.quirks
 from zigpy.quirks import CustomDevice, get_device
 import zigpy.types as t
 from zigpy.zcl import foundation
 from zigpy.zcl.clusters.general import PowerConfiguration
 from zigpy.zcl.clusters.security import IasZone, ZoneStatus
+import zigpy.zdo.types as zdo_t
 
 from tests.common import ClusterListener, MockDatetime, wait_for_zigpy_tasks
 import zhaquirks
@@ -1327,6 +1329,60 @@ async def test_moes(zigpy_device_from_quirk, quirk):
         datetime.datetime = origdatetime
 
 
+async def test_moes_schedule_sharing(zigpy_device_from_quirk):
+    """Test identical schedules are shared between valves and only changes are written."""
+    quirk = zhaquirks.tuya.ts0601_trv.MoesHY368_Type1
+    valves = [zigpy_device_from_quirk(quirk, ieee=t.EUI64((i,) * 8)) for i in range(2)]
+    for valve in valves:
+        tuya_cluster = valve.endpoints[1].tuya_manufacturer
+        for frame in (ZCL_TUYA_VALVE_WORKDAY_SCHEDULE, ZCL_TUYA_VALVE_WEEKEND_SCHEDULE):
+            hdr, args = tuya_cluster.deserialize(frame)
+            tuya_cluster.handle_message(hdr, args)
+
+    thermostats = [valve.endpoints[1].thermostat for valve in valves]
+    workday = thermostats[0].current_schedule(0x70)
+    assert workday.periods == (
+        (6, 0, 2000),
+        (8, 0, 1500),
+        (11, 30, 1500),
+        (12, 30, 1500),
+        (17, 30, 2000),
+        (22, 0, 1500),
+    )
+    assert workday is zhaquirks.tuya.ts0601_trv.MOES_DEFAULT_SCHEDULE
+    assert thermostats[1].current_schedule(0x70) is workday
+    assert thermostats[1].current_schedule(0x71) is workday
+    assert thermostats[1].get("workday_schedule_3_minute") == 30
+    assert thermostats[1].get("weekend_schedule_5_temperature") == 2000
+
+    # a repeated report of the same schedule is not applied again
+    listener = ClusterListener(thermostats[0])
+    tuya_cluster = valves[0].endpoints[1].tuya_manufacturer
+    hdr, args = tuya_cluster.deserialize(ZCL_TUYA_VALVE_WORKDAY_SCHEDULE)
+    tuya_cluster.handle_message(hdr, args)
+    assert not listener.attribute_updates
+
+    new_workday = workday.replace(1, 0, 5)
+    assert new_workday is workday.replace(1, 0, 5)
+    for thermostat in thermostats:
+        with mock.patch.object(
+            thermostat.endpoint.tuya_manufacturer, "write_attributes"
+        ) as write_mock:
+            (status,) = await thermostat.write_schedules(
+                workday=new_workday, weekend=workday
+            )
+            write_mock.assert_called_once_with(
+                {0x70: new_workday.to_data144()}, manufacturer=None
+            )
+            assert status == [
+                foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)
+            ]
+
+            write_mock.reset_mock()
+            await thermostat.write_schedules(workday=workday, weekend=workday)
+            write_mock.assert_not_called()
+
+
 @pytest.mark.parametrize("quirk", (zhaquirks.tuya.ts0601_electric_heating.MoesBHT,))
 async def test_eheating_state_report(zigpy_device_from_quirk, quirk):
     """Test thermostatic valves standard reporting from incoming commands."""
@@ -1955,6 +2011,203 @@ async def test_ts1201_ir_blaster(zigpy_device_from_quirk):
         )
 
 
+def _ts1201_frame(frame_control, tsn, command_id, fmt, *args):
+    """Build a ZCL frame sent by the TS1201 transmit cluster."""
+    return bytes((frame_control, tsn, command_id)) + struct.pack(fmt, *args)
+
+
+async def test_ts1201_ir_blaster_concurrent_learn(zigpy_device_from_quirk):
+    """Test learning IR codes on several TS1201 at once."""
+    quirk = zhaquirks.tuya.ts1201.ZosungIRBlaster
+    codes = {
+        1: b"\x01\x02\x03\x04\x05\x06\x07\x08",
+        2: b"\x10\x20\x30\x40\x50",
+    }
+    devices = {
+        seq: zigpy_device_from_quirk(quirk, ieee=t.EUI64((seq,) * 8)) for seq in codes
+    }
+
+    for dev in devices.values():
+        dev.endpoints[1].zosung_irtransmit.request = mock.AsyncMock()
+        dev.endpoints[1].zosung_ircontrol.request = mock.AsyncMock()
+
+    # both devices use the same sequence number for their transfers
+    for code, dev in zip(codes.values(), devices.values()):
+        cluster = dev.endpoints[1].zosung_irtransmit
+        hdr, args = cluster.deserialize(
+            _ts1201_frame(0x01, 1, 0x00, "<HIIHBBH", 1, len(code), 0, 0xE004, 1, 4, 0)
+        )
+        cluster.handle_message(hdr, args)
+
+    # interleave the code parts of both devices, with one corrupted part
+    for offset in (0, 4):
+        for code, dev in zip(codes.values(), devices.values()):
+            cluster = dev.endpoints[1].zosung_irtransmit
+            part = code[offset : offset + 4]
+            if not part:
+                continue
+            crc = sum(part) % 0x100
+            if offset == 4 and code is codes[1]:
+                hdr, args = cluster.deserialize(
+                    _ts1201_frame(
+                        0x09,
+                        2,
+                        0x03,
+                        f"<BHIB{len(part)}sB",
+                        0,
+                        1,
+                        offset,
+                        4,
+                        part,
+                        crc ^ 1,
+                    )
+                )
+                cluster.handle_message(hdr, args)
+            hdr, args = cluster.deserialize(
+                _ts1201_frame(
+                    0x09,
+                    3,
+                    0x03,
+                    f"<BHIB{len(part)}sB",
+                    0,
+                    1,
+                    offset,
+                    len(part),
+                    part,
+                    crc,
+                )
+            )
+            cluster.handle_message(hdr, args)
+
+    for code, dev in zip(codes.values(), devices.values()):
+        cluster = dev.endpoints[1].zosung_irtransmit
+        hdr, args = cluster.deserialize(_ts1201_frame(0x09, 4, 0x05, "<HH", 1, 0))
+        cluster.handle_message(hdr, args)
+        assert dev.last_learned_ir_code == base64.b64encode(code).decode()
+        assert not dev.ir_learn_sessions
+
+    await wait_for_zigpy_tasks()
+
+
+async def test_ts1201_ir_blaster_fast_transfer(zigpy_device_from_quirk):
+    """Test windowed IR code sending on TS1201."""
+
+    ts1201 = zhaquirks.tuya.ts1201
+    endpoint = ts1201.ZosungIRBlaster.replacement[ENDPOINTS][1]
+
+    # keep the quirk out of the registry, it would match real devices
+    with mock.patch.object(zigpy.quirks._DEVICE_REGISTRY, "add_to_registry"):
+
+        class ZosungIRBlasterFast(ts1201.ZosungIRBlaster):
+            """TS1201 quirk sending IR codes with fast transfers."""
+
+            replacement = {
+                ENDPOINTS: {
+                    1: {
+                        INPUT_CLUSTERS: [
+                            ts1201.ZosungIRTransmitFast
+                            if cluster is ts1201.ZosungIRTransmit
+                            else cluster
+                            for cluster in endpoint[INPUT_CLUSTERS]
+                        ],
+                        OUTPUT_CLUSTERS: endpoint[OUTPUT_CLUSTERS],
+                    },
+                },
+            }
+
+    ts1201_dev = zigpy_device_from_quirk(ZosungIRBlasterFast)
+    ts1201_dev.node_desc = zdo_t.NodeDescriptor(maximum_incoming_transfer_size=82)
+    control_cluster = ts1201_dev.endpoints[1].zosung_ircontrol
+    transmit_cluster = ts1201_dev.endpoints[1].zosung_irtransmit
+    assert transmit_cluster.fast_transfer
+    assert not ts1201.ZosungIRTransmit.fast_transfer
+    transmit_cluster.transfer_window = 2
+
+    code = "B3wPfA/5AcoH4AUDAeUDgAPAC+AHB+AHA+ADN+ALBw" * 4
+    with mock.patch.object(
+        transmit_cluster, "request", return_value=foundation.Status.SUCCESS
+    ) as request_mock:
+        await control_cluster.command(0x0002, code=code)
+        await wait_for_zigpy_tasks()
+
+        # the chunks are built once for the negotiated size
+        session = ts1201_dev.ir_send_sessions[1]
+        assert session.chunk_size == 82 - 12
+        chunks = session.chunks
+        assert chunks is session.code.chunks(82 - 12)
+        assert len(chunks) == 4
+
+        def sent_parts():
+            parts = [c.kwargs for c in request_mock.call_args_list if c.args[1] == 0x03]
+            request_mock.reset_mock()
+            return parts
+
+        def request_chunk(tsn, position):
+            hdr, args = transmit_cluster.deserialize(
+                _ts1201_frame(0x11, tsn, 0x02, "<HIB", 1, position, 0x38)
+            )
+            transmit_cluster.handle_message(hdr, args)
+
+        # the negotiated size beats the requested length, one chunk is pushed
+        # as probe
+        request_chunk(1, 0)
+        await wait_for_zigpy_tasks()
+        parts = sent_parts()
+        assert [p["position"] for p in parts] == [0, 70]
+        assert [(p["msgpart"], p["msgpartcrc"]) for p in parts] == list(chunks[:2])
+
+        # the device took the probe, so the window grows
+        request_chunk(2, 140)
+        await wait_for_zigpy_tasks()
+        parts = sent_parts()
+        assert [p["position"] for p in parts] == [140, 210]
+        assert parts[1]["msgpart"] == chunks[3][0]
+        assert parts[1]["msgpartcrc"] == chunks[3][1]
+
+        # asking for a pushed chunk again stops pushing
+        request_chunk(3, 210)
+        await wait_for_zigpy_tasks()
+        assert [p["position"] for p in sent_parts()] == [210]
+
+        hdr, args = transmit_cluster.deserialize(
+            _ts1201_frame(0x01, 5, 0x04, "<BHH", 0, 1, 0)
+        )
+        transmit_cluster.handle_message(hdr, args)
+        await wait_for_zigpy_tasks()
+        assert not ts1201_dev.ir_send_sessions
+        assert ts1201_dev.last_ir_send_duration is not None
+
+
+def test_ts1201_ir_code_cache():
+    """Test TS1201 IR code chunks and LRU cache."""
+    cache = zhaquirks.tuya.ts1201.ZosungIRCodeCache(maxsize=2)
+
+    ir_code = cache.get("AAAA")
+    assert cache.get("AAAA") is ir_code
+    assert ir_code.payload == (
+        b'{"key_num":1,"delay":300,"key1":'
+        b'{"num":1,"freq":38000,"type":1,"key_code":"AAAA"}}'
+    )
+
+    chunks = ir_code.chunks(0x38)
+    assert b"".join(part for part, _ in chunks) == ir_code.payload
+    assert all(crc == sum(part) % 0x100 for part, crc in chunks)
+    assert ir_code.chunks(0x38) is chunks
+    assert ir_code.chunk(0x38, 0x38) is chunks[1]
+    assert ir_code.chunk(10, 0x38) == (
+        ir_code.payload[10 : 10 + 0x38],
+        sum(ir_code.payload[10 : 10 + 0x38]) % 0x100,
+    )
+    assert ir_code.chunk(0x380, 0x38) == (b"", 0)
+
+    cache.get("BBBB")
+    cache.get("AAAA")
+    cache.get("CCCC")
+    assert len(cache) == 2
+    assert "AAAA" in cache
+    assert "BBBB" not in cache
+
+
 def test_ts601_door_sensor_signature(assert_signature_matches_quirk):
     """Test TS601 Vibration Door Sensor signature against quirk."""
     signature = {
@@ -1,5 +1,23 @@
 """Test units for Tuya covers."""
 
+import asyncio
+from unittest import mock
+
+from zigpy.zcl import foundation
+
+from tests.common import ClusterListener
+from zhaquirks.tuya import (
+    ATTR_COVER_DIRECTION,
+    ATTR_COVER_POSITION,
+    COVER_EVENT,
+    TUYA_DP_ID_PERCENT_STATE,
+    TUYA_DP_TYPE_VALUE,
+    TUYA_GET_DATA,
+    WINDOW_COVER_COMMAND_LIFTPERCENT,
+    WINDOW_COVER_COMMAND_STOP,
+    WINDOW_COVER_COMMAND_UPOPEN,
+    TuyaManufCluster,
+)
 from zhaquirks.tuya.ts0601_cover import TuyaMoesCover0601
 
 
@@ -20,3 +38,130 @@ def test_ts601_moes_signature(assert_signature_matches_quirk):
         "class": "zigpy.device.Device",
     }
     assert_signature_matches_quirk(TuyaMoesCover0601, signature)
+
+
+async def test_cover_duplicate_target(zigpy_device_from_quirk):
+    """Test repeated targets are not sent while the cover is moving."""
+    device = zigpy_device_from_quirk(TuyaMoesCover0601)
+    cover_cluster = device.endpoints[1].window_covering
+
+    with mock.patch.object(
+        device.endpoints[1].tuya_manufacturer, "command", mock.AsyncMock()
+    ) as command_mock:
+        await cover_cluster.command(WINDOW_COVER_COMMAND_LIFTPERCENT, 50)
+        await cover_cluster.command(WINDOW_COVER_COMMAND_LIFTPERCENT, 50)
+        assert command_mock.call_count == 1
+
+        await cover_cluster.command(WINDOW_COVER_COMMAND_LIFTPERCENT, 60)
+        assert command_mock.call_count == 2
+
+        await cover_cluster.command(WINDOW_COVER_COMMAND_STOP)
+        await cover_cluster.command(WINDOW_COVER_COMMAND_STOP)
+        await cover_cluster.command(WINDOW_COVER_COMMAND_LIFTPERCENT, 60)
+        assert command_mock.call_count == 5
+
+        # once the target is reached the same target is sent again
+        device.cover_bus.listener_event(COVER_EVENT, ATTR_COVER_POSITION, 40)
+        await cover_cluster.command(WINDOW_COVER_COMMAND_LIFTPERCENT, 60)
+        assert command_mock.call_count == 6
+
+        await cover_cluster.command(WINDOW_COVER_COMMAND_UPOPEN)
+        await cover_cluster.command(WINDOW_COVER_COMMAND_UPOPEN)
+        assert command_mock.call_count == 7
+
+        # a stalled move no longer suppresses commands
+        loop = asyncio.get_running_loop()
+        with mock.patch.object(loop, "time", return_value=loop.time() + 10):
+            await cover_cluster.command(WINDOW_COVER_COMMAND_UPOPEN)
+        assert command_mock.call_count == 8
+
+        # a motor stopping short of the target does not swallow a retry
+        await cover_cluster.command(WINDOW_COVER_COMMAND_LIFTPERCENT, 50)
+        assert command_mock.call_count == 9
+        device.cover_bus.listener_event(COVER_EVENT, ATTR_COVER_POSITION, 60)
+        await cover_cluster.command(WINDOW_COVER_COMMAND_LIFTPERCENT, 50)
+        assert command_mock.call_count == 9
+        device.cover_bus.listener_event(COVER_EVENT, ATTR_COVER_POSITION, 51)
+        device.cover_bus.listener_event(COVER_EVENT, ATTR_COVER_POSITION, 51)
+        await cover_cluster.command(WINDOW_COVER_COMMAND_LIFTPERCENT, 50)
+        assert command_mock.call_count == 10
+
+
+async def test_cover_position_coalescing(zigpy_device_from_quirk):
+    """Test intermediate position reports are coalesced."""
+    device = zigpy_device_from_quirk(TuyaMoesCover0601)
+    cover_cluster = device.endpoints[1].window_covering
+    cover_cluster.position_report_interval = 0.05
+    cover_listener = ClusterListener(cover_cluster)
+
+    with mock.patch.object(
+        device.endpoints[1].tuya_manufacturer, "command", mock.AsyncMock()
+    ):
+        await cover_cluster.command(WINDOW_COVER_COMMAND_LIFTPERCENT, 80)
+
+    for position in (90, 80, 70, 60, 50):
+        device.cover_bus.listener_event(COVER_EVENT, ATTR_COVER_POSITION, position)
+    assert cover_listener.attribute_updates == [(ATTR_COVER_POSITION, 10)]
+
+    # the latest position is delivered after the interval
+    await asyncio.sleep(0.1)
+    assert cover_listener.attribute_updates[-1] == (ATTR_COVER_POSITION, 50)
+    assert len(cover_listener.attribute_updates) == 2
+
+    # the final position is delivered right away
+    device.cover_bus.listener_event(COVER_EVENT, ATTR_COVER_POSITION, 30)
+    device.cover_bus.listener_event(COVER_EVENT, ATTR_COVER_POSITION, 20)
+    assert cover_listener.attribute_updates[-1] == (ATTR_COVER_POSITION, 80)
+    assert len(cover_listener.attribute_updates) == 4
+    await asyncio.sleep(0.1)
+    assert len(cover_listener.attribute_updates) == 4
+
+    # coalescing is opt-in and its timer does not keep the cluster alive
+    assert type(cover_cluster).position_report_interval == 0
+    device.cover_bus.listener_event(COVER_EVENT, ATTR_COVER_POSITION, 40)
+    device.cover_bus.listener_event(COVER_EVENT, ATTR_COVER_POSITION, 35)
+    handle = cover_cluster._position_handle
+    assert handle is not None
+    cover_cluster._position_finalizer()
+    assert handle.cancelled()
+
+    # direction and inversion reports are never coalesced
+    device.cover_bus.listener_event(COVER_EVENT, ATTR_COVER_DIRECTION, 1)
+    assert cover_listener.attribute_updates[-1] == (ATTR_COVER_DIRECTION, 1)
+
+
+async def test_cover_repeated_position_reports(zigpy_device_from_quirk):
+    """Test repeated position reports are forwarded once and then dropped."""
+    device = zigpy_device_from_quirk(TuyaMoesCover0601)
+    manufacturer_cluster = device.endpoints[1].tuya_manufacturer
+    cover_cluster = device.endpoints[1].window_covering
+    cover_listener = ClusterListener(cover_cluster)
+    bus_listener = mock.MagicMock()
+    device.cover_bus.add_listener(bus_listener)
+
+    hdr = foundation.ZCLHeader.cluster(1, TUYA_GET_DATA)
+    for position in (30, 40, 40, 40, 40, 50):
+        manufacturer_cluster.handle_cluster_request(
+            hdr,
+            (
+                TuyaManufCluster.Command(
+                    status=0,
+                    tsn=1,
+                    command_id=TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_STATE,
+                    function=0,
+                    data=[4, 0, 0, 0, position],
+                ),
+            ),
+        )
+
+    assert [call.args[1] for call in bus_listener.cover_event.call_args_list] == [
+        30,
+        40,
+        40,
+        50,
+    ]
+    assert cover_listener.attribute_updates == [
+        (ATTR_COVER_POSITION, 70),
+        (ATTR_COVER_POSITION, 60),
+        (ATTR_COVER_POSITION, 50),
+    ]
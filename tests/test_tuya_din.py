@@ -3,6 +3,7 @@
 from unittest.mock import MagicMock
 
 import pytest
+from zigpy.zcl.clusters.homeautomation import ElectricalMeasurement
 
 from zhaquirks import Bus
 from zhaquirks.tuya.ts0601_din_power import (  # Updated import path
@@ -14,6 +15,8 @@ from zhaquirks.tuya.ts0601_din_power import (  # Updated import path
     TuyaPowerMeter,
     ZemismartManufCluster,
     ZemismartPowerMeasurement,
+    decode_hiking_voltage_current,
+    decode_vcp,
 )
 
 
@@ -108,12 +111,20 @@ async def test_hiking_voltage_current(hiking_cluster):
     value = (1000 << 16) | 2300  # 1A current, 230V voltage
     hiking_cluster._update_attribute(0x0006, value)
 
-    hiking_cluster.endpoint.electrical_measurement.current_reported.assert_called_with(
-        1000
+    hiking_cluster.endpoint.electrical_measurement.voltage_current_reported.assert_called_once_with(
+        230, 1000
     )
-    hiking_cluster.endpoint.electrical_measurement.voltage_reported.assert_called_with(
-        230
+
+
+def test_decode_packed_records():
+    """Test decoding of packed voltage, current and power records."""
+    assert decode_vcp(bytes([0x64, 0x00, 0x00, 0xE8, 0x03, 0x00, 0xE6, 0x00])) == (
+        230,
+        1000,
+        100,
     )
+    assert decode_vcp(bytes([0xFF] * 8)) == (0xFFFF, 0xFFFFFF, 0xFFFFFF)
+    assert decode_hiking_voltage_current((1000 << 16) | 2300) == (230, 1000)
 
 
 @pytest.fixture
@@ -161,6 +172,31 @@ async def test_zemismart_vcp_reporting(zemismart_power_measurement):
     assert clamp_bus_a.listener_event.call_count == 3
 
 
+async def test_zemismart_vcp_batched_update(zemismart_power_measurement):
+    """Test all fields of a phase record are applied as one batch."""
+    listener = MagicMock()
+    zemismart_power_measurement.add_listener(listener)
+
+    zemismart_power_measurement.vcp_reported(
+        bytes([0x64, 0x00, 0x00, 0xE8, 0x03, 0x00, 0xE6, 0x00]), 2
+    )
+
+    attrs = ElectricalMeasurement.AttributeDefs
+    expected = {
+        attrs.rms_voltage_ph_c.id: 230,
+        attrs.rms_current_ph_c.id: 1000,
+        attrs.active_power_ph_c.id: 100,
+    }
+    for attrid, value in expected.items():
+        assert zemismart_power_measurement.get(attrid) == value
+
+    assert listener.attribute_updated.call_count == 3
+    listener.attribute_updated_batch.assert_called_once_with(expected)
+    zemismart_power_measurement.endpoint.device.clamp_bus["power"][
+        "c"
+    ].listener_event.assert_any_call("power_reported", 100)
+
+
 async def test_zemismart_vcp_invalid_phase(zemismart_power_measurement):
     """Test invalid phase handling for Zemismart VCP reporting."""
     test_data = bytearray([0] * 8)
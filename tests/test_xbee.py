@@ -1,8 +1,12 @@
 """Test XBee device."""
 
+import asyncio
+import time
 from unittest import mock
 
 import pytest
+import zigpy.device
+import zigpy.exceptions
 import zigpy.types as t
 from zigpy.zcl import foundation
 from zigpy.zcl.clusters.general import AnalogOutput, Basic, LevelControl, OnOff
@@ -10,6 +14,7 @@ from zigpy.zcl.clusters.general import AnalogOutput, Basic, LevelControl, OnOff
 from tests.common import ClusterListener
 import zhaquirks
 from zhaquirks.xbee import (
+    AT_SLOW_PARAMETER_TTL,
     XBEE_AT_ENDPOINT,
     XBEE_AT_REQUEST_CLUSTER,
     XBEE_AT_RESPONSE_CLUSTER,
@@ -17,7 +22,9 @@ from zhaquirks.xbee import (
     XBEE_DATA_ENDPOINT,
     XBEE_IO_CLUSTER,
     XBEE_PROFILE_ID,
+    PendingATRequests,
 )
+from zhaquirks.xbee.types import IOSample
 from zhaquirks.xbee.xbee3_io import XBee3Sensor
 from zhaquirks.xbee.xbee_io import XBeeSensor
 
@@ -193,6 +200,121 @@ async def test_receive_serial_data(zigpy_device_from_quirk):
     )
 
 
+def _serial_packet(data):
+    return t.ZigbeePacket(
+        profile_id=XBEE_PROFILE_ID,
+        cluster_id=XBEE_DATA_CLUSTER,
+        src_ep=XBEE_DATA_ENDPOINT,
+        dst_ep=XBEE_DATA_ENDPOINT,
+        data=t.SerializableBytes(data),
+    )
+
+
+@pytest.mark.parametrize(
+    "framing, frames, records",
+    (
+        (
+            {"delimiter": b"\r\n"},
+            [b"temp=2", b"1.5\r\nhum", b"=40\r\n"],
+            [b"temp=21.5", b"hum=40"],
+        ),
+        (
+            {"length_prefix": 2},
+            [b"\x00\x03abc\x00", b"\x01\xff\x00\x02hi"],
+            [b"abc", b"\xff", b"hi"],
+        ),
+    ),
+)
+async def test_serial_stream_read(zigpy_device_from_quirk, framing, frames, records):
+    """Test serial data is reassembled into records."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    listener = mock.MagicMock()
+    xbee3_device.endpoints[XBEE_DATA_ENDPOINT].out_clusters[
+        LevelControl.cluster_id
+    ].add_listener(listener)
+
+    stream = xbee3_device.open_serial_stream(**framing)
+    for frame in frames:
+        xbee3_device.packet_received(_serial_packet(frame))
+
+    for record in records:
+        assert await stream.read_record() == record
+    listener.zha_send_event.assert_not_called()
+
+    # events are relayed again once the stream is closed
+    xbee3_device.close_serial_stream()
+    assert stream.reader.at_eof()
+    xbee3_device.packet_received(_serial_packet(b"Test UART data"))
+    listener.zha_send_event.assert_called_once_with(
+        "receive_data", {"data": "Test UART data"}
+    )
+
+
+async def test_serial_stream_write(zigpy_device_from_quirk):
+    """Test serial data is fragmented and sent in order within the send window."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    request = xbee3_device.application.request
+    request.reset_mock()
+
+    release = asyncio.Event()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_request(*args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await release.wait()
+        # later fragments would overtake this one if they were in flight too
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return foundation.Status.SUCCESS, None
+
+    request.configure_mock(side_effect=mock_request)
+
+    with mock.patch.object(
+        xbee3_device.application,
+        "remote_at_command",
+        create=True,
+        new_callable=mock.AsyncMock,
+        return_value=4,
+    ) as m1:
+        stream = xbee3_device.open_serial_stream(length_prefix=1, window=2)
+        await stream.write_record(b"0123456789")
+        await stream.write(b"abcde")
+        write = asyncio.create_task(stream.write(b"fgh"))
+        await asyncio.sleep(0.01)
+
+        # the third writer waits for the send window
+        assert not write.done()
+        assert max_in_flight == 1
+
+        release.set()
+        await write
+        await stream.drain()
+
+    request.configure_mock(side_effect=None)
+    m1.assert_awaited_once()
+    assert m1.await_args[0][1] == "NP"
+    assert max_in_flight == 1
+    assert [c[0][6] for c in request.await_args_list] == [
+        b"\n012",
+        b"3456",
+        b"789",
+        b"abcd",
+        b"e",
+        b"fgh",
+    ]
+
+    # delivery failures are raised to the writer
+    request.configure_mock(return_value=(foundation.Status.FAILURE, None))
+    await stream.write(b"abc")
+    with pytest.raises(zigpy.exceptions.DeliveryError):
+        await stream.drain()
+
+
 @pytest.mark.parametrize(
     "command_id, request_value, request_data, response_data, response_command, response_value",
     (
@@ -508,6 +630,258 @@ async def test_remote_at_tx_failure(zigpy_device_from_quirk):
     xbee3_device.application.request.configure_mock(side_effect=None)
 
 
+async def test_pending_at_requests_frame_ids():
+    """Test frame id allocation skips ids still in flight."""
+
+    pending = PendingATRequests()
+    frame_id, in_flight = await pending.reserve()
+    assert frame_id == 1
+
+    for expected in range(2, 256):
+        frame_id, fut = await pending.reserve()
+        assert frame_id == expected
+        fut.set_result(None)
+    await asyncio.sleep(0)
+    assert len(pending) == 1
+
+    # wrapped around, 1 is still awaiting a response
+    frame_id, _ = await pending.reserve()
+    assert frame_id == 2
+    assert pending.get(1) is in_flight
+
+    with pytest.raises(ValueError):
+        PendingATRequests(0)
+
+
+async def test_pending_at_requests_bounded():
+    """Test the number of requests in flight is bounded."""
+
+    pending = PendingATRequests(max_pending=1)
+    _, fut = await pending.reserve()
+
+    reserve = asyncio.create_task(pending.reserve())
+    await asyncio.sleep(0)
+    assert not reserve.done()
+
+    fut.cancel()
+    frame_id, _ = await reserve
+    assert frame_id == 2
+    assert 1 not in pending
+    assert len(pending) == 1
+
+
+async def test_remote_at_timeout_cleanup(zigpy_device_from_quirk):
+    """Test timed out remote AT commands are forgotten."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    at_request = xbee3_device.endpoints[XBEE_AT_ENDPOINT].out_clusters[
+        XBEE_AT_REQUEST_CLUSTER
+    ]
+    pending = (
+        xbee3_device.endpoints[XBEE_AT_ENDPOINT]
+        .in_clusters[XBEE_AT_RESPONSE_CLUSTER]
+        .pending_requests
+    )
+
+    with (
+        mock.patch("zhaquirks.xbee.REMOTE_AT_COMMAND_TIMEOUT", 0.01),
+        pytest.raises(TimeoutError),
+    ):
+        await at_request.remote_at_command("TP")
+
+    assert len(pending) == 0
+
+    # a late response is ignored
+    xbee3_device.packet_received(
+        t.ZigbeePacket(
+            profile_id=XBEE_PROFILE_ID,
+            cluster_id=XBEE_AT_RESPONSE_CLUSTER,
+            src_ep=XBEE_AT_ENDPOINT,
+            dst_ep=XBEE_AT_ENDPOINT,
+            data=t.SerializableBytes(b"\x01TP\x00\x00\x18"),
+        )
+    )
+
+
+async def test_remote_at_concurrent_devices(zigpy_device_from_quirk):
+    """Test concurrent remote AT commands to different XBees do not collide."""
+
+    devices = [zigpy_device_from_quirk(XBee3Sensor) for _ in range(2)]
+    commands = [
+        asyncio.create_task(
+            device.endpoints[XBEE_AT_ENDPOINT]
+            .out_clusters[XBEE_AT_REQUEST_CLUSTER]
+            .remote_at_command("TP")
+        )
+        for device in devices
+    ]
+    await asyncio.sleep(0)
+
+    # both requests use frame id 1, answer them in reverse order
+    for device, value in ((devices[1], b"\x00\x02"), (devices[0], b"\x00\x01")):
+        device.packet_received(
+            t.ZigbeePacket(
+                profile_id=XBEE_PROFILE_ID,
+                cluster_id=XBEE_AT_RESPONSE_CLUSTER,
+                src_ep=XBEE_AT_ENDPOINT,
+                dst_ep=XBEE_AT_ENDPOINT,
+                data=t.SerializableBytes(b"\x01TP\x00" + value),
+            )
+        )
+
+    assert await asyncio.gather(*commands) == [1, 2]
+
+
+def _at_response_packet(data):
+    return t.ZigbeePacket(
+        profile_id=XBEE_PROFILE_ID,
+        cluster_id=XBEE_AT_RESPONSE_CLUSTER,
+        src_ep=XBEE_AT_ENDPOINT,
+        dst_ep=XBEE_AT_ENDPOINT,
+        data=t.SerializableBytes(data),
+    )
+
+
+async def test_remote_at_batch(zigpy_device_from_quirk):
+    """Test pipelined remote AT commands with a single apply changes."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    pending = (
+        xbee3_device.endpoints[XBEE_AT_ENDPOINT]
+        .in_clusters[XBEE_AT_RESPONSE_CLUSTER]
+        .pending_requests
+    )
+    sent = []
+    in_flight = []
+
+    def mock_at_response(device, profile, cluster, src_ep, dst_ep, seq, data, **kw):
+        """Answer the remote AT command once the request has been sent."""
+        options, frame_id, command = data[2], data[3], data[14:16]
+        sent.append((options, command))
+        in_flight.append(len(pending))
+        status = 3 if command == b"D2" else 0
+        asyncio.get_running_loop().call_soon(
+            xbee3_device.packet_received,
+            _at_response_packet(bytes([frame_id]) + command + bytes([status])),
+        )
+        return mock.DEFAULT
+
+    xbee3_device.application.request.configure_mock(side_effect=mock_at_response)
+    results = await xbee3_device.remote_at_batch(
+        [("D0", 3), ("D1", 3), ("D2", 9), ("D3", 3), "SH"], window=2, write=True
+    )
+    xbee3_device.application.request.configure_mock(side_effect=None)
+
+    assert results[:2] == [None, None]
+    assert isinstance(results[2], RuntimeError)
+    # the results of AC and WR follow those of the commands
+    assert results[3:] == [None, None, None, None]
+    assert max(in_flight) == 2
+    assert sent == [
+        (0, b"D0"),
+        (0, b"D1"),
+        (0, b"D2"),
+        (0, b"D3"),
+        (0, b"SH"),
+        (0, b"AC"),
+        (0, b"WR"),
+    ]
+
+
+async def test_remote_at_batch_apply_failure(zigpy_device_from_quirk):
+    """Test a failing AC is returned with the results instead of raised."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    error = TimeoutError()
+
+    async def remote_at_command(command, *args, **kwargs):
+        if command == "AC":
+            raise error
+        return 3 if command == "D1" else None
+
+    at_request = xbee3_device.endpoints[XBEE_AT_ENDPOINT].out_clusters[
+        XBEE_AT_REQUEST_CLUSTER
+    ]
+    with mock.patch.object(
+        at_request, "remote_at_command", side_effect=remote_at_command
+    ) as remote_at_mock:
+        results = await xbee3_device.remote_at_batch([("D0", 3), "D1"], write=True)
+
+    assert results == [None, 3, error]
+    assert [call.args[0] for call in remote_at_mock.call_args_list] == [
+        "D0",
+        "D1",
+        "AC",
+    ]
+
+
+async def test_remote_at_parameter_cache(zigpy_device_from_quirk):
+    """Test static and slow changing AT parameters are read from the cache."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    at_request = xbee3_device.endpoints[XBEE_AT_ENDPOINT].out_clusters[
+        XBEE_AT_REQUEST_CLUSTER
+    ]
+
+    with mock.patch.object(
+        xbee3_device.application,
+        "remote_at_command",
+        create=True,
+        new_callable=mock.AsyncMock,
+    ) as m1:
+        m1.configure_mock(return_value=0x0013A200)
+
+        # static parameters are read once
+        assert await xbee3_device.remote_at("SH") == 0x0013A200
+        assert await xbee3_device.remote_at("SH") == 0x0013A200
+        assert m1.await_count == 1
+        m1.reset_mock()
+
+        # volatile parameters always hit the radio
+        await xbee3_device.remote_at("TP")
+        await xbee3_device.remote_at("TP")
+        assert m1.await_count == 2
+        m1.reset_mock()
+
+        # slow changing parameters expire and writes invalidate them
+        m1.configure_mock(return_value=3)
+        await xbee3_device.remote_at("D0")
+        await xbee3_device.remote_at("D0")
+        assert m1.await_count == 1
+        await xbee3_device.remote_at("D0", 4)
+        await xbee3_device.remote_at("D0")
+        assert m1.await_count == 3
+        with mock.patch(
+            "zhaquirks.xbee.time.monotonic",
+            return_value=time.monotonic() + AT_SLOW_PARAMETER_TTL,
+        ):
+            await xbee3_device.remote_at("D0")
+        assert m1.await_count == 4
+        m1.reset_mock()
+
+        # reset commands clear the whole cache
+        assert "SH" in at_request.parameter_cache
+        await xbee3_device.remote_at("FR")
+        assert "SH" not in at_request.parameter_cache
+        m1.reset_mock()
+
+        # execution commands taking a parameter are sent every time
+        for command in ("NR", "CB", "DN"):
+            await xbee3_device.remote_at(command)
+            await xbee3_device.remote_at(command)
+            assert command not in at_request.parameter_cache
+        assert m1.await_count == 6
+        m1.reset_mock()
+
+        # explicit refresh
+        m1.configure_mock(return_value=0x0013A200)
+        await xbee3_device.remote_at("SH")
+        m1.configure_mock(return_value=0x0013A201)
+        assert await xbee3_device.refresh_at_parameters("SH") == {"SH": 0x0013A201}
+        assert await xbee3_device.remote_at("SH") == 0x0013A201
+        assert m1.await_count == 2
+
+
 async def test_io_sample_report(zigpy_device_from_quirk):
     """Test DigitalIOCluster cluster."""
 
@@ -554,6 +928,131 @@ async def test_io_sample_report(zigpy_device_from_quirk):
     assert analog_listeners[4].attribute_updates[0] == (0x0055, 3.305)
 
 
+def _io_sample_packet(data):
+    return t.ZigbeePacket(
+        profile_id=XBEE_PROFILE_ID,
+        cluster_id=XBEE_IO_CLUSTER,
+        src_ep=XBEE_DATA_ENDPOINT,
+        dst_ep=XBEE_DATA_ENDPOINT,
+        data=t.SerializableBytes(data),
+    )
+
+
+async def test_io_sample_report_changes_only(zigpy_device_from_quirk):
+    """Test only changed pins are updated on repeated IO samples."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    io_cluster = xbee3_device.endpoints[XBEE_DATA_ENDPOINT].in_clusters[XBEE_IO_CLUSTER]
+    io_cluster.analog_deadband = 2
+
+    d0_listener = ClusterListener(xbee3_device.endpoints[0xD0].on_off)
+    d2_listener = ClusterListener(xbee3_device.endpoints[0xD2].on_off)
+    a0_listener = ClusterListener(xbee3_device.endpoints[0xD0].analog_input)
+
+    # D0 and D2 high, AD0 at 341
+    xbee3_device.packet_received(_io_sample_packet(b"\x01\x00\x05\x01\x00\x05\x01\x55"))
+    # nothing changed, AD0 within the deadband
+    xbee3_device.packet_received(_io_sample_packet(b"\x01\x00\x05\x01\x00\x05\x01\x57"))
+    # D2 low, AD0 outside of the deadband
+    xbee3_device.packet_received(_io_sample_packet(b"\x01\x00\x05\x01\x00\x01\x01\x58"))
+
+    assert d0_listener.attribute_updates == [(0x0000, 1)]
+    assert d2_listener.attribute_updates == [(0x0000, 1), (0x0000, 0)]
+    assert [value * 10.23 for _, value in a0_listener.attribute_updates] == [
+        pytest.approx(341),
+        pytest.approx(344),
+    ]
+
+
+async def test_io_sample_report_after_local_command(zigpy_device_from_quirk):
+    """Test a sample restores a pin that was changed by an on/off command."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    on_off = xbee3_device.endpoints[0xD0].on_off
+    d0_listener = ClusterListener(on_off)
+
+    # D0 high
+    xbee3_device.packet_received(_io_sample_packet(b"\x01\x00\x01\x00\x00\x01"))
+
+    with mock.patch.object(
+        xbee3_device.application,
+        "remote_at_command",
+        create=True,
+        new_callable=mock.AsyncMock,
+    ):
+        await on_off.command(0)
+
+    # the pin didn't actually change, so the next sample sets it again
+    xbee3_device.packet_received(_io_sample_packet(b"\x01\x00\x03\x00\x00\x01"))
+
+    assert d0_listener.attribute_updates == [(0x0000, 1), (0x0000, 0), (0x0000, 1)]
+
+
+def test_io_sample_truncated():
+    """Test truncated IO samples are rejected."""
+
+    assert IOSample.deserialize(b"\x01\x00\x00\x00")[0] == {
+        "digital_samples": [None] * 15,
+        "analog_samples": [None] * 8,
+    }
+    for data in (b"\x01\x00\x05", b"\x01\x00\x05\x00\x00", b"\x01\x00\x00\x03\x01\x55"):
+        with pytest.raises(ValueError):
+            IOSample.deserialize(data)
+
+
+async def test_io_sample_throughput(zigpy_device_from_quirk):
+    """Benchmark direct decoding of recorded IO samples against the ZCL path."""
+
+    # D0 high, D2 toggling, AD0..AD3 sampled
+    frames = [
+        b"\x01\x00\x05\x0f\x00"
+        + bytes([1 | (n & 1) << 2])
+        + (n % 1024).to_bytes(2, "big")
+        + b"\x01\x55\x02\xaa\x03\xff"
+        for n in range(200)
+    ]
+    # the generic path needs a ZCL header in front of the raw frame
+    zcl_header = foundation.ZCLHeader.cluster(0, 0x0000).serialize()
+
+    def run(packet_received, header):
+        xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+        listener = ClusterListener(xbee3_device.endpoints[0xD0].analog_input)
+        packets = [_io_sample_packet(header + frame) for frame in frames]
+        start = time.perf_counter()
+        for packet in packets:
+            packet_received(xbee3_device, packet)
+        return time.perf_counter() - start, listener.attribute_updates
+
+    direct, zcl = [], []
+    for _ in range(5):
+        elapsed, direct_updates = run(XBee3Sensor.packet_received, b"")
+        direct.append(elapsed)
+        with mock.patch(
+            "zigpy.zcl.Cluster.deserialize", autospec=True, return_value=None
+        ) as zcl_deserialize:
+            run(XBee3Sensor.packet_received, b"")
+        assert zcl_deserialize.call_count == 0
+        elapsed, zcl_updates = run(zigpy.device.Device.packet_received, zcl_header)
+        zcl.append(elapsed)
+
+    assert len(direct_updates) == len(frames)
+    assert direct_updates == zcl_updates
+    assert min(direct) < min(zcl)
+
+
+async def test_io_sample_duplicate(zigpy_device_from_quirk):
+    """Test identical IO samples are filtered like any other duplicate packet."""
+
+    frame = b"\x01\x00\x05\x01\x00\x05\x01\x55"
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    listener = ClusterListener(xbee3_device.endpoints[0xD0].analog_input)
+
+    xbee3_device.packet_received(_io_sample_packet(frame))
+    xbee3_device.packet_received(_io_sample_packet(frame))
+
+    assert len(listener.attribute_updates) == 1
+
+
 async def test_io_sample_report_on_at_response(zigpy_device_from_quirk):
     """Test update samples on non-native IS command response."""
 
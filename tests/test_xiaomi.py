@@ -3,10 +3,12 @@
 import asyncio
 import logging
 import math
+import time
 from unittest import mock
 
 import pytest
 import zigpy.device
+import zigpy.quirks
 import zigpy.types as t
 from zigpy.zcl import foundation
 from zigpy.zcl.clusters.closures import WindowCovering
@@ -58,14 +60,25 @@ from zhaquirks.xiaomi import (
     XiaomiQuickInitDevice,
     handle_quick_init,
 )
+import zhaquirks.xiaomi.aqara.cube
+import zhaquirks.xiaomi.aqara.cube_aqgl01
 import zhaquirks.xiaomi.aqara.driver_curtain_e1
 from zhaquirks.xiaomi.aqara.feeder_acn001 import (
+    CHILD_LOCK,
     FEEDER_ATTR,
+    FEEDER_DIRECTION_REPORT,
+    FEEDER_DIRECTION_WRITE,
+    FEEDING_REPORT,
+    PORTIONS_DISPENSED,
+    SCHEDULING_STRING,
+    SERVING_SIZE,
+    WEIGHT_DISPENSED,
     ZCL_CHILD_LOCK,
     ZCL_DISABLE_LED_INDICATOR,
     ZCL_ERROR_DETECTED,
     ZCL_FEEDING,
     ZCL_FEEDING_MODE,
+    ZCL_FEEDING_SCHEDULE,
     ZCL_LAST_FEEDING_SIZE,
     ZCL_LAST_FEEDING_SOURCE,
     ZCL_PORTION_WEIGHT,
@@ -73,20 +86,31 @@ from zhaquirks.xiaomi.aqara.feeder_acn001 import (
     ZCL_SERVING_SIZE,
     ZCL_WEIGHT_DISPENSED,
     AqaraFeederAcn001,
+    FeedingDays,
+    FeedingScheduleEntry,
     OppleCluster,
+    decode_feeder_attribute,
+    decode_feeding_schedule,
+    encode_feeder_attribute,
+    encode_feeding_schedule,
 )
 import zhaquirks.xiaomi.aqara.magnet_agl02
 import zhaquirks.xiaomi.aqara.motion_ac02
 import zhaquirks.xiaomi.aqara.motion_agl02
 import zhaquirks.xiaomi.aqara.motion_aq2
 import zhaquirks.xiaomi.aqara.motion_aq2b
+import zhaquirks.xiaomi.aqara.opple_remote
 import zhaquirks.xiaomi.aqara.plug
 import zhaquirks.xiaomi.aqara.plug_eu
 import zhaquirks.xiaomi.aqara.roller_curtain_e1
 import zhaquirks.xiaomi.aqara.sensor_ht_agl02
 import zhaquirks.xiaomi.aqara.smoke
 import zhaquirks.xiaomi.aqara.switch_t1
-from zhaquirks.xiaomi.aqara.thermostat_agl001 import ScheduleEvent, ScheduleSettings
+from zhaquirks.xiaomi.aqara.thermostat_agl001 import (
+    ScheduleEvent,
+    ScheduleSettings,
+    parse_schedule,
+)
 import zhaquirks.xiaomi.aqara.weather
 import zhaquirks.xiaomi.mija.motion
 
@@ -175,7 +199,36 @@ async def test_xiaomi_motion(zigpy_device_from_quirk, quirk):
 
 
 @pytest.fixture
-def raw_device():
+def quick_init_registry():
+    """Undo the QuickInit quirks registered by a test."""
+
+    registry = zigpy.quirks._DEVICE_REGISTRY.registry_v1
+    registered = {
+        (manufacturer, model): list(quirks)
+        for manufacturer, models in registry.items()
+        for model, quirks in models.items()
+    }
+    quick_init_quirks = {
+        model: list(quirks)
+        for model, quirks in zhaquirks.xiaomi._QUICK_INIT_QUIRKS.items()
+    }
+
+    with mock.patch.dict(zhaquirks.xiaomi._QUICK_INIT_NEGATIVE_CACHE, clear=True):
+        yield
+
+    for manufacturer, models in registry.items():
+        for model, quirks in models.items():
+            for quirk in set(quirks).difference(
+                registered.get((manufacturer, model), ())
+            ):
+                quirks.remove(quirk)
+
+    zhaquirks.xiaomi._QUICK_INIT_QUIRKS.clear()
+    zhaquirks.xiaomi._QUICK_INIT_QUIRKS.update(quick_init_quirks)
+
+
+@pytest.fixture
+def raw_device(quick_init_registry):
     """Raw device fixture."""
 
     ieee = t.EUI64.convert("11:22:33:44:55:66:77:88")
@@ -314,6 +367,88 @@ def test_xiaomi_quick_init(raw_device):
     assert raw_device.application.device_initialized.call_count == 1
 
 
+def test_xiaomi_quick_init_negative_cache(raw_device):
+    """Test that reports from a device without a quirk are skipped for a while."""
+    message = b"\x18\x00\n\x05\x00B\x13lumi.sensor_n0quirk\x01\x00 \x01"
+
+    assert handle_quick_init(raw_device, 0x0260, 0, 1, 1, message) is None
+
+    with mock.patch("zigpy.zcl.foundation.ZCLHeader.deserialize") as hdr_deserialize:
+        assert handle_quick_init(raw_device, 0x0260, 0, 1, 1, message) is None
+        assert hdr_deserialize.call_count == 0
+
+    # The device is looked at again once the entry expires
+    with mock.patch(
+        "time.monotonic",
+        return_value=time.monotonic() + zhaquirks.xiaomi.QUICK_INIT_NEGATIVE_CACHE_TTL,
+    ):
+        assert handle_quick_init(raw_device, 0x0260, 0, 1, 1, message) is None
+        assert raw_device.ieee in zhaquirks.xiaomi._QUICK_INIT_NEGATIVE_CACHE
+
+    # Registering a new QuickInit quirk clears the cache
+    class XiaomiQuirk(XiaomiQuickInitDevice):
+        signature = {
+            NODE_DESCRIPTOR: XIAOMI_NODE_DESC,
+            ENDPOINTS: {},
+            MANUFACTURER: LUMI,
+            MODEL: "lumi.sensor_n0quirk",
+        }
+
+    assert not zhaquirks.xiaomi._QUICK_INIT_NEGATIVE_CACHE
+    assert (
+        zhaquirks.xiaomi.get_quick_init_quirks("lumi.sensor_n0quirk")[0] is XiaomiQuirk
+    )
+    assert handle_quick_init(raw_device, 0x0260, 0, 1, 1, message) is True
+
+
+def test_xiaomi_quick_init_after_report_without_model(raw_device):
+    """Test that a report without a model doesn't block the next one."""
+
+    class XiaomiQuirk(XiaomiQuickInitDevice):
+        signature = {
+            NODE_DESCRIPTOR: XIAOMI_NODE_DESC,
+            ENDPOINTS: {},
+            MANUFACTURER: LUMI,
+            MODEL: "lumi.sensor_m0del",
+        }
+
+    assert (
+        handle_quick_init(raw_device, 0x0260, 0, 1, 1, b"\x18\x00\n\x01\x00 \x01")
+        is None
+    )
+    assert not zhaquirks.xiaomi._QUICK_INIT_NEGATIVE_CACHE
+    assert (
+        handle_quick_init(
+            raw_device,
+            0x0260,
+            0,
+            1,
+            1,
+            b"\x18\x00\n\x05\x00B\x11lumi.sensor_m0del\x01\x00 \x01",
+        )
+        is True
+    )
+
+
+@pytest.mark.parametrize(
+    "cluster, message",
+    (
+        (1, b"\x18\x00\n\x05\x00B\x11lumi.sensor_sm0ke\x01\x00 \x01"),
+        (0, b"\x19\x00\n\x05\x00B\x11lumi.sensor_sm0ke\x01\x00 \x01"),
+        (0, b"\x18\x00\x01\x05\x00"),
+        (0, b"\x1c\x5f\x11\x00\x01\x05\x00"),
+        (0, b"\x18\x00"),
+        (0, b""),
+    ),
+)
+def test_xiaomi_quick_init_precheck(raw_device, cluster, message):
+    """Test that frames other than Basic attribute reports are not parsed."""
+
+    with mock.patch("zigpy.zcl.foundation.ZCLHeader.deserialize") as hdr_deserialize:
+        assert handle_quick_init(raw_device, 0x0260, cluster, 1, 1, message) is None
+        assert hdr_deserialize.call_count == 0
+
+
 @pytest.mark.parametrize(
     "voltage, bpr",
     (
@@ -503,6 +638,166 @@ def test_attribute_parsing(raw_report):
     assert len(raw_report) == 2 * len(reports[0])
 
 
+def _long_xiaomi_report(count: int) -> bytes:
+    """Build a report with many Xiaomi string attributes."""
+    return b"".join(
+        t.uint16_t(0xFF01).serialize()
+        + b"\x42\x04"
+        + bytes([0x64, 0x29, index & 0xFF, 0x00])
+        for index in range(count)
+    )
+
+
+@pytest.mark.parametrize("count", (8, 24, 48))
+def test_attribute_parsing_long_report(count):
+    """Test that parsing long reports explores every position at most once."""
+    hdr = foundation.ZCLHeader.general(
+        manufacturer=4447,
+        tsn=127,
+        command_id=foundation.GeneralCommand.Report_Attributes,
+    )
+    cluster = BasicCluster(mock.MagicMock())
+    raw_report = _long_xiaomi_report(count)
+
+    with mock.patch.object(
+        BasicCluster,
+        "_iter_parse_attr_report",
+        autospec=True,
+        side_effect=BasicCluster._iter_parse_attr_report,
+    ) as parse_mock:
+        _, report = cluster.deserialize(hdr.serialize() + raw_report)
+
+    assert parse_mock.call_count <= len(raw_report)
+    assert [attr.attrid for attr in report.attribute_reports] == [0xFF01] * count
+    assert [attr.value.value for attr in report.attribute_reports] == [
+        bytes([0x64, 0x29, index & 0xFF, 0x00]) for index in range(count)
+    ]
+
+    # A truncated final string makes every interpretation invalid, which used to
+    # require enumerating all 3**count combinations before giving up
+    with mock.patch.object(
+        BasicCluster,
+        "_iter_parse_attr_report",
+        autospec=True,
+        side_effect=BasicCluster._iter_parse_attr_report,
+    ) as parse_mock:
+        assert cluster._parse_attr_reports(raw_report + b"\x01\xff\x42\x10") is None
+
+    assert parse_mock.call_count <= len(raw_report) + 1
+
+
+def test_attribute_parsing_branch_limit():
+    """Test that the repair parser gives up after too many branches."""
+    cluster = BasicCluster(mock.MagicMock())
+    raw_report = _long_xiaomi_report(zhaquirks.xiaomi.MAX_ATTR_REPORT_BRANCHES + 1)
+
+    assert cluster._parse_attr_reports(raw_report) is None
+    assert cluster._parse_attr_reports(_long_xiaomi_report(4))[0]
+
+
+def test_attribute_parsing_copies_records_only():
+    """Test that regular attributes are parsed without copying the rest of a report."""
+    cluster = BasicCluster(mock.MagicMock())
+    records = [
+        b"\x00\x00\x29\x10\x00",  # int16s
+        b"\x04\x00\x42\x04lumi",  # character string
+        b"\x06\x00\x44\x02\x00ok",  # long character string
+        b"\x07\x00\x4c\x01\x00\x20\x01",  # structure, size unknown
+    ]
+    raw_report = b"".join(records) + _long_xiaomi_report(1)
+
+    with mock.patch.object(
+        foundation.Attribute,
+        "deserialize",
+        side_effect=foundation.Attribute.deserialize,
+    ) as deserialize_mock:
+        attrs, count = cluster._parse_attr_reports(raw_report)
+
+    assert count == 1
+    assert [attr.attrid for attr in attrs] == [0x0000, 0x0004, 0x0006, 0x0007, 0xFF01]
+    assert attrs[1].value.value == "lumi"
+    assert attrs[2].value.value == "ok"
+    # Only the structure, whose size isn't known up front, gets the rest of the report
+    assert [call.args[0] for call in deserialize_mock.call_args_list] == [
+        *records[:3],
+        records[3] + _long_xiaomi_report(1),
+    ]
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        b"\x18\x01\x0a\x00\x00\x29\x10\x00",  # report without Xiaomi strings
+        b"\x1c\x5f\x11\x01\x0a\x05\x00\x42\x04lumi",  # manufacturer specific
+        b"\x18\x01\x01\x00\x00\x00\x29\x10\x00",  # read attributes response
+        b"\x19\x01\x00",  # cluster command
+    ),
+)
+def test_deserialize_fast_path(data):
+    """Test that frames without Xiaomi strings are passed through untouched."""
+    cluster = BasicCluster(mock.MagicMock())
+
+    with (
+        mock.patch("zigpy.zcl.Cluster.deserialize") as deserialize_mock,
+        mock.patch.object(cluster, "_parse_attr_reports") as parse_mock,
+    ):
+        assert cluster.deserialize(data) is deserialize_mock.return_value
+
+    assert deserialize_mock.call_args[0][0] is data
+    assert parse_mock.call_count == 0
+
+
+def test_deserialize_repair_path():
+    """Test that reports with Xiaomi strings are repaired without re-encoding."""
+    cluster = BasicCluster(mock.MagicMock())
+    data = b"\x1c\x5f\x11\x01\x0a\x01\xff\x42\x05\x64\x29\x10\x00"
+
+    with (
+        mock.patch("zigpy.zcl.Cluster.deserialize") as deserialize_mock,
+        mock.patch("zigpy.zcl.foundation.ZCLHeader.serialize") as hdr_serialize_mock,
+    ):
+        hdr, report = cluster.deserialize(data)
+
+    assert deserialize_mock.call_count == 0
+    assert hdr_serialize_mock.call_count == 0
+    assert hdr.tsn == 0x01
+    assert hdr.manufacturer == 0x115F
+    assert report.attribute_reports[0].attrid == XIAOMI_AQARA_ATTRIBUTE
+    assert report.attribute_reports[0].value.type == 0x41
+    assert report.attribute_reports[0].value.value == b"\x64\x29\x10\x00"
+
+
+@pytest.mark.parametrize(
+    "model, key, name",
+    (
+        ("lumi.weather", 102, "pressure_measurement_precision"),
+        ("lumi.airmonitor.acn01", 102, "tvoc_measurement"),
+        ("lumi.sensor_ht.agl02", 102, "pressure_measurement"),
+        ("lumi.plug.maeu01", 152, "power"),
+        ("lumi.motion.ac01", 5, "power_outage_count"),
+        ("lumi.unknown", 5, "X-attrib-5"),
+        ("lumi.unknown", 102, None),
+    ),
+)
+def test_aqara_attribute_names(model, key, name):
+    """Test that the per-model heartbeat value names are resolved once."""
+    endpoint = mock.MagicMock()
+    endpoint.device.model = model
+    cluster = BasicCluster(endpoint)
+
+    names = cluster._aqara_attribute_names()
+    assert names.get(key) == name
+    assert names[1] == "battery_voltage_mV"
+    assert cluster._aqara_attribute_names() is names
+
+    with pytest.raises(TypeError):
+        names[key] = "changed"
+
+    # Quick init devices can learn their model later on
+    endpoint.device.model = "lumi.weather"
+    assert cluster._aqara_attribute_names()[102] == "pressure_measurement_precision"
+
+
 @mock.patch("zigpy.zcl.Cluster.bind", mock.AsyncMock())
 @pytest.mark.parametrize("quirk", (zhaquirks.xiaomi.aqara.plug_eu.PlugMAEU01,))
 async def test_xiaomi_eu_plug_binding(zigpy_device_from_quirk, quirk):
@@ -752,8 +1047,13 @@ async def test_aqara_feeder_write_attrs(
         ),
         (
             b"\x1c_\x11}\n\xf1\xffA(\x00\x05\x15\x08\x00\x08\xc8 7F09000100,7F0D000100,7F13000100",
-            1,
+            2,
             [
+                mock.call(
+                    ZCL_FEEDING_SCHEDULE,
+                    "7F09000100,7F0D000100,7F13000100",
+                    mock.ANY,
+                ),
                 mock.call(
                     FEEDER_ATTR,
                     b"\x00\x05\x15\x08\x00\x08\xc8 7F09000100,7F0D000100,7F13000100",
@@ -791,6 +1091,80 @@ async def test_aqara_feeder_attr_reports(
         assert call in cluster_listener.attribute_updated.mock_calls
 
 
+@pytest.mark.parametrize(
+    "attribute_id, value, length",
+    [
+        (CHILD_LOCK, 1, 1),
+        (PORTIONS_DISPENSED, 33, 2),
+        (WEIGHT_DISPENSED, 264, 4),
+        (SERVING_SIZE, 3, 4),
+        (FEEDING_REPORT, "0203", None),
+        (SCHEDULING_STRING, "7F09000100,7F0D000100", None),
+        (0x01020304, b"\x01\x02\x03", None),
+    ],
+)
+def test_aqara_feeder_codec_round_trip(attribute_id, value, length):
+    """Test Aqara C1 pet feeder TLV encoding and decoding."""
+
+    data = encode_feeder_attribute(0x15, attribute_id, value, length)
+    assert decode_feeder_attribute(data) == (
+        FEEDER_DIRECTION_WRITE,
+        0x15,
+        attribute_id,
+        value,
+    )
+
+    with pytest.raises(ValueError):
+        decode_feeder_attribute(data[:7])
+
+
+def test_aqara_feeder_schedule_codec():
+    """Test Aqara C1 pet feeder schedule encoding and decoding."""
+
+    schedule = (
+        FeedingScheduleEntry(FeedingDays.Everyday, 9, 0, 1),
+        FeedingScheduleEntry(FeedingDays.Weekend, 13, 30, 2),
+    )
+    encoded = encode_feeding_schedule(schedule)
+    assert encoded == "7F09000100,600D1E0200"
+    assert decode_feeding_schedule(encoded) == schedule
+    assert decode_feeding_schedule("") == ()
+
+
+async def test_aqara_feeder_write_schedule(zigpy_device_from_quirk):
+    """Test Aqara C1 pet feeder schedule is written and read back in one go."""
+
+    device = zigpy_device_from_quirk(AqaraFeederAcn001)
+    opple_cluster = device.endpoints[1].opple_cluster
+    opple_cluster._write_attributes = mock.AsyncMock()
+
+    schedule = (
+        FeedingScheduleEntry(FeedingDays.Workdays, 7, 15, 2),
+        FeedingScheduleEntry(FeedingDays.Everyday, 19, 0, 3),
+    )
+    await opple_cluster.write_feeding_schedule(schedule, manufacturer=0x115F)
+
+    assert opple_cluster._write_attributes.await_count == 1
+    ((attr,),), _ = opple_cluster._write_attributes.await_args
+    assert attr.attrid == FEEDER_ATTR
+    assert attr.value.value == (
+        b"\x00\x02\x01\x08\x00\x08\xc8\x15" + b"1F070F0200,7F13000300"
+    )
+
+    # the device reports the schedule back in the same TLV format
+    opple_cluster._update_attribute(
+        FEEDER_ATTR,
+        encode_feeder_attribute(
+            0x20,
+            SCHEDULING_STRING,
+            "1F070F0200,7F13000300",
+            direction=FEEDER_DIRECTION_REPORT,
+        ),
+    )
+    assert opple_cluster.get("feeding_schedule") == "1F070F0200,7F13000300"
+    assert opple_cluster.feeding_schedule == schedule
+
+
 @pytest.mark.parametrize("quirk", (zhaquirks.xiaomi.aqara.smoke.LumiSensorSmokeAcn03,))
 async def test_aqara_smoke_sensor_attribute_update(zigpy_device_from_quirk, quirk):
     """Test update_attribute on Aqara smoke sensor."""
@@ -1145,6 +1519,27 @@ async def test_xiaomi_e1_thermostat_schedule_settings_deserialization(
     assert str(s) == expected_string
 
 
+def test_xiaomi_e1_thermostat_schedule_cache():
+    """Test that a schedule string is parsed once and reused."""
+
+    schedule_settings = "mon,sun|6:00,20.5|9:00,17.0|17:00,21.0|23:30,16.0"
+    parse_schedule.cache_clear()
+
+    schedule = parse_schedule(schedule_settings)
+    assert schedule.days == ["mon", "sun"]
+    assert schedule.times == (360, 540, 1020, 1410)
+    assert schedule.temperatures == (20.5, 17.0, 21.0, 16.0)
+
+    for _ in range(3):
+        assert ScheduleSettings(schedule_settings) == schedule.encoded
+    assert parse_schedule.cache_info().hits == 3
+    assert parse_schedule.cache_info().misses == 1
+
+    # the device representation decodes to the same schedule
+    assert ScheduleSettings(schedule.encoded).schedule == schedule
+    assert str(ScheduleSettings(schedule.encoded)) == schedule_settings
+
+
 @pytest.mark.parametrize(
     "quirk, invalid_iilluminance_report",
     (
@@ -1408,6 +1803,26 @@ async def test_xiaomi_power_cluster_not_used(zigpy_device_from_quirk, caplog, qu
     )
 
 
+@pytest.mark.parametrize("quirk", (zhaquirks.xiaomi.aqara.weather.Weather,))
+async def test_xiaomi_heartbeat_targets(zigpy_device_from_quirk, quirk):
+    """Test that the heartbeat fan-out table only targets existing clusters."""
+    device = zigpy_device_from_quirk(quirk)
+    basic_cluster = device.endpoints[1].basic
+    temperature_listener = ClusterListener(device.endpoints[1].temperature)
+
+    targets = basic_cluster._heartbeat_targets()
+    assert basic_cluster._heartbeat_targets() is targets
+    assert zhaquirks.xiaomi.TEMPERATURE_MEASUREMENT in targets
+    assert zhaquirks.xiaomi.PRESSURE_MEASUREMENT_PRECISION in targets
+    assert zhaquirks.xiaomi.POWER not in targets
+    assert zhaquirks.xiaomi.SMOKE not in targets
+
+    basic_cluster.update_attribute(
+        XIAOMI_AQARA_ATTRIBUTE, create_aqara_attr_report({100: 2150, 101: 4500})
+    )
+    assert temperature_listener.attribute_updates == [(0x0000, 2150)]
+
+
 @pytest.mark.parametrize(
     "quirk", (zhaquirks.xiaomi.aqara.roller_curtain_e1.RollerE1AQ,)
 )
@@ -1847,3 +2262,77 @@ def test_h1_wireless_remotes(zigpy_device_from_v2_quirk):
 
     assert MultistateInput.cluster_id in quirk.endpoints[2].in_clusters
     assert MultistateInput.cluster_id in quirk.endpoints[3].in_clusters
+
+
+@pytest.mark.parametrize(
+    "quirk, variant, count",
+    (
+        (zhaquirks.xiaomi.aqara.opple_remote.RemoteB286OPCN01, "V4", 16),
+        (zhaquirks.xiaomi.aqara.opple_remote.RemoteB486OPCN01, "V3", 26),
+        (zhaquirks.xiaomi.aqara.opple_remote.RemoteB686OPCN01, "V5", 40),
+    ),
+)
+def test_opple_remote_triggers(quirk, variant, count):
+    """Test that Opple remote triggers are built lazily and shared per size."""
+    opple_remote = zhaquirks.xiaomi.aqara.opple_remote
+    opple_remote.opple_remote_triggers.cache_clear()
+
+    triggers = quirk.device_automation_triggers
+    assert len(triggers) == count
+    assert opple_remote.opple_remote_triggers.cache_info().currsize == 1
+    other = getattr(opple_remote, quirk.__name__ + variant)
+    assert other.device_automation_triggers is triggers
+    assert triggers[(zhaquirks.const.ALT_SHORT_PRESS, zhaquirks.const.BUTTON_2)] == {
+        zhaquirks.const.COMMAND: "2_single"
+    }
+
+
+@pytest.mark.parametrize(
+    "quirk",
+    (zhaquirks.xiaomi.aqara.cube.Cube, zhaquirks.xiaomi.aqara.cube_aqgl01.CubeAQGL01),
+)
+@pytest.mark.parametrize(
+    "value, action, event_args",
+    (
+        (0, "shake", {"value": 0}),
+        (
+            512,
+            "knock",
+            {
+                "value": 512,
+                "description": "aqara logo on top",
+                "activated_face": 1,
+            },
+        ),
+        (
+            66,
+            "flip",
+            {
+                "value": 66,
+                "flip_degrees": 90,
+                "deactivated_face": 1,
+                "activated_face": 3,
+            },
+        ),
+        (130, "flip", {"value": 130, "flip_degrees": 180, "activated_face": 3}),
+    ),
+)
+def test_cube_movement_events(
+    zigpy_device_from_quirk, quirk, value, action, event_args
+):
+    """Test cube movement events are sent from prebuilt templates."""
+
+    device = zigpy_device_from_quirk(quirk)
+    cluster = device.endpoints[2].multistate_input
+    listener = mock.MagicMock()
+    cluster.add_listener(listener)
+
+    for _ in range(2):
+        cluster.update_attribute(0x0055, value)
+
+    assert listener.zha_send_event.call_args_list == [
+        mock.call(action, event_args),
+        mock.call(action, event_args),
+    ]
+    first, second = (call.args[1] for call in listener.zha_send_event.call_args_list)
+    assert first is not second
@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
+import contextlib
+import enum
+import heapq
 import importlib
 import importlib.util
 import logging
 import pathlib
 import pkgutil
 import sys
+import time
+from types import MappingProxyType
 import typing
 from typing import Any
+import weakref
 
 import zigpy.device
 import zigpy.endpoint
@@ -18,7 +25,7 @@ from zigpy.quirks import DEVICE_REGISTRY, CustomCluster, CustomDevice
 import zigpy.types as t
 from zigpy.util import ListenableMixin
 from zigpy.zcl import foundation
-from zigpy.zcl.clusters.general import PowerConfiguration
+from zigpy.zcl.clusters.general import Basic, PowerConfiguration
 from zigpy.zcl.clusters.measurement import OccupancySensing
 from zigpy.zcl.clusters.security import IasZone
 from zigpy.zdo import types as zdotypes
@@ -26,8 +33,11 @@ from zigpy.zdo import types as zdotypes
 from .const import (
     ATTRIBUTE_ID,
     ATTRIBUTE_NAME,
+    ATTRIBUTES,
+    BUTTON,
     CLUSTER_COMMAND,
     COMMAND_ATTRIBUTE_UPDATED,
+    COMMAND_ATTRIBUTE_UPDATED_BATCH,
     DEVICE_TYPE,
     ENDPOINTS,
     INPUT_CLUSTERS,
@@ -41,6 +51,7 @@ from .const import (
     OFF,
     ON,
     OUTPUT_CLUSTERS,
+    PRESS_TYPE,
     PROFILE_ID,
     UNKNOWN,
     VALUE,
@@ -50,6 +61,14 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Width in seconds of a TimerWheel slot
+TIMER_WHEEL_RESOLUTION = 1.0
+
+# Seconds between releases for a GestureEngine to count them as a multi press
+GESTURE_MULTI_PRESS_THRESHOLD = 0.3
+# asyncio may run a handle up to one clock resolution before its deadline
+TIMER_CLOCK_RESOLUTION = time.get_clock_info("monotonic").resolution
+
 
 class Bus(ListenableMixin):
     """Event bus implementation."""
@@ -60,7 +79,377 @@ class Bus(ListenableMixin):
         self._listeners = {}
 
 
-class LocalDataCluster(CustomCluster):
+class WheelTimer:
+    """Re-armable timer driven by a TimerWheel."""
+
+    __slots__ = ("_callback", "_slot", "_wheel", "deadline")
+
+    def __init__(self, wheel: TimerWheel, callback: Callable[[], Any]) -> None:
+        """Init."""
+        self._wheel = wheel
+        self._callback = callback
+        self._slot: int | None = None
+        self.deadline: float | None = None
+
+    @property
+    def active(self) -> bool:
+        """Return True if the timer is armed."""
+        return self.deadline is not None
+
+    def rearm(self, delay: float) -> None:
+        """(Re)arm the timer to fire after delay seconds."""
+        self._wheel._arm(self, delay)
+
+    def cancel(self) -> bool:
+        """Cancel the timer, return True if it was armed."""
+        return self._wheel._disarm(self)
+
+
+class TimerWheel:
+    """Timer wheel sharing a single event loop timer between many timers.
+
+    Timers are kept in coarse slots, so re-arming and cancelling do not touch the
+    event loop, which only ever holds the next wakeup. Re-arming into a slot
+    that is already known is O(1), only a new slot costs a heap push. Emptied
+    slots are kept until the wheel reaches them, so they are reused instead of
+    piling up in the heap. Timers still fire at their exact deadline.
+    """
+
+    _wheels: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, TimerWheel] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        resolution: float = TIMER_WHEEL_RESOLUTION,
+    ) -> None:
+        """Init."""
+        self._loop = loop
+        self._resolution = resolution
+        self._slots: dict[int, dict[WheelTimer, None]] = {}
+        self._slot_heap: list[int] = []
+        self._handle: asyncio.TimerHandle | None = None
+        self._wakeup: float | None = None
+
+    @classmethod
+    def for_loop(cls, loop: asyncio.AbstractEventLoop | None = None) -> TimerWheel:
+        """Return the shared timer wheel of the (running) event loop."""
+        if loop is None:
+            loop = asyncio.get_running_loop()
+        wheel = cls._wheels.get(loop)
+        if wheel is None:
+            wheel = cls._wheels[loop] = cls(loop)
+        return wheel
+
+    def timer(self, callback: Callable[[], Any]) -> WheelTimer:
+        """Create an unarmed timer calling callback when it fires."""
+        return WheelTimer(self, callback)
+
+    def __len__(self) -> int:
+        """Return the number of armed timers."""
+        return sum(len(slot) for slot in self._slots.values())
+
+    def _arm(self, timer: WheelTimer, delay: float) -> None:
+        self._disarm(timer)
+        deadline = self._loop.time() + delay
+        index = int(deadline // self._resolution)
+        slot = self._slots.get(index)
+        if slot is None:
+            slot = self._slots[index] = {}
+            heapq.heappush(self._slot_heap, index)
+        slot[timer] = None
+        timer._slot = index
+        timer.deadline = deadline
+        if self._wakeup is None or deadline < self._wakeup:
+            self._schedule(deadline)
+
+    def _disarm(self, timer: WheelTimer) -> bool:
+        if timer.deadline is None:
+            return False
+        # emptied slots and their heap entry are dropped once the wheel gets there
+        del self._slots[timer._slot][timer]
+        timer._slot = None
+        timer.deadline = None
+        return True
+
+    def _schedule(self, when: float) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._wakeup = when
+        self._handle = self._loop.call_at(when, self._run)
+
+    def _run(self) -> None:
+        self._handle = None
+        self._wakeup = None
+        end_time = self._loop.time() + TIMER_CLOCK_RESOLUTION
+        due: list[tuple[float, WheelTimer]] = []
+        next_deadline = None
+
+        while self._slot_heap:
+            slot = self._slots[self._slot_heap[0]]
+            slot_due = [
+                (timer.deadline, timer) for timer in slot if timer.deadline <= end_time
+            ]
+            for _, timer in slot_due:
+                del slot[timer]
+            due.extend(slot_due)
+            if slot:
+                next_deadline = min(timer.deadline for timer in slot)
+                break
+            del self._slots[heapq.heappop(self._slot_heap)]
+
+        due.sort(key=lambda item: item[0])
+        for _, timer in due:
+            timer._slot = None
+            timer.deadline = None
+        for _, timer in due:
+            try:
+                timer._callback()
+            except Exception:
+                _LOGGER.exception("Error in timer callback %s", timer._callback)
+
+        if next_deadline is not None and (
+            self._wakeup is None or next_deadline < self._wakeup
+        ):
+            self._schedule(next_deadline)
+
+
+class Gesture(enum.Enum):
+    """Button gesture derived by a GestureEngine."""
+
+    SINGLE = 1
+    DOUBLE = 2
+    TRIPLE = 3
+    QUADRUPLE = 4
+    QUINTUPLE = 5
+    LONG_PRESS = "long_press"
+    LONG_RELEASE = "long_release"
+
+
+MULTI_PRESS_GESTURES = (
+    Gesture.SINGLE,
+    Gesture.DOUBLE,
+    Gesture.TRIPLE,
+    Gesture.QUADRUPLE,
+    Gesture.QUINTUPLE,
+)
+
+
+class GestureEvents:
+    """Prebuilt actions and payloads of button gesture events.
+
+    buttons maps the device's button ids to button names and press_types maps
+    the supported gestures to press type names. The action and event payload of
+    every combination are built once, event_args are added to all payloads.
+    Tables are built at module level and shared by all clusters using them.
+    """
+
+    def __init__(
+        self,
+        buttons: dict[typing.Hashable, str],
+        press_types: dict[Gesture, str],
+        *,
+        event_args: dict[str, Any] | None = None,
+        action_format: str = "{button}_{press_type}",
+    ) -> None:
+        """Init."""
+        self.buttons = frozenset(buttons)
+        self.gestures = frozenset(press_types)
+        self.max_presses = max(
+            (g.value for g in MULTI_PRESS_GESTURES if g in press_types), default=1
+        )
+        self._events = {
+            (button_id, gesture): (
+                action_format.format(button=button, press_type=press_type),
+                MappingProxyType(
+                    {BUTTON: button, PRESS_TYPE: press_type, **(event_args or {})}
+                ),
+            )
+            for button_id, button in buttons.items()
+            for gesture, press_type in press_types.items()
+        }
+
+    def emit(
+        self,
+        cluster: CustomCluster,
+        button_id: typing.Hashable,
+        gesture: Gesture,
+        **kwargs,
+    ) -> bool:
+        """Send the event of a gesture, return False if it is not supported.
+
+        Keyword arguments are added to the event payload.
+        """
+        event = self._events.get((button_id, gesture))
+        if event is None:
+            return False
+        action, template = event
+        event_args = dict(template)
+        if kwargs:
+            event_args.update(kwargs)
+        cluster.listener_event(ZHA_SEND_EVENT, action, event_args)
+        return True
+
+
+class _ButtonState:
+    """Press state of a single button tracked by a GestureEngine."""
+
+    __slots__ = ("count", "held", "pressed", "timer")
+
+    def __init__(self) -> None:
+        """Init."""
+        self.count = 0
+        self.pressed = False
+        self.held = False
+        self.timer: WheelTimer | None = None
+
+
+class GestureEngine:
+    """Derive button gesture events from press, release and hold primitives.
+
+    Consecutive releases within multi_press_threshold seconds are counted into
+    a single, double, ... press. If long_press_threshold is set, a press held
+    that long becomes a long press, otherwise devices report holds with hold().
+    A release without a press or hold is ignored. Devices reporting gestures
+    themselves can send them with emit().
+
+    The events are sent from a shared GestureEvents table, the engine only
+    keeps the press state of the cluster's buttons.
+    """
+
+    def __init__(
+        self,
+        cluster: CustomCluster,
+        events: GestureEvents,
+        *,
+        multi_press_threshold: float = GESTURE_MULTI_PRESS_THRESHOLD,
+        long_press_threshold: float | None = None,
+    ) -> None:
+        """Init."""
+        self._cluster = cluster
+        self._events = events
+        self.multi_press_threshold = multi_press_threshold
+        self.long_press_threshold = long_press_threshold
+        self._buttons: dict[typing.Hashable, _ButtonState] = {}
+
+    def emit(self, button_id: typing.Hashable, gesture: Gesture, **kwargs) -> bool:
+        """Send the event of a gesture, return False if it is not supported."""
+        return self._events.emit(self._cluster, button_id, gesture, **kwargs)
+
+    def press(self, button_id: typing.Hashable) -> None:
+        """Handle a button going down."""
+        state = self._state(button_id)
+        if state is None:
+            return
+        state.pressed = True
+        if self.long_press_threshold is not None:
+            self._timer(button_id, state).rearm(self.long_press_threshold)
+        elif state.timer is not None:
+            # the multi press window stays open until the release
+            state.timer.cancel()
+
+    def hold(self, button_id: typing.Hashable) -> None:
+        """Handle a button being held down."""
+        state = self._state(button_id)
+        if state is None or state.held:
+            return
+        if state.timer is not None:
+            state.timer.cancel()
+        self._flush(button_id, state)
+        state.pressed = True
+        state.held = True
+        self.emit(button_id, Gesture.LONG_PRESS)
+
+    def release(self, button_id: typing.Hashable) -> None:
+        """Handle a button going up."""
+        state = self._state(button_id)
+        if state is None or not state.pressed:
+            return
+        state.pressed = False
+        if state.held:
+            state.held = False
+            self.emit(button_id, Gesture.LONG_RELEASE)
+            return
+        state.count += 1
+        if state.count >= self._events.max_presses:
+            if state.timer is not None:
+                state.timer.cancel()
+            self._flush(button_id, state)
+        else:
+            self._timer(button_id, state).rearm(self.multi_press_threshold)
+
+    def cancel(self) -> None:
+        """Drop pending presses of all buttons."""
+        for state in self._buttons.values():
+            if state.timer is not None:
+                state.timer.cancel()
+            state.count = 0
+            state.pressed = state.held = False
+
+    def _state(self, button_id: typing.Hashable) -> _ButtonState | None:
+        state = self._buttons.get(button_id)
+        if state is None and button_id in self._events.buttons:
+            state = self._buttons[button_id] = _ButtonState()
+        return state
+
+    def _timer(self, button_id: typing.Hashable, state: _ButtonState) -> WheelTimer:
+        if state.timer is None:
+            state.timer = TimerWheel.for_loop().timer(
+                lambda: self._expired(button_id, state)
+            )
+        return state.timer
+
+    def _expired(self, button_id: typing.Hashable, state: _ButtonState) -> None:
+        if state.pressed:
+            self.hold(button_id)
+        else:
+            self._flush(button_id, state)
+
+    def _flush(self, button_id: typing.Hashable, state: _ButtonState) -> None:
+        if state.count:
+            count, state.count = state.count, 0
+            self.emit(button_id, MULTI_PRESS_GESTURES[min(count, 5) - 1])
+
+
+class AttributeUpdateBatchMixin:
+    """Mixin collecting attribute updates into attribute_updated_batch events."""
+
+    _attribute_batch: dict[int, Any] | None = None
+
+    @contextlib.contextmanager
+    def attribute_update_batch(self):
+        """Collect attribute updates into a single attribute_updated_batch event.
+
+        The event carries the values updated in the outermost batch and is sent
+        when that batch ends, if anything was updated.
+        """
+        if self._attribute_batch is not None:
+            yield
+            return
+        self._attribute_batch = batch = {}
+        try:
+            yield
+        finally:
+            self._attribute_batch = None
+            if batch:
+                self._send_attribute_batch(batch)
+
+    def _send_attribute_batch(self, values: dict[int, Any]) -> None:
+        self.listener_event(COMMAND_ATTRIBUTE_UPDATED_BATCH, values)
+
+    def _update_attribute(self, attrid, value):
+        if self._attribute_batch is None:
+            super()._update_attribute(attrid, value)
+            return
+        last_updated = self._attr_last_updated.get(attrid)
+        super()._update_attribute(attrid, value)
+        if self._attr_last_updated.get(attrid) is not last_updated:
+            # record what was stored, clusters further down may convert the value
+            self._attribute_batch[attrid] = self._attr_cache.get(attrid)
+
+
+class LocalDataCluster(AttributeUpdateBatchMixin, CustomCluster):
     """Cluster meant to prevent remote calls.
 
     Set _CONSTANT_ATTRIBUTES to provide constant values for attribute ids.
@@ -121,47 +510,89 @@ class LocalDataCluster(CustomCluster):
             self._update_attribute(attrid, value)
         return ([foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)],)
 
+    def update_attributes(self, values: dict[int, Any]) -> None:
+        """Update several attributes from a single report as one batch."""
+        with self.attribute_update_batch():
+            for attrid, value in values.items():
+                self._update_attribute(attrid, value)
 
-class EventableCluster(CustomCluster):
-    """Cluster that generates events."""
 
-    def handle_cluster_request(
+class EventableCluster(AttributeUpdateBatchMixin, CustomCluster):
+    """Cluster that generates events.
+
+    Set batch_attribute_updates to also send the attribute updates of each
+    incoming frame and of each read_attributes call as a single
+    attribute_updated_batch event. Other updates only send their own event.
+    """
+
+    batch_attribute_updates: bool = False
+
+    def handle_message(
         self,
         hdr: foundation.ZCLHeader,
         args: list[Any],
         *,
         dst_addressing: None
         | (t.Addressing.Group | t.Addressing.IEEE | t.Addressing.NWK) = None,
-    ):
-        """Send cluster requests as events."""
-        if (
-            self.server_commands is not None
-            and self.server_commands.get(hdr.command_id) is not None
-        ):
-            self.listener_event(
-                ZHA_SEND_EVENT,
-                self.server_commands.get(hdr.command_id, (hdr.command_id)).name,
-                args,
-            )
-
-    def _update_attribute(self, attrid, value):
-        super()._update_attribute(attrid, value)
-
+    ) -> None:
+        """Handle an incoming frame, batching its attribute updates if enabled."""
+        if not self.batch_attribute_updates:
+            super().handle_message(hdr, args, dst_addressing=dst_addressing)
+            return
+        # a frame arriving while a read is pending forms a batch of its own
+        outer, self._attribute_batch = self._attribute_batch, None
+        try:
+            with self.attribute_update_batch():
+                super().handle_message(hdr, args, dst_addressing=dst_addressing)
+        finally:
+            self._attribute_batch = outer
+
+    async def read_attributes(self, *args, **kwargs):
+        """Read attributes, batching the updates of the response if enabled."""
+        if not self.batch_attribute_updates:
+            return await super().read_attributes(*args, **kwargs)
+        with self.attribute_update_batch():
+            return await super().read_attributes(*args, **kwargs)
+
+    def _attribute_event_args(self, attrid, value) -> dict[str, Any]:
         if attrid in self.attributes:
             attribute_name = self.attributes[attrid].name
         else:
             attribute_name = UNKNOWN
+        return {ATTRIBUTE_ID: attrid, ATTRIBUTE_NAME: attribute_name, VALUE: value}
 
+    def _send_attribute_batch(self, values: dict[int, Any]) -> None:
+        super()._send_attribute_batch(values)
         self.listener_event(
             ZHA_SEND_EVENT,
-            COMMAND_ATTRIBUTE_UPDATED,
+            COMMAND_ATTRIBUTE_UPDATED_BATCH,
             {
-                ATTRIBUTE_ID: attrid,
-                ATTRIBUTE_NAME: attribute_name,
-                VALUE: value,
+                ATTRIBUTES: [
+                    self._attribute_event_args(attrid, value)
+                    for attrid, value in values.items()
+                ]
             },
         )
 
+    def handle_cluster_request(
+        self,
+        hdr: foundation.ZCLHeader,
+        args: list[Any],
+        *,
+        dst_addressing: None
+        | (t.Addressing.Group | t.Addressing.IEEE | t.Addressing.NWK) = None,
+    ):
+        """Send cluster requests as events."""
+        if self.server_commands is not None:
+            command = self.server_commands.get(hdr.command_id)
+            if command is not None:
+                self.listener_event(ZHA_SEND_EVENT, command.name, args)
+
+    def _update_attribute(self, attrid, value):
+        super()._update_attribute(attrid, value)
+        event_args = self._attribute_event_args(attrid, value)
+        self.listener_event(ZHA_SEND_EVENT, COMMAND_ATTRIBUTE_UPDATED, event_args)
+
 
 class GroupBoundCluster(CustomCluster):
     """Cluster that can only bind to a group instead of direct to hub.
@@ -254,11 +685,9 @@ class _Motion(CustomCluster, IasZone):
     def __init__(self, *args, **kwargs):
         """Init."""
         super().__init__(*args, **kwargs)
-        self._loop = asyncio.get_running_loop()
-        self._timer_handle = None
+        self._reset_timer = TimerWheel.for_loop().timer(self._turn_off)
 
     def _turn_off(self):
-        self._timer_handle = None
         self.debug("%s - Resetting motion sensor", self.endpoint.device.ieee)
         self.listener_event(
             CLUSTER_COMMAND, 253, ZONE_STATUS_CHANGE_COMMAND, [OFF, 0, 0, 0]
@@ -284,9 +713,7 @@ class MotionWithReset(_Motion):
         """Handle the cluster command."""
         # check if the command is for a zone status change of ZoneStatus.Alarm_1 or ZoneStatus.Alarm_2
         if hdr.command_id == ZONE_STATUS_CHANGE_COMMAND and args[0] & 3:
-            if self._timer_handle:
-                self._timer_handle.cancel()
-            self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+            self._reset_timer.rearm(self.reset_s)
             if self.send_occupancy_event:
                 self.endpoint.device.occupancy_bus.listener_event(OCCUPANCY_EVENT)
 
@@ -309,10 +736,7 @@ class MotionOnEvent(_Motion):
 
         self.debug("%s - Received motion event message", self.endpoint.device.ieee)
 
-        if self._timer_handle:
-            self._timer_handle.cancel()
-
-        self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+        self._reset_timer.rearm(self.reset_s)
 
 
 class _Occupancy(CustomCluster, OccupancySensing):
@@ -323,11 +747,9 @@ class _Occupancy(CustomCluster, OccupancySensing):
     def __init__(self, *args, **kwargs):
         """Init."""
         super().__init__(*args, **kwargs)
-        self._timer_handle = None
-        self._loop = asyncio.get_running_loop()
+        self._reset_timer = TimerWheel.for_loop().timer(self._turn_off)
 
     def _turn_off(self):
-        self._timer_handle = None
         self._update_attribute(OCCUPANCY_STATE, OFF)
 
 
@@ -343,10 +765,7 @@ class OccupancyOnEvent(_Occupancy):
         """Occupancy event."""
         self._update_attribute(OCCUPANCY_STATE, ON)
 
-        if self._timer_handle:
-            self._timer_handle.cancel()
-
-        self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+        self._reset_timer.rearm(self.reset_s)
 
 
 class OccupancyWithReset(_Occupancy):
@@ -356,10 +775,8 @@ class OccupancyWithReset(_Occupancy):
         super()._update_attribute(attrid, value)
 
         if attrid == OCCUPANCY_STATE and value == ON:
-            if self._timer_handle:
-                self._timer_handle.cancel()
             self.endpoint.device.motion_bus.listener_event(MOTION_EVENT)
-            self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+            self._reset_timer.rearm(self.reset_s)
 
 
 class QuickInitDevice(CustomDevice):
@@ -367,37 +784,79 @@ class QuickInitDevice(CustomDevice):
 
     signature: dict[str, Any] | None = None
 
+    # Signature compiled by _compile_signature, set per subclass on first use
+    _signature_recipe: (
+        tuple[
+            str,
+            str | None,
+            zdotypes.NodeDescriptor,
+            tuple[tuple[int, int, int, tuple[int, ...], tuple[int, ...]], ...],
+        ]
+        | None
+    ) = None
+
+    @classmethod
+    def _compile_signature(cls):
+        """Compile the signature into the steps taken by from_signature.
+
+        Raises KeyError if the signature lacks any of the required entries.
+        """
+
+        assert isinstance(cls.signature, dict)
+        if cls.__dict__.get("_signature_recipe") is not None:
+            return cls._signature_recipe
+
+        manufacturer = cls.signature.get(MANUFACTURER)
+        if manufacturer is None:
+            manufacturer = cls.signature[MODELS_INFO][0][0]
+
+        endpoints = tuple(
+            (
+                ep_id,
+                ep_data[PROFILE_ID],
+                ep_data[DEVICE_TYPE],
+                tuple(ep_data[INPUT_CLUSTERS]),
+                tuple(ep_data[OUTPUT_CLUSTERS]),
+            )
+            for ep_id, ep_data in cls.signature[ENDPOINTS].items()
+        )
+
+        cls._signature_recipe = (
+            manufacturer,
+            cls.signature.get(MODEL),
+            cls.signature[NODE_DESCRIPTOR],
+            endpoints,
+        )
+        return cls._signature_recipe
+
     @classmethod
     def from_signature(
         cls, device: zigpy.device.Device, model: str | None = None
     ) -> zigpy.device.Device:
         """Update device accordingly to quirk signature."""
 
-        assert isinstance(cls.signature, dict)
+        manufacturer, signature_model, node_desc, endpoints = cls._compile_signature()
         if model is None:
-            model = cls.signature[MODEL]
-        manufacturer = cls.signature.get(MANUFACTURER)
-        if manufacturer is None:
-            manufacturer = cls.signature[MODELS_INFO][0][0]
+            model = signature_model
+        if model is None:
+            raise KeyError(MODEL)
 
-        device.node_desc = cls.signature[NODE_DESCRIPTOR]
+        device.node_desc = node_desc
 
-        endpoints = cls.signature[ENDPOINTS]
-        for ep_id, ep_data in endpoints.items():
+        for ep_id, profile_id, device_type, in_clusters, out_clusters in endpoints:
             endpoint = device.add_endpoint(ep_id)
-            endpoint.profile_id = ep_data[PROFILE_ID]
-            endpoint.device_type = ep_data[DEVICE_TYPE]
-            for cluster_id in ep_data[INPUT_CLUSTERS]:
+            endpoint.profile_id = profile_id
+            endpoint.device_type = device_type
+            for cluster_id in in_clusters:
                 cluster = endpoint.add_input_cluster(cluster_id)
-                if cluster.ep_attribute == "basic":
-                    manuf_attr_id = cluster.attributes_by_name[MANUFACTURER].id
+                if cluster_id == Basic.cluster_id:
                     cluster._update_attribute(  # pylint: disable=W0212
-                        manuf_attr_id, manufacturer
+                        Basic.AttributeDefs.manufacturer.id, manufacturer
                     )
                     cluster._update_attribute(  # pylint: disable=W0212
-                        cluster.attributes_by_name[MODEL].id, model
+                        Basic.AttributeDefs.model.id, model
                     )
-            for cluster_id in ep_data[OUTPUT_CLUSTERS]:
+            for cluster_id in out_clusters:
                 endpoint.add_output_cluster(cluster_id)
             endpoint.status = zigpy.endpoint.Status.ZDO_INIT
 
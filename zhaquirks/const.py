@@ -17,6 +17,7 @@ ARGS = "args"
 ATTR_ID = "attr_id"
 ATTRIBUTE_ID = "attribute_id"
 ATTRIBUTE_NAME = "attribute_name"
+ATTRIBUTES = "attributes"
 BUTTON = "button"
 BUTTON_1 = "button_1"
 BUTTON_2 = "button_2"
@@ -30,6 +31,7 @@ CLUSTER_COMMAND = "cluster_command"
 CLUSTER_ID = "cluster_id"
 COMMAND = "command"
 COMMAND_ATTRIBUTE_UPDATED = "attribute_updated"
+COMMAND_ATTRIBUTE_UPDATED_BATCH = "attribute_updated_batch"
 COMMAND_BUTTON_DOUBLE = "button_double"
 COMMAND_BUTTON_HOLD = "button_hold"
 COMMAND_BUTTON_SINGLE = "button_single"
@@ -7,8 +7,8 @@ from zigpy.quirks import CustomCluster
 import zigpy.types as t
 from zigpy.zcl import foundation
 
+from zhaquirks import Gesture, GestureEvents
 from zhaquirks.const import (
-    BUTTON,
     BUTTON_1,
     BUTTON_2,
     BUTTON_3,
@@ -24,7 +24,6 @@ from zhaquirks.const import (
     COMMAND_RELEASE,
     COMMAND_TRIPLE,
     DOUBLE_PRESS,
-    PRESS_TYPE,
     QUADRUPLE_PRESS,
     QUINTUPLE_PRESS,
     TRIPLE_PRESS,
@@ -52,6 +51,15 @@ PRESS_TYPES = {
     5: COMMAND_QUAD,
     6: COMMAND_QUINTUPLE,
 }
+GESTURES = {
+    0: Gesture.SINGLE,
+    1: Gesture.LONG_RELEASE,
+    2: Gesture.LONG_PRESS,
+    3: Gesture.DOUBLE,
+    4: Gesture.TRIPLE,
+    5: Gesture.QUADRUPLE,
+    6: Gesture.QUINTUPLE,
+}
 
 LED_NOTIFICATION_TYPES = {
     0: "LED_1",
@@ -83,6 +91,13 @@ AUX_CONFIG = "Aux config"
 
 NOTIFICATION_TYPE = "notification_type"
 
+BUTTON_EVENT_COMMAND_ID = 0x00
+GESTURE_EVENTS = GestureEvents(
+    BUTTONS,
+    {GESTURES[k]: v for k, v in PRESS_TYPES.items()},
+    event_args={COMMAND_ID: BUTTON_EVENT_COMMAND_ID},
+)
+
 
 class InovelliCluster(CustomCluster):
     """Inovelli base cluster."""
@@ -111,7 +126,7 @@ class InovelliCluster(CustomCluster):
     }
 
     server_commands = {
-        0x00: foundation.ZCLCommandDef(
+        BUTTON_EVENT_COMMAND_ID: foundation.ZCLCommandDef(
             "button_event",
             {"button_pressed": t.uint8_t, "press_type": t.uint8_t},
             direction=foundation.Direction.Client_to_Server,
@@ -166,22 +181,17 @@ class InovelliCluster(CustomCluster):
         ] = None,
     ):
         """Handle a cluster request."""
-        _LOGGER.debug(
-            "%s: handle_cluster_request - Command: %s Data: %s",
-            self.name,
-            hdr.command_id,
-            args,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: handle_cluster_request - Command: %s Data: %s",
+                self.name,
+                hdr.command_id,
+                args,
+            )
         if hdr.command_id == self.commands_by_name["button_event"].id:
-            button = BUTTONS[args.button_pressed]
-            press_type = PRESS_TYPES[args.press_type]
-            action = f"{button}_{press_type}"
-            event_args = {
-                BUTTON: button,
-                PRESS_TYPE: press_type,
-                COMMAND_ID: hdr.command_id,
-            }
-            self.listener_event(ZHA_SEND_EVENT, action, event_args)
+            gesture = GESTURES.get(args.press_type)
+            if gesture is not None:
+                GESTURE_EVENTS.emit(self, args.button_pressed, gesture)
             return
         if hdr.command_id == self.commands_by_name["led_effect_complete"].id:
             notification_type = LED_NOTIFICATION_TYPES.get(
@@ -3,7 +3,7 @@
 import asyncio
 import itertools
 import logging
-import time
+from types import MappingProxyType
 from typing import Any, Final, Optional, Union
 
 from zigpy.quirks import CustomCluster
@@ -42,6 +42,9 @@ PHILIPS = "Philips"
 SIGNIFY = "Signify Netherlands B.V."
 _LOGGER = logging.getLogger(__name__)
 
+# seconds between short releases to count them as a multi press
+MULTI_PRESS_THRESHOLD: Final = 0.3
+
 
 class PhilipsOccupancySensing(CustomCluster):
     """Philips occupancy cluster."""
@@ -77,29 +80,31 @@ class PhilipsBasicCluster(CustomCluster, Basic):
 class ButtonPressQueue:
     """Philips button queue to derive multiple press events."""
 
-    def __init__(self):
+    def __init__(self, threshold: float = MULTI_PRESS_THRESHOLD):
         """Init."""
-        self._ms_threshold = 300
-        self._ms_last_click = 0
+        self.threshold = threshold
+        self._last_click = 0.0
         self._click_counter = 1
         self._callback = lambda x: None
-        self._task = None
+        self._handle: asyncio.TimerHandle | None = None
 
-    async def _job(self):
-        await asyncio.sleep(self._ms_threshold / 1000)
+    def _fire(self):
+        self._handle = None
         self._callback(self._click_counter)
 
     def press(self, callback):
         """Process a button press."""
+        loop = asyncio.get_running_loop()
         self._callback = callback
-        now_ms = time.time() * 1000
-        if now_ms - self._ms_last_click > self._ms_threshold:
+        now = loop.time()
+        if self._handle is None or now - self._last_click > self.threshold:
             self._click_counter = 1
         else:
-            self._task.cancel()
             self._click_counter += 1
-        self._ms_last_click = now_ms
-        self._task = asyncio.ensure_future(self._job())
+        if self._handle is not None:
+            self._handle.cancel()
+        self._last_click = now
+        self._handle = loop.call_later(self.threshold, self._fire)
 
 
 class Button:
@@ -178,11 +183,58 @@ class PhilipsRemoteCluster(CustomCluster):
         PressType(SHORT_PRESS, COMMAND_PRESS),
         PressType(SHORT_RELEASE, COMMAND_M_SHORT_RELEASE),
     ]
+    MULTI_PRESS_THRESHOLD: float = MULTI_PRESS_THRESHOLD
 
     def __init__(self, endpoint, is_server=True):
         """Initialize button press queue for each button."""
         super().__init__(endpoint, is_server)
-        self.button_press_queue = {k: ButtonPressQueue() for k in self.BUTTONS}
+        self.button_press_queue = {
+            k: ButtonPressQueue(self.MULTI_PRESS_THRESHOLD) for k in self.BUTTONS
+        }
+
+    @classmethod
+    def _event_template(
+        cls, button: Button, press_type: PressType
+    ) -> tuple[str, MappingProxyType]:
+        """Return the action and static event arguments of a button press type."""
+        templates = cls.__dict__.get("_event_templates")
+        if templates is None:
+            templates = cls._event_templates = {}
+        event = templates.get((button, press_type))
+        if event is None:
+            event = templates[(button, press_type)] = (
+                f"{button.action}_{press_type.action}",
+                MappingProxyType({BUTTON: button.id, PRESS_TYPE: press_type.arg}),
+            )
+        return event
+
+    def _send_press_event(
+        self,
+        button: Button,
+        press_type: PressType,
+        command_id: int,
+        duration: int,
+        args: list[Any],
+        press_arg: int | None = None,
+    ) -> None:
+        action, template = self._event_template(button, press_type)
+        if press_arg is not None:
+            args = list(args)
+            args[2] = press_arg
+        event_args = {
+            **template,
+            COMMAND_ID: command_id,
+            "duration": duration,
+            ARGS: args,
+        }
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s - send_press_event emitting action: [%s] event_args: %s",
+                self.__class__.__name__,
+                action,
+                event_args,
+            )
+        self.listener_event(ZHA_SEND_EVENT, action, event_args)
 
     def handle_cluster_request(
         self,
@@ -194,29 +246,26 @@ class PhilipsRemoteCluster(CustomCluster):
         ] = None,
     ):
         """Handle the cluster command."""
-        _LOGGER.debug(
-            "%s - handle_cluster_request tsn: [%s] command id: %s - args: [%s]",
-            self.__class__.__name__,
-            hdr.tsn,
-            hdr.command_id,
-            args,
-        )
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug(
+                "%s - handle_cluster_request tsn: [%s] command id: %s - args: [%s]",
+                self.__class__.__name__,
+                hdr.tsn,
+                hdr.command_id,
+                args,
+            )
 
         button = self.BUTTONS.get(args[0])
         # Bail on unknown buttons. (This gets rid of dial button "presses")
         if button is None:
-            _LOGGER.debug(
-                "%s - handle_cluster_request unknown button id [%s]",
-                self.__class__.__name__,
-                args[0],
-            )
+            if debug:
+                _LOGGER.debug(
+                    "%s - handle_cluster_request unknown button id [%s]",
+                    self.__class__.__name__,
+                    args[0],
+                )
             return
-        _LOGGER.debug(
-            "%s - handle_cluster_request button id: [%s], button name: [%s]",
-            self.__class__.__name__,
-            args[0],
-            button,
-        )
 
         press_type = self.PRESS_TYPES.get(args[2])
         if (
@@ -226,90 +275,57 @@ class PhilipsRemoteCluster(CustomCluster):
         ):
             press_type = self.SIMULATE_SHORT_EVENTS[1]
         if press_type is None:
-            _LOGGER.debug(
-                "%s - handle_cluster_request unknown button press type: [%s]",
-                self.__class__.__name__,
-                press_type,
-            )
+            if debug:
+                _LOGGER.debug(
+                    "%s - handle_cluster_request unknown button press type: [%s]",
+                    self.__class__.__name__,
+                    args[2],
+                )
             return
 
         duration = args[4]
-        _LOGGER.debug(
-            "%s - handle_cluster_request button press type: [%s], duration: [%s]",
-            self.__class__.__name__,
-            press_type,
-            duration,
-        )
-
-        event_args = {
-            BUTTON: button.id,
-            PRESS_TYPE: press_type.arg,
-            COMMAND_ID: hdr.command_id,
-            "duration": duration,
-            ARGS: args,
-        }
-
-        def send_press_event(click_count):
+        if debug:
             _LOGGER.debug(
-                "%s - send_press_event click_count: [%s]",
+                "%s - handle_cluster_request button: [%s], press type: [%s], duration: [%s]",
                 self.__class__.__name__,
-                click_count,
+                button,
+                press_type,
+                duration,
             )
-            press_type = None
+
+        def send_press_event(click_count):
             if click_count == 1:
                 press_type = self.PRESS_TYPES.get(0) or self.SIMULATE_SHORT_EVENTS[0]
-            elif click_count > 1:
+            else:
                 press_type = self.MULTI_PRESS_EVENTS[min(click_count, 5)]
-
-            _LOGGER.debug(
-                "%s - send_press_event evaluated press_type: [%s]",
-                self.__class__.__name__,
+            self._send_press_event(
+                button,
                 press_type,
+                hdr.command_id,
+                duration,
+                args,
+                0 if click_count < 2 else 2 + min(click_count, 5),
             )
-            if press_type is not None:
-                # Override PRESS_TYPE
-                event_args[PRESS_TYPE] = press_type.arg
-                event_args[ARGS] = list(event_args[ARGS])
-                event_args[ARGS][2] = 0 if click_count < 2 else 2 + min(click_count, 5)
-                action = f"{button.action}_{press_type.action}"
-                _LOGGER.debug(
-                    "%s - send_press_event emitting action: [%s] event_args: %s",
-                    self.__class__.__name__,
-                    action,
-                    event_args,
-                )
-                self.listener_event(ZHA_SEND_EVENT, action, event_args)
 
             # simulate short release event, if needed for this device type
             if (
                 press_type.name == SHORT_PRESS
                 and self.SIMULATE_SHORT_EVENTS is not None
             ):
-                press_type = self.PRESS_TYPES.get(2) or self.SIMULATE_SHORT_EVENTS[1]
-                sim_event_args = event_args.copy()
-                sim_event_args[PRESS_TYPE] = press_type.arg
-                sim_event_args[ARGS] = sim_event_args[ARGS].copy()
-                sim_event_args[ARGS][2] = 2
-                action = f"{button.action}_{press_type.action}"
-                _LOGGER.debug(
-                    "%s - send_press_event emitting simulated action: [%s], event_args: %s",
-                    self.__class__.__name__,
-                    action,
-                    sim_event_args,
+                self._send_press_event(
+                    button,
+                    self.PRESS_TYPES.get(2) or self.SIMULATE_SHORT_EVENTS[1],
+                    hdr.command_id,
+                    duration,
+                    args,
+                    2,
                 )
-                self.listener_event(ZHA_SEND_EVENT, action, sim_event_args)
 
         # Derive Multiple Presses
         if press_type.name == SHORT_RELEASE:
-            _LOGGER.debug(
-                "%s - handle_cluster_request handling short release. Push to button press queue for button %s",
-                self.__class__.__name__,
-                args[0],
-            )
             self.button_press_queue[args[0]].press(send_press_event)
         else:
-            action = f"{button.action}_{press_type.action}"
-            self.listener_event(ZHA_SEND_EVENT, action, event_args)
+            self._send_press_event(button, press_type, hdr.command_id, duration, args)
 
     @classmethod
     def generate_device_automation_triggers(cls, additional=None):
@@ -19,8 +19,8 @@ from zigpy.zcl.clusters.general import (
 )
 from zigpy.zcl.clusters.lighting import Color
 
+from zhaquirks import Gesture, GestureEngine, GestureEvents
 from zhaquirks.const import (
-    BUTTON,
     BUTTON_1,
     BUTTON_2,
     BUTTON_3,
@@ -34,10 +34,8 @@ from zhaquirks.const import (
     LONG_RELEASE,
     MODELS_INFO,
     OUTPUT_CLUSTERS,
-    PRESS_TYPE,
     PROFILE_ID,
     SHORT_PRESS,
-    ZHA_SEND_EVENT,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,6 +45,21 @@ SIGLIS_MANUFACTURER_CODE = 0x129C
 ZIGFRED_CLUSTER_ID = 0xFC42
 ZIGFRED_CLUSTER_BUTTONS_ATTRIBUTE_ID = 0x0008
 ZIGFRED_CLUSTER_COMMAND_BUTTON_EVENT = 0x02
+ZIGFRED_GESTURES = {
+    0: Gesture.LONG_RELEASE,
+    1: Gesture.SINGLE,
+    2: Gesture.DOUBLE,
+    3: Gesture.LONG_PRESS,
+}
+ZIGFRED_GESTURE_EVENTS = GestureEvents(
+    {0: BUTTON_1, 1: BUTTON_2, 2: BUTTON_3, 3: BUTTON_4},
+    {
+        Gesture.LONG_RELEASE: LONG_RELEASE,
+        Gesture.SINGLE: SHORT_PRESS,
+        Gesture.DOUBLE: DOUBLE_PRESS,
+        Gesture.LONG_PRESS: LONG_PRESS,
+    },
+)
 
 
 # Siglis zigfred cluster implementation
@@ -66,38 +79,29 @@ class ZigfredCluster(CustomCluster):
         ),
     }
 
-    def _process_button_event(self, value: t.uint32_t):
-        button_lookup = {
-            0: BUTTON_1,
-            1: BUTTON_2,
-            2: BUTTON_3,
-            3: BUTTON_4,
-        }
-
-        press_type_lookup = {
-            0: LONG_RELEASE,
-            1: SHORT_PRESS,
-            2: DOUBLE_PRESS,
-            3: LONG_PRESS,
-        }
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._gestures = GestureEngine(self, ZIGFRED_GESTURE_EVENTS)
 
+    def _process_button_event(self, value: t.uint32_t):
         button = value & 0xFF
         press_type = (value >> 8) & 0xFF
+        _LOGGER.debug(
+            "Got button press on zigfred cluster: button %s, press type %s",
+            button,
+            press_type,
+        )
 
-        button = button_lookup[button]
-        press_type = press_type_lookup[press_type]
-
-        action = f"{button}_{press_type}"
-
-        event_args = {
-            BUTTON: button,
-            PRESS_TYPE: press_type,
-        }
-
-        _LOGGER.info("Got button press on zigfred cluster: %s", action)
-
-        if button and press_type:
-            self.listener_event(ZHA_SEND_EVENT, action, event_args)
+        # long presses are paired up by the engine, so repeated hold reports
+        # and releases without a hold are dropped
+        gesture = ZIGFRED_GESTURES.get(press_type)
+        if gesture is Gesture.LONG_PRESS:
+            self._gestures.hold(button)
+        elif gesture is Gesture.LONG_RELEASE:
+            self._gestures.release(button)
+        elif gesture is not None:
+            self._gestures.emit(button, gesture)
 
     def handle_cluster_request(
         self,
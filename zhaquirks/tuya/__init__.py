@@ -1,11 +1,14 @@
 """Tuya devices."""
 
+import asyncio
 from collections.abc import Callable
 import dataclasses
 import datetime
 import enum
 import logging
+import math
 from typing import Any, Optional, Union
+import weakref
 
 from zigpy.quirks import BaseCustomDevice, CustomCluster, CustomDevice
 import zigpy.types as t
@@ -1151,6 +1154,10 @@ class TuyaZB1888Cluster(CustomCluster):
 class TuyaManufacturerWindowCover(TuyaManufCluster):
     """Manufacturer Specific Cluster for cover device."""
 
+    # Last position reported by the device and whether it was repeated since
+    _last_position: Optional[int] = None
+    _position_repeated: bool = False
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -1181,10 +1188,25 @@ class TuyaManufacturerWindowCover(TuyaManufCluster):
                 TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_CONTROL,
             ]
             if tuya_payload.command_id in ids:
+                position = tuya_payload.data[4]
+                if position != self._last_position:
+                    self._last_position = position
+                    self._position_repeated = False
+                elif self._position_repeated:
+                    # the first repeat tells the cover it stopped, later ones
+                    # carry nothing new
+                    _LOGGER.debug(
+                        "%s Dropping repeated cover position %s",
+                        self.endpoint.device.ieee,
+                        position,
+                    )
+                    return
+                else:
+                    self._position_repeated = True
                 self.endpoint.device.cover_bus.listener_event(
                     COVER_EVENT,
                     ATTR_COVER_POSITION,
-                    tuya_payload.data[4],
+                    position,
                 )
             elif (
                 tuya_payload.command_id
@@ -1216,6 +1238,13 @@ class TuyaManufacturerWindowCover(TuyaManufCluster):
             )
 
 
+def _call_weak_method(method: weakref.WeakMethod) -> None:
+    """Call a weakly referenced method if its object is still alive."""
+    func = method()
+    if func is not None:
+        func()
+
+
 class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
     """Manufacturer Specific Cluster of Device cover."""
 
@@ -1224,9 +1253,23 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
     attributes.update({ATTR_COVER_DIRECTION: ("motor_direction", t.Bool)})
     attributes.update({ATTR_COVER_INVERTED: ("cover_inverted", t.Bool)})
 
+    # Minimum seconds between position updates while the cover is moving,
+    # the latest position is always delivered once the interval elapses.
+    # 0 passes every position report through.
+    position_report_interval: float = 0
+    # A move without position reports for this long is considered stopped
+    move_timeout: float = 5.0
+
     def __init__(self, *args, **kwargs):
         """Initialize instance."""
         super().__init__(*args, **kwargs)
+        self._move_target: Optional[tuple[int, Optional[int]]] = None
+        self._last_move_activity = -math.inf
+        self._last_position_update = -math.inf
+        self._pending_position: Optional[int] = None
+        self._last_position: Optional[int] = None
+        self._position_handle: Optional[asyncio.TimerHandle] = None
+        self._position_finalizer: Optional[weakref.finalize] = None
         self.endpoint.device.cover_bus.add_listener(self)
 
     def cover_event(self, attribute, value):
@@ -1239,6 +1282,8 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
                 else invert_attr
             )
             value = value if invert else 100 - value
+            self._position_reported(value)
+            return
         self._update_attribute(attribute, value)
         _LOGGER.debug(
             "%s Tuya Attribute Cache : [%s]",
@@ -1246,6 +1291,79 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
             self._attr_cache,
         )
 
+    def _position_reported(self, value: int) -> None:
+        """Coalesce position reports of a moving cover."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        self._last_move_activity = now
+        last_position, self._last_position = self._last_position, value
+        if self._move_target is not None and (
+            value == last_position
+            or (
+                value == self._move_target[1]
+                if self._move_target[1] is not None
+                else value in (0, 100)
+            )
+        ):
+            # target reached or the motor stopped short of it, the cover is at rest
+            self._move_target = None
+            self._update_position(value)
+            return
+
+        delay = self._last_position_update + self.position_report_interval - now
+        if delay <= 0:
+            self._update_position(value)
+            return
+
+        self._pending_position = value
+        if self._position_handle is None:
+            # the handle must not keep a removed cover alive, it is cancelled
+            # once the cluster is garbage collected
+            self._position_handle = loop.call_later(
+                delay, _call_weak_method, weakref.WeakMethod(self._flush_position)
+            )
+            self._position_finalizer = weakref.finalize(
+                self, self._position_handle.cancel
+            )
+
+    def _cancel_position_handle(self) -> None:
+        """Cancel the pending coalesced position delivery."""
+        if self._position_handle is not None:
+            self._position_handle.cancel()
+            self._position_handle = None
+        if self._position_finalizer is not None:
+            self._position_finalizer.detach()
+            self._position_finalizer = None
+
+    def _flush_position(self) -> None:
+        """Deliver the latest coalesced position."""
+        self._cancel_position_handle()
+        if self._pending_position is not None:
+            self._update_position(self._pending_position)
+
+    def _update_position(self, value: int) -> None:
+        """Update the cover position attribute."""
+        self._cancel_position_handle()
+        self._pending_position = None
+        self._last_position_update = asyncio.get_running_loop().time()
+        if self._attr_cache.get(ATTR_COVER_POSITION) == value:
+            # a repeated report ending a move changes nothing
+            return
+        self._update_attribute(ATTR_COVER_POSITION, value)
+        _LOGGER.debug(
+            "%s Tuya Attribute Cache : [%s]",
+            self.endpoint.device.ieee,
+            self._attr_cache,
+        )
+
+    def _is_moving_to(self, target: tuple[int, Optional[int]]) -> bool:
+        """Return whether the cover is still moving to the given target."""
+        return (
+            self._move_target == target
+            and asyncio.get_running_loop().time() - self._last_move_activity
+            < self.move_timeout
+        )
+
     def command(
         self,
         command_id: Union[foundation.GeneralCommand, int, t.uint8_t],
@@ -1264,6 +1382,31 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
             command_id,
             args,
         )
+        # Drop repeated targets while the cover is still moving to them
+        target = None
+        if command_id in (
+            WINDOW_COVER_COMMAND_UPOPEN,
+            WINDOW_COVER_COMMAND_DOWNCLOSE,
+        ):
+            # open and close end at either end, depending on inversion
+            target = (command_id, None)
+        elif command_id == WINDOW_COVER_COMMAND_LIFTPERCENT:
+            target = (command_id, args[0])
+        elif command_id == WINDOW_COVER_COMMAND_STOP:
+            self._move_target = None
+        if target is not None:
+            if self._is_moving_to(target):
+                _LOGGER.debug(
+                    "%s Cover is already moving, not sending command 0x%04x %s",
+                    self.endpoint.device.ieee,
+                    command_id,
+                    args,
+                )
+                return self._suppressed_command_response(command_id)
+            self._move_target = target
+            self._last_position = None
+            self._last_move_activity = asyncio.get_running_loop().time()
+
         # Open Close or Stop commands
         tuya_payload = TuyaManufCluster.Command()
         if command_id in (
@@ -1331,6 +1474,12 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
             _LOGGER.debug("Unrecognised command: %x", command_id)
             return foundation.Status.UNSUP_CLUSTER_COMMAND
 
+    async def _suppressed_command_response(self, command_id):
+        """Respond to a command that did not need to be sent."""
+        return foundation.GENERAL_COMMANDS[
+            foundation.GeneralCommand.Default_Response
+        ].schema(command_id=command_id, status=foundation.Status.SUCCESS)
+
 
 class TuyaWindowCover(CustomDevice):
     """Tuya Window cover device."""
@@ -45,6 +45,21 @@ ZEMISMART_VCP_P2_ATTR = ZEMISMART_VCP_ATTR + 1
 ZEMISMART_VCP_P3_ATTR = ZEMISMART_VCP_ATTR + 2
 
 
+def decode_vcp(value) -> tuple[int, int, int]:
+    """Decode a packed Zemismart phase record into (voltage, current, power).
+
+    The 8 byte little endian record holds a 24 bit power, a 24 bit current
+    and a 16 bit voltage, which are extracted from a single integer.
+    """
+    raw = int.from_bytes(bytes(value[:8]), byteorder="little")
+    return raw >> 48, (raw >> 24) & 0xFFFFFF, raw & 0xFFFFFF
+
+
+def decode_hiking_voltage_current(value: int) -> tuple[float, int]:
+    """Decode a packed Hiking record into (voltage, current)."""
+    return (value & 0x0000FFFF) / 10, value >> 16
+
+
 class TuyaManufClusterDinPower(TuyaManufClusterAttributes):
     """Manufacturer Specific Cluster of the Tuya Power Meter device."""
 
@@ -117,6 +132,10 @@ class TuyaPowerMeasurement(LocalDataCluster, ElectricalMeasurement):
         """Ampers reported."""
         self._update_attribute(self.CURRENT_ID, value)
 
+    def voltage_current_reported(self, voltage, current):
+        """Voltage and current reported together."""
+        self.update_attributes({self.CURRENT_ID: current, self.VOLTAGE_ID: voltage})
+
     def frequency_reported(self, value):
         """AC Frequency reported."""
         self._update_attribute(self.AC_FREQUENCY_ID, value)
@@ -170,9 +189,8 @@ class HikingManufClusterDinPower(TuyaManufClusterAttributes):
         elif attrid == HIKING_TOTAL_ENERGY_RECEIVED_ATTR:
             self.endpoint.smartenergy_metering.energy_receive_reported(value / 100)
         elif attrid == HIKING_VOLTAGE_CURRENT_ATTR:
-            self.endpoint.electrical_measurement.current_reported(value >> 16)
-            self.endpoint.electrical_measurement.voltage_reported(
-                (value & 0x0000FFFF) / 10
+            self.endpoint.electrical_measurement.voltage_current_reported(
+                *decode_hiking_voltage_current(value)
             )
         elif attrid == HIKING_POWER_ATTR:
             self.endpoint.electrical_measurement.power_reported(value)
@@ -249,49 +267,28 @@ class ZemismartPowerMeasurement(LocalDataCluster, ElectricalMeasurement):
         },
     ]
 
+    # (voltage, current, power) attribute ids and clamp bus of each phase
+    _phase_records = tuple(
+        (attrs["voltage"], attrs["current"], attrs["power"], bus)
+        for attrs, bus in zip(phase_attributes, "abc")
+    )
+
     # Voltage, current, power is delivered in one value
     def vcp_reported(self, value, phase=0):
         """Voltage, current, power reported."""
         if phase < 0 or phase > 2:
             raise ValueError("Invalid phase. Phase must be 0, 1, or 2.")
 
-        voltage = int.from_bytes(value[6:8], byteorder="little")
-        current = int.from_bytes(value[3:6], byteorder="little")
-        power = int.from_bytes(value[0:3], byteorder="little")
+        voltage_id, current_id, power_id, bus = self._phase_records[phase]
+        voltage, current, power = decode_vcp(value)
 
-        self._update_attribute(self.phase_attributes[phase]["voltage"], voltage)
-        self._update_attribute(self.phase_attributes[phase]["current"], current)
-        self._update_attribute(self.phase_attributes[phase]["power"], power)
-        if phase == 0:
-            self.endpoint.device.clamp_bus["power"]["a"].listener_event(
-                "power_reported", power
-            )
-            self.endpoint.device.clamp_bus["power"]["a"].listener_event(
-                "voltage_reported", voltage
-            )
-            self.endpoint.device.clamp_bus["power"]["a"].listener_event(
-                "current_reported", current
-            )
-        if phase == 1:
-            self.endpoint.device.clamp_bus["power"]["b"].listener_event(
-                "power_reported", power
-            )
-            self.endpoint.device.clamp_bus["power"]["b"].listener_event(
-                "voltage_reported", voltage
-            )
-            self.endpoint.device.clamp_bus["power"]["b"].listener_event(
-                "current_reported", current
-            )
-        if phase == 2:
-            self.endpoint.device.clamp_bus["power"]["c"].listener_event(
-                "power_reported", power
-            )
-            self.endpoint.device.clamp_bus["power"]["c"].listener_event(
-                "voltage_reported", voltage
-            )
-            self.endpoint.device.clamp_bus["power"]["c"].listener_event(
-                "current_reported", current
-            )
+        self.update_attributes(
+            {voltage_id: voltage, current_id: current, power_id: power}
+        )
+        clamp_bus = self.endpoint.device.clamp_bus["power"][bus]
+        clamp_bus.listener_event("power_reported", power)
+        clamp_bus.listener_event("voltage_reported", voltage)
+        clamp_bus.listener_event("current_reported", current)
 
 
 class PowerMeasurement_2Clamp(LocalDataCluster, ElectricalMeasurement):
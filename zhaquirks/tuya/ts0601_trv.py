@@ -1,7 +1,11 @@
 """Map from manufacturer to standard clusters for thermostatic valves."""
 
+from __future__ import annotations
+
+from collections.abc import Iterable
 import logging
 from typing import Optional, Union
+import weakref
 
 from zigpy.profiles import zha
 from zigpy.quirks.v2.homeassistant import UnitOfTemperature
@@ -235,6 +239,93 @@ class data144(t.FixedList, item_type=t.uint8_t, length=18):
     """General data, Discrete, 144 bit."""
 
 
+# fields of a schedule period, in the order of their attribute id offsets
+MOES_SCHEDULE_FIELDS = ("hour", "minute", "temperature")
+
+
+class MoesSchedule:
+    """Immutable Moes day schedule of six (hour, minute, temperature) periods.
+
+    Schedules are interned by their raw ``data144`` encoding, so identical
+    schedules reported by or written to many valves share one instance, along
+    with its decoded periods and attribute values. Temperatures are in
+    centidegrees.
+    """
+
+    __slots__ = ("__weakref__", "_attributes", "periods", "raw")
+
+    _interned: weakref.WeakValueDictionary[bytes, MoesSchedule] = (
+        weakref.WeakValueDictionary()
+    )
+
+    def __new__(cls, raw: Iterable[int]) -> MoesSchedule:
+        """Return the schedule for a raw data144 value."""
+        raw = bytes(raw)
+        schedule = cls._interned.get(raw)
+        if schedule is None:
+            schedule = super().__new__(cls)
+            schedule.raw = raw
+            # the last period comes first, with the hour in the last byte
+            schedule.periods = tuple(
+                (raw[pos + 2] & 0x3F, raw[pos + 1], raw[pos] * 100)
+                for pos in range(15, -1, -3)
+            )
+            schedule._attributes = {}
+            cls._interned[raw] = schedule
+        return schedule
+
+    @classmethod
+    def from_periods(cls, periods: Iterable[tuple[int, int, int]]) -> MoesSchedule:
+        """Return the schedule for six (hour, minute, temperature) periods."""
+        raw = bytearray(18)
+        for pos, (hour, minute, temperature) in zip(range(15, -1, -3), periods):
+            raw[pos : pos + 3] = (round(temperature / 100), minute, hour & 0x3F)
+        return cls(raw)
+
+    def replace(self, period: int, field: int, value: int) -> MoesSchedule:
+        """Return the schedule with one field of a 1-based period replaced."""
+        periods = [list(p) for p in self.periods]
+        periods[period - 1][field] = value
+        return self.from_periods(periods)
+
+    def attributes(self, base: int) -> dict[int, int]:
+        """Return the per field attribute values, for attribute ids from base."""
+        attributes = self._attributes.get(base)
+        if attributes is None:
+            attributes = self._attributes[base] = {
+                base + 0x10 * period + field: value
+                for period, values in enumerate(self.periods, 1)
+                for field, value in enumerate(values)
+            }
+        return attributes
+
+    def to_data144(self) -> data144:
+        """Encode the schedule for the device."""
+        return data144(self.raw)
+
+    def __repr__(self) -> str:
+        """Return schedule representation."""
+        return f"<{type(self).__name__} periods={self.periods}>"
+
+
+MOES_DEFAULT_SCHEDULE = MoesSchedule.from_periods(
+    (
+        (6, 0, 2000),
+        (8, 0, 1500),
+        (11, 30, 1500),
+        (12, 30, 1500),
+        (17, 30, 2000),
+        (22, 0, 1500),
+    )
+)
+
+# schedule attribute to the base id of its per field thermostat attributes
+MOES_SCHEDULE_ATTR_BASES = {
+    MOES_SCHEDULE_WORKDAY_ATTR: 0x4100,
+    MOES_SCHEDULE_WEEKEND_ATTR: 0x4200,
+}
+
+
 class MoesManufCluster(TuyaManufClusterAttributes):
     """Manufacturer Specific Cluster of some thermostatic valves."""
 
@@ -479,47 +570,21 @@ class MoesThermostat(TuyaThermostatCluster):
         "unoccupied_duration_days": (MOES_AWAY_DAYS_ATTR, None),
     }
 
-    WORKDAY_SCHEDULE_ATTRS = {
-        "workday_schedule_6_temperature": 1500,
-        "workday_schedule_6_minute": 0,
-        "workday_schedule_6_hour": 22,
-        "workday_schedule_5_temperature": 2000,
-        "workday_schedule_5_minute": 30,
-        "workday_schedule_5_hour": 17,
-        "workday_schedule_4_temperature": 1500,
-        "workday_schedule_4_minute": 30,
-        "workday_schedule_4_hour": 12,
-        "workday_schedule_3_temperature": 1500,
-        "workday_schedule_3_minute": 30,
-        "workday_schedule_3_hour": 11,
-        "workday_schedule_2_temperature": 1500,
-        "workday_schedule_2_minute": 0,
-        "workday_schedule_2_hour": 8,
-        "workday_schedule_1_temperature": 2000,
-        "workday_schedule_1_minute": 0,
-        "workday_schedule_1_hour": 6,
+    # schedule field attribute name to (schedule attribute, period, field)
+    SCHEDULE_FIELD_ATTRS = {
+        f"{day}_schedule_{period}_{name}": (schedule_attr, period, field)
+        for day, schedule_attr in (
+            ("workday", MOES_SCHEDULE_WORKDAY_ATTR),
+            ("weekend", MOES_SCHEDULE_WEEKEND_ATTR),
+        )
+        for period in range(1, 7)
+        for field, name in enumerate(MOES_SCHEDULE_FIELDS)
     }
 
-    WEEKEND_SCHEDULE_ATTRS = {
-        "weekend_schedule_6_temperature": 1500,
-        "weekend_schedule_6_minute": 0,
-        "weekend_schedule_6_hour": 22,
-        "weekend_schedule_5_temperature": 2000,
-        "weekend_schedule_5_minute": 30,
-        "weekend_schedule_5_hour": 17,
-        "weekend_schedule_4_temperature": 1500,
-        "weekend_schedule_4_minute": 30,
-        "weekend_schedule_4_hour": 12,
-        "weekend_schedule_3_temperature": 1500,
-        "weekend_schedule_3_minute": 30,
-        "weekend_schedule_3_hour": 11,
-        "weekend_schedule_2_temperature": 1500,
-        "weekend_schedule_2_minute": 0,
-        "weekend_schedule_2_hour": 8,
-        "weekend_schedule_1_temperature": 2000,
-        "weekend_schedule_1_minute": 0,
-        "weekend_schedule_1_hour": 6,
-    }
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._schedules: dict[int, MoesSchedule] = {}
 
     def map_attribute(self, attribute, value):
         """Map standardized attribute value to dict of manufacturer values."""
@@ -560,50 +625,49 @@ class MoesThermostat(TuyaThermostatCluster):
                     self.attributes_by_name["operation_preset"].id, 2
                 )
             }
-        if attribute in self.WORKDAY_SCHEDULE_ATTRS:
-            data = data144()
-            for num, (attr, default) in enumerate(self.WORKDAY_SCHEDULE_ATTRS.items()):
-                if num % 3 == 0:
-                    if attr == attribute:
-                        val = round(value / 100)
-                    else:
-                        val = round(
-                            self._attr_cache.get(
-                                self.attributes_by_name[attr].id, default
-                            )
-                            / 100
-                        )
-                elif attr == attribute:
-                    val = value
-                else:
-                    val = self._attr_cache.get(
-                        self.attributes_by_name[attr].id, default
-                    )
-
-                data.append(val)
-            return {MOES_SCHEDULE_WORKDAY_ATTR: data}
-        if attribute in self.WEEKEND_SCHEDULE_ATTRS:
-            data = data144()
-            for num, (attr, default) in enumerate(self.WEEKEND_SCHEDULE_ATTRS.items()):
-                if num % 3 == 0:
-                    if attr == attribute:
-                        val = round(value / 100)
-                    else:
-                        val = round(
-                            self._attr_cache.get(
-                                self.attributes_by_name[attr].id, default
-                            )
-                            / 100
-                        )
-                elif attr == attribute:
-                    val = value
-                else:
-                    val = self._attr_cache.get(
-                        self.attributes_by_name[attr].id, default
-                    )
-
-                data.append(val)
-            return {MOES_SCHEDULE_WEEKEND_ATTR: data}
+        if attribute in self.SCHEDULE_FIELD_ATTRS:
+            schedule_attr, period, field = self.SCHEDULE_FIELD_ATTRS[attribute]
+            schedule = self.current_schedule(schedule_attr).replace(
+                period, field, value
+            )
+            return {schedule_attr: schedule.to_data144()}
+
+    def current_schedule(self, schedule_attr: int) -> MoesSchedule:
+        """Return the last known schedule of a day block."""
+        schedule = self._schedules.get(schedule_attr)
+        if schedule is not None:
+            return schedule
+
+        base = MOES_SCHEDULE_ATTR_BASES[schedule_attr]
+        return MoesSchedule.from_periods(
+            [
+                self._attr_cache.get(base + 0x10 * period + field, default)
+                for field, default in enumerate(defaults)
+            ]
+            for period, defaults in enumerate(MOES_DEFAULT_SCHEDULE.periods, 1)
+        )
+
+    async def write_schedules(
+        self,
+        workday: MoesSchedule | None = None,
+        weekend: MoesSchedule | None = None,
+        manufacturer=None,
+    ):
+        """Write day schedules, sending only the blocks that changed."""
+        manufacturer_attrs = {
+            schedule_attr: schedule.to_data144()
+            for schedule_attr, schedule in (
+                (MOES_SCHEDULE_WORKDAY_ATTR, workday),
+                (MOES_SCHEDULE_WEEKEND_ATTR, weekend),
+            )
+            if schedule is not None
+            and schedule is not self.current_schedule(schedule_attr)
+        }
+        if manufacturer_attrs:
+            await self.endpoint.tuya_manufacturer.write_attributes(
+                manufacturer_attrs, manufacturer=manufacturer
+            )
+        return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
 
     def mode_change(self, value):
         """System Mode change."""
@@ -633,129 +697,11 @@ class MoesThermostat(TuyaThermostatCluster):
 
     def schedule_change(self, attr, value):
         """Scheduler attribute change."""
-
-        if attr == MOES_SCHEDULE_WORKDAY_ATTR:
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_1_hour"].id, value[17] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_1_minute"].id, value[16]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_1_temperature"].id,
-                value[15] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_2_hour"].id, value[14] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_2_minute"].id, value[13]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_2_temperature"].id,
-                value[12] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_3_hour"].id, value[11] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_3_minute"].id, value[10]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_3_temperature"].id,
-                value[9] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_4_hour"].id, value[8] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_4_minute"].id, value[7]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_4_temperature"].id,
-                value[6] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_5_hour"].id, value[5] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_5_minute"].id, value[4]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_5_temperature"].id,
-                value[3] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_6_hour"].id, value[2] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_6_minute"].id, value[1]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_6_temperature"].id,
-                value[0] * 100,
-            )
-        elif attr == MOES_SCHEDULE_WEEKEND_ATTR:
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_1_hour"].id, value[17] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_1_minute"].id, value[16]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_1_temperature"].id,
-                value[15] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_2_hour"].id, value[14] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_2_minute"].id, value[13]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_2_temperature"].id,
-                value[12] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_3_hour"].id, value[11] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_3_minute"].id, value[10]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_3_temperature"].id,
-                value[9] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_4_hour"].id, value[8] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_4_minute"].id, value[7]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_4_temperature"].id,
-                value[6] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_5_hour"].id, value[5] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_5_minute"].id, value[4]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_5_temperature"].id,
-                value[3] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_6_hour"].id, value[2] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_6_minute"].id, value[1]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_6_temperature"].id,
-                value[0] * 100,
-            )
+        schedule = MoesSchedule(value)
+        if self._schedules.get(attr) is schedule:
+            return
+        self._schedules[attr] = schedule
+        self.update_attributes(schedule.attributes(MOES_SCHEDULE_ATTR_BASES[attr]))
 
 
 class MoesThermostatNew(MoesThermostat):
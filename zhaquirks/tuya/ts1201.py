@@ -5,7 +5,10 @@ https://github.com/Koenkk/zigbee-herdsman-converters/blob/9d5e7b902479582581615c
 """
 
 import base64
+from collections import OrderedDict
+import dataclasses
 import logging
+import time
 from typing import Any, Final, Optional, Union
 
 from zigpy.profiles import zgp, zha
@@ -35,6 +38,146 @@ from zhaquirks.const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+IR_CHUNK_SIZE: Final = 0x38
+IR_CODE_CACHE_SIZE: Final = 32
+IR_MAX_SESSIONS: Final = 8
+IR_MAX_CHUNK_RETRIES: Final = 3
+# ZCL header and the non-payload fields of receive_ir_frame_03
+IR_CHUNK_OVERHEAD: Final = 12
+IR_MAX_CHUNK_SIZE: Final = 0xFF
+# chunks sent for a request before the device has taken a pushed chunk
+IR_PROBE_WINDOW: Final = 2
+
+
+def ir_crc(data: bytes) -> int:
+    """Calculate the additive checksum of an IR message part."""
+    return sum(data) % 0x100
+
+
+class ZosungIRCode:
+    """IR message payload, split into chunks with precomputed checksums."""
+
+    __slots__ = ("payload", "_chunks")
+
+    def __init__(self, payload: bytes) -> None:
+        """Init IR code."""
+        self.payload = payload
+        self._chunks: dict[int, tuple[tuple[bytes, int], ...]] = {}
+
+    @classmethod
+    def from_key_code(cls, key_code: str) -> "ZosungIRCode":
+        """Build the IR send message for a base64 key code."""
+        return cls(
+            (
+                f'{{"key_num":1,"delay":300,"key1":'
+                f'{{"num":1,"freq":38000,"type":1,"key_code":"{key_code}"}}}}'
+            ).encode()
+        )
+
+    def chunks(self, maxlen: int) -> tuple[tuple[bytes, int], ...]:
+        """Return all (part, crc) chunks of the payload for the given size."""
+        chunks = self._chunks.get(maxlen)
+        if chunks is None:
+            payload = self.payload
+            chunks = self._chunks[maxlen] = tuple(
+                (part, ir_crc(part))
+                for part in (
+                    payload[pos : pos + maxlen]
+                    for pos in range(0, len(payload), maxlen)
+                )
+            )
+        return chunks
+
+    def chunk(self, position: int, maxlen: int) -> tuple[bytes, int]:
+        """Return the (part, crc) chunk starting at position."""
+        if maxlen <= 0 or position % maxlen:
+            part = self.payload[position : position + maxlen]
+            return part, ir_crc(part)
+        chunks = self.chunks(maxlen)
+        index = position // maxlen
+        if index >= len(chunks):
+            return b"", 0
+        return chunks[index]
+
+
+class ZosungIRCodeCache:
+    """LRU cache of pre-chunked IR codes, keyed by key code."""
+
+    def __init__(self, maxsize: int = IR_CODE_CACHE_SIZE) -> None:
+        """Init cache."""
+        self.maxsize = maxsize
+        self._codes: OrderedDict[str, ZosungIRCode] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return number of cached IR codes."""
+        return len(self._codes)
+
+    def __contains__(self, key_code: str) -> bool:
+        """Return whether the key code is cached."""
+        return key_code in self._codes
+
+    def get(self, key_code: str) -> ZosungIRCode:
+        """Return the cached IR code, building it on a miss."""
+        ir_code = self._codes.get(key_code)
+        if ir_code is not None:
+            self._codes.move_to_end(key_code)
+            return ir_code
+
+        ir_code = self._codes[key_code] = ZosungIRCode.from_key_code(key_code)
+        if len(self._codes) > self.maxsize:
+            self._codes.popitem(last=False)
+        return ir_code
+
+    def clear(self) -> None:
+        """Drop all cached IR codes."""
+        self._codes.clear()
+
+
+# IR codes are immutable once built, so all blasters can share them
+IR_CODE_CACHE = ZosungIRCodeCache()
+
+
+@dataclasses.dataclass
+class ZosungIRLearnSession:
+    """Reassembly state of a learned IR code received from the device."""
+
+    seq: int
+    length: int
+    buffer: bytearray = dataclasses.field(default_factory=bytearray)
+    retries: int = 0
+
+    @property
+    def position(self) -> int:
+        """Next position expected from the device."""
+        return len(self.buffer)
+
+    @property
+    def complete(self) -> bool:
+        """Return whether the whole IR code has been received."""
+        return len(self.buffer) >= self.length
+
+
+@dataclasses.dataclass
+class ZosungIRSendSession:
+    """State of an IR code being sent to the device."""
+
+    seq: int
+    code: ZosungIRCode
+    chunk_size: int = 0
+    chunks: tuple[tuple[bytes, int], ...] = ()
+    window: int = 1
+    next_index: int = 0
+    pushed: set[int] = dataclasses.field(default_factory=set)
+    started: float = dataclasses.field(default_factory=time.monotonic)
+
+
+def _add_session(sessions: dict[int, Any], seq: int, session: Any) -> None:
+    """Register a transfer session, dropping the oldest ones over the limit."""
+    sessions.pop(seq, None)
+    sessions[seq] = session
+    while len(sessions) > IR_MAX_SESSIONS:
+        del sessions[next(iter(sessions))]
+
 
 class Bytes(bytes):
     """Bytes serializable class."""
@@ -120,20 +263,22 @@ class ZosungIRControl(CustomCluster):
                 tsn=tsn,
             )
         elif command_id == self.ServerCommandDefs.IRSend.id:
-            ir_msg = (
-                f'{{"key_num":1,"delay":300,"key1":'
-                f'{{"num":1,"freq":38000,"type":1,"key_code":"{kwargs["code"]}"}}}}'
-            )
-            _LOGGER.debug(
-                "Sending IR code: %s to %s", ir_msg, self.endpoint.device.ieee
-            )
-            seq = self.endpoint.device.next_seq()
-            self.endpoint.device.ir_msg_to_send = {seq: ir_msg}
+            device = self.endpoint.device
+            ir_code = IR_CODE_CACHE.get(kwargs["code"])
+            _LOGGER.debug("Sending IR code: %s to %s", ir_code.payload, device.ieee)
+            seq = device.next_seq()
+            session = ZosungIRSendSession(seq, ir_code)
+            transmit = self.endpoint.zosung_irtransmit
+            if transmit.fast_transfer:
+                session.chunk_size = transmit.max_chunk_size()
+                session.chunks = ir_code.chunks(session.chunk_size)
+                session.window = min(IR_PROBE_WINDOW, transmit.transfer_window)
+            _add_session(device.ir_send_sessions, seq, session)
             self.create_catching_task(
                 self.endpoint.zosung_irtransmit.command(
                     0x00,
                     seq=seq,
-                    length=len(ir_msg),
+                    length=len(ir_code.payload),
                     unk1=0x00000000,
                     clusterid=0xE004,
                     unk2=0x01,
@@ -160,9 +305,14 @@ class ZosungIRTransmit(CustomCluster):
     cluster_id = 0xED00
     ep_attribute = "zosung_irtransmit"
 
-    current_position = 0
-    msg_length = 0
-    ir_msg = []
+    # When enabled, IR codes are sent in the largest chunks the device's
+    # incoming transfer size allows, regardless of the length it asks for.
+    # A chunk request is first answered with one extra chunk as a probe; if
+    # the device takes it instead of asking for it again, following requests
+    # are answered with up to ``transfer_window`` consecutive chunks.
+    # Quirks enable it by using ZosungIRTransmitFast.
+    fast_transfer: bool = False
+    transfer_window: int = 4
 
     class ServerCommandDefs(BaseCommandDefs):
         """Server command definitions."""
@@ -263,6 +413,61 @@ class ZosungIRTransmit(CustomCluster):
             is_manufacturer_specific=True,
         )
 
+    def max_chunk_size(self) -> int:
+        """Largest IR message part fitting the device's incoming transfer size."""
+        node_desc = self.endpoint.device.node_desc
+        if node_desc is None:
+            return IR_CHUNK_SIZE
+        return max(
+            IR_CHUNK_SIZE,
+            min(
+                IR_MAX_CHUNK_SIZE,
+                node_desc.maximum_incoming_transfer_size - IR_CHUNK_OVERHEAD,
+            ),
+        )
+
+    def _send_chunk(self, seq: int, position: int, msgpart: bytes, crc: int):
+        """Send a part of the IR message to the device."""
+        cmd_03_args = {
+            "zero": 0,
+            "seq": seq,
+            "position": position,
+            "msgpart": msgpart,
+            "msgpartcrc": crc,
+        }
+        self.create_catching_task(
+            super().command(0x03, **cmd_03_args, expect_reply=True)
+        )
+
+    def _send_window(self, session: ZosungIRSendSession, position: int) -> None:
+        """Answer a chunk request with a window of precomputed chunks."""
+        size = session.chunk_size
+        chunks = session.chunks
+        index = position // size
+        if position % size or index >= len(chunks):
+            self._send_chunk(session.seq, position, *session.code.chunk(position, size))
+            return
+
+        if index in session.pushed:
+            # the device asks for a chunk it was already sent, so it drops
+            # chunks it did not ask for
+            session.window = 1
+            session.pushed.clear()
+        elif any(pushed < index for pushed in session.pushed):
+            # the device took the pushed chunks, widen the window
+            session.window = min(session.window * 2, self.transfer_window)
+            session.pushed = {pushed for pushed in session.pushed if pushed > index}
+
+        indices = [index]
+        end = min(index + session.window, len(chunks))
+        for ahead in range(max(session.next_index, index + 1), end):
+            session.pushed.add(ahead)
+            indices.append(ahead)
+        session.next_index = max(session.next_index, end, index + 1)
+
+        for i in indices:
+            self._send_chunk(session.seq, i * size, *chunks[i])
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -279,12 +484,15 @@ class ZosungIRTransmit(CustomCluster):
             _LOGGER.debug("Sending default response to %s", self.endpoint.device.ieee)
             self.send_default_rsp(hdr, status=foundation.Status.SUCCESS)
 
+        device = self.endpoint.device
         if hdr.command_id == self.ServerCommandDefs.receive_ir_frame_00.id:
-            _LOGGER.debug("Received IR frame 0x00 from %s", self.endpoint.device.ieee)
+            _LOGGER.debug("Received IR frame 0x00 from %s", device.ieee)
 
-            self.current_position = 0
-            self.ir_msg.clear()
-            self.msg_length = args.length
+            _add_session(
+                device.ir_learn_sessions,
+                args.seq,
+                ZosungIRLearnSession(args.seq, args.length),
+            )
 
             cmd_01_args = {
                 "zero": 0,
@@ -299,7 +507,7 @@ class ZosungIRTransmit(CustomCluster):
             self.create_catching_task(
                 super().command(0x01, **cmd_01_args, expect_reply=True)
             )
-            cmd_02_args = {"seq": args.seq, "position": 0, "maxlen": 0x38}
+            cmd_02_args = {"seq": args.seq, "position": 0, "maxlen": IR_CHUNK_SIZE}
             self.create_catching_task(
                 super().command(0x02, **cmd_02_args, expect_reply=True)
             )
@@ -307,91 +515,117 @@ class ZosungIRTransmit(CustomCluster):
             _LOGGER.debug(
                 "IR-Message-Code01 received, sequence: %s, from %s",
                 args.seq,
-                self.endpoint.device.ieee,
-            )
-            _LOGGER.debug(
-                "Message to send: %s, to %s",
-                self.endpoint.device.ir_msg_to_send[args.seq],
-                self.endpoint.device.ieee,
+                device.ieee,
             )
+            session = device.ir_send_sessions.get(args.seq)
+            if session is not None:
+                _LOGGER.debug(
+                    "Message to send: %s, to %s", session.code.payload, device.ieee
+                )
         elif hdr.command_id == self.ServerCommandDefs.receive_ir_frame_02.id:
             position = args.position
             seq = args.seq
-            maxlen = args.maxlen
-            irmsg = self.endpoint.device.ir_msg_to_send[seq]
-            msgpart = irmsg[position : position + maxlen]
-            calculated_crc = 0
-            for x in msgpart:
-                calculated_crc = (calculated_crc + ord(x)) % 0x100
+            session = device.ir_send_sessions.get(seq)
+            if session is None:
+                _LOGGER.debug(
+                    "Received IR frame 0x02 from %s for unknown sequence %s",
+                    device.ieee,
+                    seq,
+                )
+                return
+            if session.chunk_size:
+                _LOGGER.debug(
+                    "Received IR frame 0x02 from %s, position: %s, maxlen: %s",
+                    device.ieee,
+                    position,
+                    args.maxlen,
+                )
+                self._send_window(session, position)
+                return
+            msgpart, calculated_crc = session.code.chunk(position, args.maxlen)
             _LOGGER.debug(
                 "Received IR frame 0x02 from %s, msgsrc: %s, position: %s, msgpart: %s",
-                self.endpoint.device.ieee,
+                device.ieee,
                 calculated_crc,
                 position,
                 msgpart,
             )
-            cmd_03_args = {
-                "zero": 0,
-                "seq": seq,
-                "position": position,
-                "msgpart": msgpart.encode("utf-8"),
-                "msgpartcrc": calculated_crc,
-            }
-            self.create_catching_task(
-                super().command(0x03, **cmd_03_args, expect_reply=True)
-            )
+            self._send_chunk(seq, position, msgpart, calculated_crc)
         elif hdr.command_id == self.ServerCommandDefs.receive_ir_frame_03.id:
+            session = device.ir_learn_sessions.get(args.seq)
+            if session is None:
+                _LOGGER.debug(
+                    "Received IR frame 0x03 from %s for unknown sequence %s",
+                    device.ieee,
+                    args.seq,
+                )
+                return
             msg_part_crc = args.msgpartcrc
-            calculated_crc = 0
-            for x in args.msgpart:
-                calculated_crc = (calculated_crc + x) % 0x100
+            calculated_crc = ir_crc(args.msgpart)
             _LOGGER.debug(
                 "Received IR frame 0x03 from %s, msgcrc: %s, "
                 "calculated_crc: %s, position: %s",
-                self.endpoint.device.ieee,
+                device.ieee,
                 msg_part_crc,
                 calculated_crc,
                 args.position,
             )
-            self.ir_msg[args.position :] = args.msgpart
-            if args.position + len(args.msgpart) < self.msg_length:
+            if msg_part_crc != calculated_crc or args.position > session.position:
+                session.retries += 1
+                if session.retries > IR_MAX_CHUNK_RETRIES:
+                    _LOGGER.warning(
+                        "Giving up receiving IR code %s from %s", args.seq, device.ieee
+                    )
+                    del device.ir_learn_sessions[args.seq]
+                    return
+                position = session.position
+            else:
+                session.retries = 0
+                session.buffer[args.position :] = args.msgpart
+                position = session.position
+
+            if not session.complete:
                 cmd_02_args = {
                     "seq": args.seq,
-                    "position": args.position + len(args.msgpart),
-                    "maxlen": 0x38,
+                    "position": position,
+                    "maxlen": IR_CHUNK_SIZE,
                 }
                 self.create_catching_task(
                     super().command(0x02, **cmd_02_args, expect_reply=False)
                 )
             else:
-                _LOGGER.debug(
-                    "IR message completely received from %s", self.endpoint.device.ieee
-                )
+                _LOGGER.debug("IR message completely received from %s", device.ieee)
                 cmd_04_args = {"zero0": 0, "seq": args.seq, "zero1": 0}
                 self.create_catching_task(
                     super().command(0x04, **cmd_04_args, expect_reply=False)
                 )
         elif hdr.command_id == self.ServerCommandDefs.receive_ir_frame_04.id:
             seq = args.seq
+            session = device.ir_send_sessions.pop(seq, None)
+            if session is not None:
+                device.last_ir_send_duration = time.monotonic() - session.started
             _LOGGER.debug(
-                "IR code has been sent to %s (seq:%s)", self.endpoint.device.ieee, seq
+                "IR code has been sent to %s (seq:%s, duration: %s)",
+                device.ieee,
+                seq,
+                device.last_ir_send_duration,
             )
             cmd_05_args = {"seq": seq, "zero": 0}
             self.create_catching_task(
                 super().command(0x05, **cmd_05_args, expect_reply=False)
             )
         elif hdr.command_id == self.ServerCommandDefs.receive_ir_frame_05.id:
-            self.endpoint.device.last_learned_ir_code = base64.b64encode(
-                bytes(self.ir_msg)
-            ).decode()
-            _LOGGER.info(
-                "IR message really totally received: %s, from %s",
-                self.endpoint.device.last_learned_ir_code,
-                self.endpoint.device.ieee,
-            )
-            _LOGGER.debug(
-                "Stopping learning mode on device %s", self.endpoint.device.ieee
-            )
+            session = device.ir_learn_sessions.pop(args.seq, None)
+            if session is not None and session.complete:
+                device.last_learned_ir_code = base64.b64encode(
+                    bytes(session.buffer)
+                ).decode()
+                _LOGGER.info(
+                    "IR message really totally received: %s, from %s",
+                    device.last_learned_ir_code,
+                    device.ieee,
+                )
+            _LOGGER.debug("Stopping learning mode on device %s", device.ieee)
             self.create_catching_task(
                 self.endpoint.zosung_ircontrol.command(
                     0x01, on_off=False, expect_reply=False
@@ -401,20 +635,28 @@ class ZosungIRTransmit(CustomCluster):
             _LOGGER.debug(
                 "Unhandled command: %s, from %s",
                 hdr.command_id,
-                self.endpoint.device.ieee,
+                device.ieee,
             )
 
 
+class ZosungIRTransmitFast(ZosungIRTransmit):
+    """Zosung IR Transmit Cluster sending IR codes in windows of large chunks."""
+
+    fast_transfer = True
+
+
 class ZosungIRBlaster(CustomDevice):
     """Zosung IR Blaster."""
 
     seq = -1
-    ir_msg_to_send = {}
     last_learned_ir_code = t.CharacterString("")
+    last_ir_send_duration: Optional[float] = None
 
     def __init__(self, *args, **kwargs):
         """Init device."""
         self.seq = 0
+        self.ir_learn_sessions: dict[int, ZosungIRLearnSession] = {}
+        self.ir_send_sessions: dict[int, ZosungIRSendSession] = {}
         super().__init__(*args, **kwargs)
 
     def next_seq(self):
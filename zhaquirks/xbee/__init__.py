@@ -3,11 +3,19 @@
 See xbee.md for additional information.
 """
 
+from __future__ import annotations
+
+import abc
 import asyncio
 import enum
+import itertools
 import logging
+import time
 from typing import Any, Optional
 
+import zigpy.device
+import zigpy.exceptions
+import zigpy.listeners
 from zigpy.quirks import CustomDevice
 import zigpy.types as t
 from zigpy.zcl import foundation
@@ -19,11 +27,12 @@ from zigpy.zcl.clusters.general import (
     LevelControl,
     OnOff,
 )
+import zigpy.zdo
 
 from zhaquirks import EventableCluster, LocalDataCluster
 from zhaquirks.const import ENDPOINTS, INPUT_CLUSTERS, OUTPUT_CLUSTERS
 
-from .types import ATCommand, BinaryString, Bytes, IOSample
+from .types import ANALOG_PINS, ATCommand, BinaryString, Bytes, IOSample
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,6 +56,14 @@ ATTR_PRESENT_VALUE = 0x0055
 PIN_ANALOG_OUTPUT = 2
 
 REMOTE_AT_COMMAND_TIMEOUT = 30
+# Serial stream defaults, NP reports the actual maximum payload of a device
+SERIAL_DEFAULT_MAX_PAYLOAD = 84
+SERIAL_SEND_WINDOW = 4
+SERIAL_STREAM_LIMIT = 2**16
+# Remote AT commands of a batch awaiting a response at the same time
+REMOTE_AT_BATCH_WINDOW = 8
+# Frame id 0 disables the response, so 255 ids are usable per device
+MAX_PENDING_AT_REQUESTS = 32
 
 
 # https://github.com/zigpy/zigpy-xbee/blob/dev/zigpy_xbee/api.py
@@ -166,6 +183,25 @@ AT_COMMANDS = {
     # "CE": t.uint8_t,
 }
 
+# AT parameters that never change for a given radio
+AT_STATIC_PARAMETERS = frozenset({"SH", "SL", "VR", "HV", "NP", "DD"})
+# AT parameters that change with every read and are never cached
+AT_VOLATILE_PARAMETERS = frozenset({"TP", "%V", "DB", "IS", "NC", "PP"})
+# Execution commands, sent every time even when called without a parameter
+AT_EXECUTION_COMMANDS = frozenset(
+    {"AC", "WR", "RE", "FR", "NR", "CB", "DN", "AS", "DA", "CN", "SI"}
+)
+# Execution commands after which no cached parameter can be trusted
+AT_CACHE_RESET_COMMANDS = frozenset({"RE", "FR", "NR"})
+AT_SLOW_PARAMETER_TTL = 300
+
+# Cache TTL of readable AT parameters, None for static ones
+AT_COMMAND_CACHE_TTL = {
+    name: None if name in AT_STATIC_PARAMETERS else AT_SLOW_PARAMETER_TTL
+    for name in AT_COMMANDS
+    if name not in AT_VOLATILE_PARAMETERS and name not in AT_EXECUTION_COMMANDS
+}
+
 # 4 AO lines
 # 10 digital
 # Discovered endpoint information: <SimpleDescriptor endpoint=232 profile=49413
@@ -201,6 +237,233 @@ class ATCommandResult(enum.IntEnum):
     TX_FAILURE = 4
 
 
+class PendingATRequests:
+    """Remote AT command requests of a single XBee awaiting a response.
+
+    Allocates frame ids that are not in flight, bounds the number of in flight
+    requests and forgets a request as soon as its future is done, including
+    when it times out.
+    """
+
+    def __init__(self, max_pending: int = MAX_PENDING_AT_REQUESTS) -> None:
+        """Init."""
+        if not 1 <= max_pending <= 255:
+            raise ValueError(f"max_pending must be between 1 and 255: {max_pending}")
+        self._pending: dict[int, asyncio.Future] = {}
+        self._next_frame_id = 1
+        self._slots = asyncio.Semaphore(max_pending)
+
+    def __len__(self) -> int:
+        """Return the number of requests in flight."""
+        return len(self._pending)
+
+    def __contains__(self, frame_id: int) -> bool:
+        """Return True if a request with frame_id is in flight."""
+        return frame_id in self._pending
+
+    def _allocate_frame_id(self) -> int:
+        frame_id = self._next_frame_id
+        while frame_id in self._pending:
+            frame_id = (frame_id % 255) + 1
+        self._next_frame_id = (frame_id % 255) + 1
+        return frame_id
+
+    async def reserve(self) -> tuple[int, asyncio.Future]:
+        """Wait for a free slot and return a new frame id and its future."""
+        await self._slots.acquire()
+        frame_id = self._allocate_frame_id()
+        future = asyncio.get_running_loop().create_future()
+        self._pending[frame_id] = future
+        future.add_done_callback(lambda fut: self._release(frame_id, fut))
+        return frame_id, future
+
+    def _release(self, frame_id: int, future: asyncio.Future) -> None:
+        if self._pending.get(frame_id) is future:
+            del self._pending[frame_id]
+        self._slots.release()
+
+    def get(self, frame_id: int) -> asyncio.Future | None:
+        """Return the pending future of frame_id if it is still awaited."""
+        future = self._pending.get(frame_id)
+        if future is None or future.done():
+            return None
+        return future
+
+
+class ATParameterCache:
+    """Read-through cache of the AT parameters of a single XBee."""
+
+    def __init__(self, ttls: dict[str, float | None] = AT_COMMAND_CACHE_TTL) -> None:
+        """Init."""
+        self._ttls = ttls
+        self._values: dict[str, tuple[Any, float | None]] = {}
+
+    def __contains__(self, command: str) -> bool:
+        """Return True if command has a valid cached value."""
+        return self.get(command) is not None
+
+    def get(self, command: str) -> Any:
+        """Return the cached value of command, None if unknown or expired."""
+        entry = self._values.get(command)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and expires <= time.monotonic():
+            del self._values[command]
+            return None
+        return value
+
+    def set(self, command: str, value: Any) -> None:
+        """Cache the value read for command if it is cacheable."""
+        if value is None or command not in self._ttls:
+            return
+        ttl = self._ttls[command]
+        self._values[command] = (
+            value,
+            None if ttl is None else time.monotonic() + ttl,
+        )
+
+    def invalidate(self, command: str | None = None) -> None:
+        """Forget the cached value of command, or of all commands."""
+        if command is None:
+            self._values.clear()
+        else:
+            self._values.pop(command, None)
+
+
+class XBeeSerialStream:
+    """Stream style access to the serial interface of an XBee.
+
+    Incoming serial data is reassembled into records split on delimiter, or
+    prefixed by a big endian length of length_prefix bytes, or returned as it
+    arrives without framing. Outgoing data is split into fragments of the
+    maximum payload of the device, which are sent one after another so they
+    arrive in order. At most window writes are queued, writers wait for a free
+    slot.
+    """
+
+    def __init__(
+        self,
+        device: XBeeCommon,
+        *,
+        delimiter: bytes | None = None,
+        length_prefix: int | None = None,
+        max_payload: int | None = None,
+        window: int = SERIAL_SEND_WINDOW,
+        limit: int = SERIAL_STREAM_LIMIT,
+    ) -> None:
+        """Init."""
+        if delimiter is not None and length_prefix is not None:
+            raise ValueError("Use either a delimiter or a length prefix")
+        self._device = device
+        self._delimiter = delimiter
+        self._length_prefix = length_prefix
+        self._max_payload = max_payload
+        self._window = asyncio.Semaphore(window)
+        self._in_flight: set[asyncio.Task] = set()
+        self._last_write: asyncio.Task | None = None
+        self._error: Exception | None = None
+        self._limit = limit
+        self.reader = asyncio.StreamReader(limit=limit)
+
+    def feed_data(self, data: bytes) -> None:
+        """Add serial data received from the device."""
+        self.reader.feed_data(data)
+
+    def close(self) -> None:
+        """Signal the end of the serial data."""
+        self.reader.feed_eof()
+
+    async def read_record(self) -> bytes:
+        """Return the next record received from the device."""
+        if self._delimiter is not None:
+            record = await self.reader.readuntil(self._delimiter)
+            return record[: -len(self._delimiter)]
+        if self._length_prefix is not None:
+            length = int.from_bytes(
+                await self.reader.readexactly(self._length_prefix), "big"
+            )
+            return await self.reader.readexactly(length)
+        return await self.reader.read(self._limit)
+
+    async def write_record(self, record: bytes) -> None:
+        """Frame a record and send it to the device."""
+        if self._delimiter is not None:
+            record += self._delimiter
+        elif self._length_prefix is not None:
+            record = len(record).to_bytes(self._length_prefix, "big") + record
+        await self.write(record)
+
+    async def write(self, data: bytes) -> None:
+        """Send data to the device, waiting while the send window is full."""
+        max_payload = await self._get_max_payload()
+        await self._window.acquire()
+        try:
+            self._raise_error()
+        except Exception:
+            self._window.release()
+            raise
+        task = asyncio.create_task(
+            self._send_after(self._last_write, memoryview(data), max_payload)
+        )
+        self._last_write = task
+        self._in_flight.add(task)
+        task.add_done_callback(self._sent)
+
+    async def drain(self) -> None:
+        """Wait until every fragment has been sent."""
+        if self._in_flight:
+            await asyncio.wait(self._in_flight)
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    async def _get_max_payload(self) -> int:
+        if self._max_payload is None:
+            try:
+                self._max_payload = await self._device.remote_at("NP")
+            except Exception:  # noqa: BLE001
+                self._max_payload = SERIAL_DEFAULT_MAX_PAYLOAD
+            self._max_payload = self._max_payload or SERIAL_DEFAULT_MAX_PAYLOAD
+        return self._max_payload
+
+    async def _send_after(
+        self, previous: asyncio.Task | None, view: memoryview, max_payload: int
+    ) -> None:
+        if previous is not None:
+            await asyncio.wait([previous])
+        for offset in range(0, len(view), max_payload):
+            await self._send(bytes(view[offset : offset + max_payload]))
+
+    async def _send(self, fragment: bytes) -> None:
+        application = self._device.application
+        status, _ = await application.request(
+            self._device,
+            XBEE_PROFILE_ID,
+            XBEE_DATA_CLUSTER,
+            XBEE_DATA_ENDPOINT,
+            XBEE_DATA_ENDPOINT,
+            application.get_sequence(),
+            fragment,
+            expect_reply=False,
+        )
+        if status != foundation.Status.SUCCESS:
+            raise zigpy.exceptions.DeliveryError(
+                f"Failed to send serial data: {status}", status
+            )
+
+    def _sent(self, task: asyncio.Task) -> None:
+        self._in_flight.discard(task)
+        if self._last_write is task:
+            self._last_write = None
+        self._window.release()
+        if not task.cancelled() and task.exception() is not None:
+            self._error = task.exception()
+
+
 class XBeeBasic(LocalDataCluster, Basic):
     """XBee Basic Cluster."""
 
@@ -288,15 +551,43 @@ class XBeeRemoteATRequest(LocalDataCluster):
         for k, v in zip(range(1, len(AT_COMMANDS) + 1), AT_COMMANDS.items())
     }
 
-    _seq: int = 1
+    @property
+    def _pending_requests(self) -> PendingATRequests:
+        return self._endpoint.in_clusters[XBEE_AT_RESPONSE_CLUSTER].pending_requests
 
-    def _save_at_request(self, frame_id, future):
-        self._endpoint.in_clusters[XBEE_AT_RESPONSE_CLUSTER].save_at_request(
-            frame_id, future
-        )
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self.parameter_cache = ATParameterCache()
+
+    async def remote_at_command(
+        self, cmd_name, *args, apply_changes=True, refresh=False, **kwargs
+    ):
+        """Execute a Remote AT Command and Return Response.
+
+        Parameter reads are served from the parameter cache unless refresh is
+        set, writes and reset commands invalidate it.
+        """
+        if not args and not refresh:
+            value = self.parameter_cache.get(cmd_name)
+            if value is not None:
+                return value
+
+        try:
+            value = await self._send_remote_at_command(
+                cmd_name, *args, apply_changes=apply_changes, **kwargs
+            )
+        finally:
+            if args:
+                self.parameter_cache.invalidate(cmd_name)
+            elif cmd_name in AT_CACHE_RESET_COMMANDS:
+                self.parameter_cache.invalidate()
 
-    def remote_at_command(self, cmd_name, *args, apply_changes=True, **kwargs):
-        """Execute a Remote AT Command and Return Response."""
+        if not args:
+            self.parameter_cache.set(cmd_name, value)
+        return value
+
+    def _send_remote_at_command(self, cmd_name, *args, apply_changes=True, **kwargs):
         if hasattr(self._endpoint.device.application, "remote_at_command"):
             return self._endpoint.device.application.remote_at_command(
                 self._endpoint.device.nwk,
@@ -326,8 +617,7 @@ class XBeeRemoteATRequest(LocalDataCluster):
 
     async def _command(self, options, command, data, *args):
         _LOGGER.debug("Command %s %s", command, data)
-        frame_id = self._seq
-        self._seq = (self._seq % 255) + 1
+        frame_id, future = await self._pending_requests.reserve()
         schema = (
             t.uint8_t,
             t.uint8_t,
@@ -352,9 +642,6 @@ class XBeeRemoteATRequest(LocalDataCluster):
             schema,
         )
 
-        future = asyncio.Future()
-        self._save_at_request(frame_id, future)
-
         try:
             await self._endpoint.device.application.request(
                 self._endpoint.device,
@@ -416,16 +703,38 @@ class XBeeRemoteATRequest(LocalDataCluster):
         ].schema(command_id=command_id, status=foundation.Status.SUCCESS)
 
 
-class XBeeRemoteATResponse(LocalDataCluster):
+class XBeePayloadCluster(LocalDataCluster, metaclass=abc.ABCMeta):
+    """Cluster receiving raw XBee frames without a ZCL header."""
+
+    @abc.abstractmethod
+    def payload_args(self, data: bytes) -> dict[str, Any]:
+        """Decode the fields of the command carried by a raw frame."""
+
+    def decode_payload(self, data: bytes):
+        """Decode a raw frame into the arguments of its command."""
+        return self.server_commands[0x0000].schema(**self.payload_args(data))
+
+
+class XBeeRemoteATResponse(XBeePayloadCluster):
     """Remote AT Command Response Cluster."""
 
     cluster_id = XBEE_AT_RESPONSE_CLUSTER
 
-    _awaiting = {}
-
-    def save_at_request(self, frame_id, future):
-        """Save pending request."""
-        self._awaiting[frame_id] = (future,)
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self.pending_requests = PendingATRequests()
+
+    def payload_args(self, data: bytes) -> dict[str, Any]:
+        """Decode a remote AT command response frame."""
+        if len(data) < 4:
+            raise ValueError(f"Remote AT command response is too short: {data!r}")
+        return {
+            "frame_id": data[0],
+            "cmd": ATCommand(data[1:3]),
+            "status": data[3],
+            "value": Bytes(data[4:]),
+        }
 
     def handle_cluster_request(
         self,
@@ -440,7 +749,12 @@ class XBeeRemoteATResponse(LocalDataCluster):
                 "Remote AT command response: %s",
                 (args.frame_id, args.cmd, args.status, args.value),
             )
-            (fut,) = self._awaiting.pop(args.frame_id)
+            fut = self.pending_requests.get(args.frame_id)
+            if fut is None:
+                _LOGGER.debug(
+                    "No pending remote AT command for frame id %s", args.frame_id
+                )
+                return
             try:
                 status = ATCommandResult(args.status)
             except ValueError:
@@ -476,11 +790,23 @@ class XBeeRemoteATResponse(LocalDataCluster):
     }
 
 
-class XBeeDigitalIOCluster(LocalDataCluster, BinaryInput):
+class XBeeDigitalIOCluster(XBeePayloadCluster, BinaryInput):
     """Digital IO Cluster for the XBee."""
 
     cluster_id = XBEE_IO_CLUSTER
 
+    # Minimum change in raw ADC counts of an analog sample to be propagated
+    analog_deadband: int = 0
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._last_analog: list[int | None] = [None] * ANALOG_PINS
+
+    def payload_args(self, data: bytes) -> dict[str, Any]:
+        """Decode an IO sample frame."""
+        return {"io_sample": IOSample.deserialize(data)[0]}
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -490,32 +816,34 @@ class XBeeDigitalIOCluster(LocalDataCluster, BinaryInput):
     ):
         """Handle the cluster request.
 
-        Update the digital pin states
+        Update the pin states that differ from the current attribute values
         """
         if hdr.command_id == SAMPLE_DATA_CMD:
             values = args.io_sample
-            if "digital_samples" in values:
-                # Update digital inputs
-                active_pins = [
-                    i for i, x in enumerate(values["digital_samples"]) if x is not None
-                ]
-                for pin in active_pins:
-                    # pylint: disable=W0212
-                    self._endpoint.device[0xD0 + pin].on_off._update_attribute(
-                        ATTR_ON_OFF, values["digital_samples"][pin]
-                    )
-            if "analog_samples" in values:
-                # Update analog inputs
-                active_pins = [
-                    i for i, x in enumerate(values["analog_samples"]) if x is not None
-                ]
-                for pin in active_pins:
-                    # pylint: disable=W0212
-                    self._endpoint.device[0xD0 + pin].analog_input._update_attribute(
-                        ATTR_PRESENT_VALUE,
-                        values["analog_samples"][pin]
-                        / (10.23 if pin != 7 else 1000),  # supply voltage is in mV
-                    )
+            device = self._endpoint.device
+            for pin, value in enumerate(values.get("digital_samples", ())):
+                if value is None:
+                    continue
+                on_off = device[0xD0 + pin].on_off
+                # compare with the attribute, on/off commands also change it
+                if on_off._attr_cache.get(ATTR_ON_OFF) == value:
+                    continue
+                # pylint: disable=W0212
+                on_off._update_attribute(ATTR_ON_OFF, value)
+
+            last_analog = self._last_analog
+            for pin, value in enumerate(values.get("analog_samples", ())):
+                if value is None:
+                    continue
+                last = last_analog[pin]
+                if last is not None and abs(value - last) <= self.analog_deadband:
+                    continue
+                last_analog[pin] = value
+                # pylint: disable=W0212
+                device[0xD0 + pin].analog_input._update_attribute(
+                    ATTR_PRESENT_VALUE,
+                    value / (10.23 if pin != 7 else 1000),  # supply voltage is in mV
+                )
         else:
             super().handle_cluster_request(hdr, args)
 
@@ -549,12 +877,16 @@ class XBeeEventRelayCluster(EventableCluster, LocalDataCluster, LevelControl):
     )
 
 
-class XBeeSerialDataCluster(LocalDataCluster):
+class XBeeSerialDataCluster(XBeePayloadCluster):
     """Serial Data Cluster for the XBee."""
 
     cluster_id = XBEE_DATA_CLUSTER
     ep_attribute = "xbee_serial_data"
 
+    def payload_args(self, data: bytes) -> dict[str, Any]:
+        """Decode a serial data frame."""
+        return {"data": BinaryString(str(data, encoding="latin1"))}
+
     async def command(
         self,
         command_id,
@@ -592,7 +924,10 @@ class XBeeSerialDataCluster(LocalDataCluster):
         dst_addressing: Optional[t.AddrMode] = None,
     ):
         """Handle incoming data."""
-        if hdr.command_id == DATA_IN_CMD:
+        stream = self._endpoint.device.serial_stream
+        if hdr.command_id == DATA_IN_CMD and stream is not None:
+            stream.feed_data(args.data.serialize())
+        elif hdr.command_id == DATA_IN_CMD:
             self._endpoint.out_clusters[LevelControl.cluster_id].handle_cluster_request(
                 hdr, {"data": args.data}
             )
@@ -619,6 +954,23 @@ class XBeeSerialDataCluster(LocalDataCluster):
 class XBeeCommon(CustomDevice):
     """XBee common class."""
 
+    serial_stream: XBeeSerialStream | None = None
+
+    def open_serial_stream(self, **kwargs) -> XBeeSerialStream:
+        """Relay serial data through a stream instead of events.
+
+        Keyword arguments are passed to XBeeSerialStream.
+        """
+        self.close_serial_stream()
+        self.serial_stream = XBeeSerialStream(self, **kwargs)
+        return self.serial_stream
+
+    def close_serial_stream(self) -> None:
+        """Close the serial stream and relay serial data as events again."""
+        if self.serial_stream is not None:
+            self.serial_stream.close()
+            self.serial_stream = None
+
     def remote_at(self, command, *args, **kwargs):
         """Remote at command."""
         return (
@@ -627,15 +979,110 @@ class XBeeCommon(CustomDevice):
             .remote_at_command(command, *args, apply_changes=True, **kwargs)
         )
 
-    def deserialize(self, endpoint_id, cluster_id, data):
-        """Deserialize."""
-        if endpoint_id == 0:
-            return super().deserialize(endpoint_id, cluster_id, data)
-        tsn = self._application.get_sequence()
-        command_id = 0x0000
-        hdr = foundation.ZCLHeader.cluster(tsn, command_id)
-        data = hdr.serialize() + data
-        return super().deserialize(endpoint_id, cluster_id, data)
+    async def remote_at_batch(
+        self, commands, *, window=REMOTE_AT_BATCH_WINDOW, write=False
+    ):
+        """Pipeline remote AT commands and apply the changes once.
+
+        Each command is a command name or a tuple of a command name and its
+        parameter. Up to window commands are awaiting a response at a time and
+        changes are applied by a single trailing AC, followed by WR if write is
+        set. Returns the result of each command, or the exception it raised,
+        followed by those of the AC and WR commands that were sent. WR is not
+        sent if AC failed.
+        """
+        at_request = self.endpoints[XBEE_AT_ENDPOINT].out_clusters[
+            XBEE_AT_REQUEST_CLUSTER
+        ]
+        commands = [(cmd,) if isinstance(cmd, str) else tuple(cmd) for cmd in commands]
+        slots = asyncio.Semaphore(window)
+
+        async def _remote_at(command, *args):
+            async with slots:
+                return await at_request.remote_at_command(
+                    command, *args, apply_changes=False
+                )
+
+        results = await asyncio.gather(
+            *(_remote_at(*cmd) for cmd in commands), return_exceptions=True
+        )
+        if any(
+            len(cmd) > 1 and not isinstance(result, Exception)
+            for cmd, result in zip(commands, results)
+        ):
+            for command in ("AC", "WR") if write else ("AC",):
+                try:
+                    result = await at_request.remote_at_command(
+                        command, apply_changes=False
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    results.append(exc)
+                    break
+                results.append(result)
+        return results
+
+    async def refresh_at_parameters(self, *commands):
+        """Drop cached AT parameters and read the given ones from the radio."""
+        at_request = self.endpoints[XBEE_AT_ENDPOINT].out_clusters[
+            XBEE_AT_REQUEST_CLUSTER
+        ]
+        if not commands:
+            at_request.parameter_cache.invalidate()
+        for command in commands:
+            at_request.parameter_cache.invalidate(command)
+        return dict(zip(commands, await self.remote_at_batch(commands)))
+
+    def packet_received(self, packet: t.ZigbeePacket) -> None:
+        """Decode raw XBee frames directly with their cluster's schema.
+
+        Frames for XBee clusters carry no ZCL header, so they are decoded
+        without building, serializing and parsing a synthetic one. They are
+        debounced and offered to request listeners like any other packet, but
+        can't answer a pending request. Other packets use the generic path.
+        """
+        cluster = None
+        if packet.src_ep != zigpy.zdo.ZDO_ENDPOINT and packet.src_ep in self.endpoints:
+            cluster = self.endpoints[packet.src_ep].in_clusters.get(packet.cluster_id)
+        if not isinstance(cluster, XBeePayloadCluster):
+            super().packet_received(packet)
+            return
+
+        self.last_seen = packet.timestamp
+        if packet.lqi is not None:
+            self.lqi = packet.lqi
+        if packet.rssi is not None:
+            self.rssi = packet.rssi
+
+        if self._packet_debouncer.filter(
+            obj=packet.replace(timestamp=None, tsn=None, lqi=None, rssi=None),
+            expire_in=zigpy.device.PACKET_DEBOUNCE_WINDOW,
+        ):
+            self.debug("Filtering duplicate packet")
+            return
+
+        try:
+            args = cluster.decode_payload(packet.data.serialize())
+        except Exception as exc:  # noqa: BLE001
+            self.debug("Failed to parse packet %r", packet, exc_info=exc)
+            return
+
+        # the APS counter stands in for the tsn the frame doesn't have
+        hdr = foundation.ZCLHeader.cluster(packet.tsn or 0, 0x0000)
+
+        for listener in itertools.chain(
+            self._application._req_listeners[zigpy.listeners.ANY_DEVICE],
+            self._application._req_listeners[self],
+        ):
+            if listener.resolve(hdr, args) and isinstance(
+                listener, zigpy.listeners.FutureListener
+            ):
+                break
+
+        cluster.handle_message(
+            hdr,
+            args,
+            dst_addressing=packet.dst.addr_mode if packet.dst is not None else None,
+        )
 
     replacement = {
         ENDPOINTS: {
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import struct
+
 
 class Bytes(bytes):
     """Bytes serializable class."""
@@ -39,6 +41,20 @@ class BinaryString(str):
         return (cls(data), b"")
 
 
+DIGITAL_PINS = 15
+ANALOG_PINS = 8
+
+_IO_SAMPLE_HEADER = struct.Struct(">BHB")
+_DIGITAL_SAMPLE = struct.Struct(">H")
+_DIGITAL_MASK = (1 << DIGITAL_PINS) - 1
+
+# pins set in each possible 8 bit mask, lowest pin first
+_MASK_PINS = tuple(
+    tuple(bit for bit in range(8) if mask & (1 << bit)) for mask in range(256)
+)
+_ANALOG_SAMPLES = tuple(struct.Struct(f">{n}H") for n in range(ANALOG_PINS + 1))
+
+
 class IOSample(dict):
     """Parse an XBee IO sample report."""
 
@@ -55,48 +71,38 @@ class IOSample(dict):
         Digital samples byte 4, 5 (if any sample exists)
         Analog Sample, 2 bytes per
         """
-        sample_sets = int.from_bytes(data[0:1], byteorder="big")
+        if len(data) < _IO_SAMPLE_HEADER.size:
+            raise ValueError(f"IO sample is too short: {data!r}")
+        sample_sets, digital_mask, analog_mask = _IO_SAMPLE_HEADER.unpack_from(data)
         if sample_sets != 1:
             raise ValueError("Number of sets is not 1")
-        digital_mask = data[1:3]
-        analog_mask = data[3:4]
-        digital_sample = data[4:6]
-        num_bits = 15
-        digital_pins = [
-            (int.from_bytes(digital_mask, byteorder="big") >> bit) & 1
-            for bit in range(num_bits - 1, -1, -1)
-        ]
-        digital_pins = list(reversed(digital_pins))
-        analog_pins = [
-            (int.from_bytes(analog_mask, byteorder="big") >> bit) & 1
-            for bit in range(8 - 1, -1, -1)
-        ]
-        analog_pins = list(reversed(analog_pins))
-        if 1 in digital_pins:
-            digital_samples: list[int | None] = [
-                (int.from_bytes(digital_sample, byteorder="big") >> bit) & 1
-                for bit in range(num_bits - 1, -1, -1)
-            ]
-            digital_samples = list(reversed(digital_samples))
-            sample_index = 6
-        else:
-            # skip digital samples block
-            digital_samples = digital_pins
-            sample_index = 4
-        analog_samples = []
-        for apin in analog_pins:
-            if apin == 1:
-                analog_samples.append(
-                    int.from_bytes(
-                        data[sample_index : sample_index + 2], byteorder="big"
-                    )
-                )
-                sample_index += 2
-            else:
-                analog_samples.append(None)
-        for dpin in range(len(digital_pins)):
-            if digital_pins[dpin] == 0:
-                digital_samples[dpin] = None
+
+        digital_mask &= _DIGITAL_MASK
+        analog_pins = _MASK_PINS[analog_mask]
+        analog_struct = _ANALOG_SAMPLES[len(analog_pins)]
+        if len(data) < (
+            _IO_SAMPLE_HEADER.size
+            + (_DIGITAL_SAMPLE.size if digital_mask else 0)
+            + analog_struct.size
+        ):
+            raise ValueError(f"IO sample is too short: {data!r}")
+
+        digital_samples: list[int | None] = [None] * DIGITAL_PINS
+        sample_index = _IO_SAMPLE_HEADER.size
+        if digital_mask:
+            (digital_sample,) = _DIGITAL_SAMPLE.unpack_from(data, sample_index)
+            sample_index += _DIGITAL_SAMPLE.size
+            for pin in _MASK_PINS[digital_mask & 0xFF]:
+                digital_samples[pin] = (digital_sample >> pin) & 1
+            for pin in _MASK_PINS[digital_mask >> 8]:
+                digital_samples[pin + 8] = (digital_sample >> (pin + 8)) & 1
+
+        analog_samples: list[int | None] = [None] * ANALOG_PINS
+        if analog_pins:
+            values = analog_struct.unpack_from(data, sample_index)
+            sample_index += analog_struct.size
+            for pin, value in zip(analog_pins, values):
+                analog_samples[pin] = value
 
         return (
             {
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterator, Mapping
+import functools
 import logging
 import math
+import time
+from types import MappingProxyType
 from typing import Any
 
 from zigpy import types as t
@@ -45,6 +48,9 @@ from zhaquirks.const import (
     ATTRIBUTE_NAME,
     COMMAND_ATTRIBUTE_UPDATED,
     COMMAND_TRIPLE,
+    MANUFACTURER,
+    MODEL as SIGNATURE_MODEL,
+    MODELS_INFO,
     UNKNOWN,
     VALUE,
     ZHA_SEND_EVENT,
@@ -94,6 +100,13 @@ XIAOMI_ATTR_4 = "X-attrib-4"
 XIAOMI_ATTR_5 = "X-attrib-5"
 XIAOMI_ATTR_6 = "X-attrib-6"
 XIAOMI_MIJA_ATTRIBUTE = 0xFF02
+# Xiaomi attributes reported as "Character String" with a possibly wrong length
+XIAOMI_STRING_ATTRIBUTES = frozenset(
+    (XIAOMI_AQARA_ATTRIBUTE, XIAOMI_MIJA_ATTRIBUTE, XIAOMI_AQARA_ATTRIBUTE_E1)
+)
+_XIAOMI_STRING_PREFIXES = tuple(
+    attr_id.to_bytes(2, "little") + b"\x42" for attr_id in XIAOMI_STRING_ATTRIBUTES
+)
 XIAOMI_NODE_DESC = NodeDescriptor(
     byte1=2,
     byte2=64,
@@ -107,8 +120,264 @@ XIAOMI_NODE_DESC = NodeDescriptor(
 )
 
 
+# Names of the values in the 0xFF01/0x00F7 heartbeat shared by all Aqara models
+AQARA_ATTRIBUTE_NAMES: Mapping[int, str] = MappingProxyType(
+    {
+        1: BATTERY_VOLTAGE_MV,
+        3: TEMPERATURE,
+        4: XIAOMI_ATTR_4,
+        5: XIAOMI_ATTR_5,
+        6: XIAOMI_ATTR_6,
+        10: PATH,
+    }
+)
+
+_AQARA_PLUG_ATTRIBUTE_NAMES = {149: CONSUMPTION, 150: VOLTAGE, 152: POWER}
+
+# Model specific additions to the heartbeat value names
+_AQARA_MODEL_ATTRIBUTE_NAMES: dict[str, dict[int, str]] = {
+    # Temperature sensors send temperature/humidity/pressure updates through this
+    # cluster instead of the respective clusters
+    "lumi.sensor_ht": {
+        100: TEMPERATURE_MEASUREMENT,
+        101: HUMIDITY_MEASUREMENT,
+        102: PRESSURE_MEASUREMENT,
+    },
+    "lumi.sens": {
+        100: TEMPERATURE_MEASUREMENT,
+        101: HUMIDITY_MEASUREMENT,
+        102: PRESSURE_MEASUREMENT,
+    },
+    "lumi.weather": {
+        100: TEMPERATURE_MEASUREMENT,
+        101: HUMIDITY_MEASUREMENT,
+        102: PRESSURE_MEASUREMENT_PRECISION,
+    },
+    "lumi.airmonitor.acn01": {
+        100: TEMPERATURE_MEASUREMENT,
+        101: HUMIDITY_MEASUREMENT,
+        102: TVOC_MEASUREMENT,
+    },
+    "lumi.sensor_ht.agl02": {
+        100: TEMPERATURE_MEASUREMENT,
+        101: HUMIDITY_MEASUREMENT,
+        102: PRESSURE_MEASUREMENT,
+    },
+    "lumi.plug": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.plug.maus01": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.plug.maeu01": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.plug.mmeu01": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.relay.c2acn01": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.switch.n0agl1": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.switch.n0acn2": _AQARA_PLUG_ATTRIBUTE_NAMES,
+    "lumi.sensor_motion.aq2": {11: ILLUMINANCE_MEASUREMENT},
+    "lumi.curtain.acn002": {101: BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE},
+    "lumi.motion.agl02": {101: ILLUMINANCE_MEASUREMENT},
+    "lumi.motion.ac02": {
+        101: ILLUMINANCE_MEASUREMENT,
+        105: DETECTION_INTERVAL,
+        106: MOTION_SENSITIVITY,
+    },
+    "lumi.motion.acn001": {101: ILLUMINANCE_MEASUREMENT},
+    "lumi.motion.agl04": {
+        102: DETECTION_INTERVAL,
+        105: MOTION_SENSITIVITY,
+        258: DETECTION_INTERVAL,
+        268: MOTION_SENSITIVITY,
+    },
+    "lumi.motion.ac01": {
+        5: POWER_OUTAGE_COUNT,
+        101: PRESENCE_DETECTED,
+        102: PRESENCE_EVENT,
+        103: MONITORING_MODE,
+        105: APPROACH_DISTANCE,
+        268: MOTION_SENSITIVITY,
+        322: PRESENCE_DETECTED,
+        323: PRESENCE_EVENT,
+        324: MONITORING_MODE,
+        326: APPROACH_DISTANCE,
+    },
+    "lumi.sensor_smoke.acn03": {
+        160: SMOKE,
+        161: SMOKE_DENSITY,
+        162: SELF_TEST,
+        163: BUZZER_MANUAL_MUTE,
+        164: HEARTBEAT_INDICATOR,
+        165: LINKAGE_ALARM,
+    },
+}
+
+# Complete, read-only heartbeat value names per model
+AQARA_MODEL_ATTRIBUTE_NAMES: Mapping[str, Mapping[int, str]] = MappingProxyType(
+    {
+        model: MappingProxyType({**AQARA_ATTRIBUTE_NAMES, **names})
+        for model, names in _AQARA_MODEL_ATTRIBUTE_NAMES.items()
+    }
+)
+
+# Heartbeat value -> (endpoint cluster, attribute id or handler method, scaling)
+XIAOMI_HEARTBEAT_TARGETS: Mapping[
+    str, tuple[tuple[str, int | str, Callable[[Any], Any]], ...]
+] = MappingProxyType(
+    {
+        BATTERY_VOLTAGE_MV: (("power", "battery_reported", lambda v: v),),
+        TEMPERATURE_MEASUREMENT: (
+            (
+                "temperature",
+                TemperatureMeasurement.AttributeDefs.measured_value.id,
+                lambda v: v,
+            ),
+        ),
+        HUMIDITY_MEASUREMENT: (
+            (
+                "humidity",
+                RelativeHumidity.AttributeDefs.measured_value.id,
+                lambda v: v,
+            ),
+        ),
+        PRESSURE_MEASUREMENT: (
+            (
+                "pressure",
+                PressureMeasurement.AttributeDefs.measured_value.id,
+                lambda v: v,
+            ),
+        ),
+        PRESSURE_MEASUREMENT_PRECISION: (
+            (
+                "pressure",
+                PressureMeasurement.AttributeDefs.measured_value.id,
+                lambda v: v / 100,
+            ),
+        ),
+        POWER: (
+            (
+                "electrical_measurement",
+                ElectricalMeasurement.AttributeDefs.active_power.id,
+                lambda v: round(v * 10),
+            ),
+        ),
+        CONSUMPTION: (
+            (
+                "electrical_measurement",
+                ElectricalMeasurement.AttributeDefs.total_active_power.id,
+                lambda v: round(v * 1000),
+            ),
+            (
+                "smartenergy_metering",
+                Metering.AttributeDefs.current_summ_delivered.id,
+                lambda v: round(v * 1000),
+            ),
+        ),
+        VOLTAGE: (
+            (
+                "electrical_measurement",
+                ElectricalMeasurement.AttributeDefs.rms_voltage.id,
+                lambda v: v * 0.1,
+            ),
+        ),
+        ILLUMINANCE_MEASUREMENT: (
+            (
+                "illuminance",
+                IlluminanceMeasurement.AttributeDefs.measured_value.id,
+                lambda v: v,
+            ),
+        ),
+        TVOC_MEASUREMENT: (("voc_level", 0x0000, lambda v: v),),
+        TEMPERATURE: (
+            (
+                "device_temperature",
+                DeviceTemperature.AttributeDefs.current_temperature.id,
+                lambda v: v * 100,
+            ),
+        ),
+        BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE: (
+            ("power", "battery_percent_reported", lambda v: v),
+        ),
+        SMOKE: (("ias_zone", IasZone.AttributeDefs.zone_status.id, lambda v: v),),
+    }
+)
+
+
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on report positions explored while repairing string lengths
+MAX_ATTR_REPORT_BRANCHES = 256
+
+# Seconds to ignore an uninitialized device after it failed to quick init
+QUICK_INIT_NEGATIVE_CACHE_TTL = 30
+
+# model -> QuickInit quirks for that model, newest first like the quirk registry
+_QUICK_INIT_QUIRKS: dict[str, list[type[XiaomiQuickInitDevice]]] = {}
+
+# IEEE -> monotonic time until which its messages are ignored
+_QUICK_INIT_NEGATIVE_CACHE: dict[t.EUI64, float] = {}
+
+
+def _attribute_report_offset(message: bytes) -> int | None:
+    """Return where the records of a global attribute report start, if it is one.
+
+    Only the frame control and command id are inspected, the header is not parsed.
+    """
+    if not message:
+        return None
+
+    frame_control = foundation.FrameControl(message[0])
+
+    if frame_control.is_cluster:
+        return None
+
+    # Frame control, optional manufacturer code and TSN precede the command id
+    command_offset = 4 if frame_control.is_manufacturer_specific else 2
+
+    if (
+        len(message) <= command_offset
+        or message[command_offset] != foundation.GeneralCommand.Report_Attributes
+    ):
+        return None
+
+    return command_offset + 1
+
+
+def _attribute_record_size(data: memoryview, position: int) -> int | None:
+    """Return the encoded size of the attribute record at a position, if known.
+
+    Only fixed size values and (long) strings are sized, other types return ``None``.
+    """
+    try:
+        data_type = foundation.DataType.from_type_id(data[position + 2])
+    except (KeyError, ValueError):
+        return None
+
+    if data_type.type_id in (
+        foundation.DataTypeId.octstr,
+        foundation.DataTypeId.string,
+    ):
+        return 4 + data[position + 3] if len(data) > position + 3 else None
+
+    if data_type.type_id in (
+        foundation.DataTypeId.octstr16,
+        foundation.DataTypeId.string16,
+    ):
+        if len(data) < position + 5:
+            return None
+
+        return 5 + int.from_bytes(data[position + 3 : position + 5], "little")
+
+    size = getattr(data_type.python_type, "_size", None) or getattr(
+        data_type.python_type, "_length", None
+    )
+
+    return None if size is None else 3 + size
+
+
+def _may_have_xiaomi_strings(message: bytes, offset: int) -> bool:
+    """Check if an attribute report could contain Xiaomi string attributes.
+
+    Every such record starts with its attribute id followed by the "Character String"
+    type, so a report without any of these byte sequences can be parsed as is.
+    """
+    return any(message.find(prefix, offset) != -1 for prefix in _XIAOMI_STRING_PREFIXES)
+
 
 class XiaomiCustomDevice(CustomDevice):
     """Custom device representing xiaomi devices."""
@@ -123,100 +392,215 @@ class XiaomiCustomDevice(CustomDevice):
 class XiaomiQuickInitDevice(XiaomiCustomDevice, QuickInitDevice):
     """Xiaomi devices eligible for QuickInit."""
 
+    def __init_subclass__(cls) -> None:
+        """Index the quirk by the LUMI models it matches."""
+        super().__init_subclass__()
+
+        if cls.signature is None:
+            return
+
+        models_info = cls.signature.get(MODELS_INFO)
+
+        if not models_info:
+            models_info = [
+                (cls.signature.get(MANUFACTURER), cls.signature.get(SIGNATURE_MODEL))
+            ]
+
+        for manufacturer, model in models_info:
+            if manufacturer != LUMI:
+                continue
+
+            quirks = _QUICK_INIT_QUIRKS.setdefault(model, [])
+
+            if cls not in quirks:
+                quirks.insert(0, cls)
+
+        # Devices that failed before might match the new quirk
+        _QUICK_INIT_NEGATIVE_CACHE.clear()
+
+
+def get_quick_init_quirks(model: str) -> list[type[XiaomiQuickInitDevice]]:
+    """Return the registered QuickInit quirks for a LUMI model."""
+    quirks = _QUICK_INIT_QUIRKS.get(model)
+
+    if not quirks:
+        return []
+
+    # Skip quirks that have been removed from the registry since
+    registered = zigpy.quirks.get_quirk_list(LUMI, model)
+
+    return [quirk for quirk in quirks if quirk in registered]
+
 
 class XiaomiCluster(CustomCluster):
     """Xiaomi cluster implementation."""
 
+    _aqara_names: tuple[str, Mapping[int, str]] | None = None
+    _heartbeat_table: (
+        dict[str, tuple[tuple[Callable[..., Any], Callable[[Any], Any]], ...]] | None
+    ) = None
+
     def _iter_parse_attr_report(
-        self, data: bytes
-    ) -> Iterator[tuple[foundation.Attribute, bytes]]:
-        """Yield all interpretations of the first attribute in a Xiaomi report."""
+        self, data: memoryview, position: int
+    ) -> Iterator[tuple[foundation.Attribute, int]]:
+        """Yield all interpretations of the attribute at a position in a Xiaomi report.
+
+        Each interpretation is yielded along with the position where it ends.
+        """
 
         # Peek at the attribute report
-        attr_id, data = t.uint16_t.deserialize(data)
-        attr_type, data = t.uint8_t.deserialize(data)
+        if len(data) < position + 3:
+            raise ValueError(f"Data is too short to contain an attribute: {data!r}")
+
+        attr_id = int.from_bytes(data[position : position + 2], "little")
+        attr_type = data[position + 2]
 
         if (
-            attr_id
-            not in (
-                XIAOMI_AQARA_ATTRIBUTE,
-                XIAOMI_MIJA_ATTRIBUTE,
-                XIAOMI_AQARA_ATTRIBUTE_E1,
-            )
+            attr_id not in XIAOMI_STRING_ATTRIBUTES
             or attr_type != 0x42  # "Character String"
         ):
-            # Assume other attributes are reported correctly
-            data = attr_id.serialize() + attr_type.serialize() + data
-            attribute, data = foundation.Attribute.deserialize(data)
+            # Assume other attributes are reported correctly. Only copy the record
+            # itself, copying the rest of the report would be quadratic.
+            size = _attribute_record_size(data, position)
+            record = bytes(
+                data[position:] if size is None else data[position : position + size]
+            )
+            attribute, remaining = foundation.Attribute.deserialize(record)
 
-            yield attribute, data
+            yield attribute, position + len(record) - len(remaining)
             return
 
+        if len(data) < position + 4:
+            raise ValueError(f"Data is too short to contain a string: {data!r}")
+
         # Length of the "string" can be wrong
-        val_len, data = t.uint8_t.deserialize(data)
+        val_len = data[position + 3]
+        start = position + 4
 
         # Try every offset. Start with 0 to pass unbroken reports through.
         for offset in (0, -1, 1):
-            fixed_len = val_len + offset
+            end = start + val_len + offset
 
-            if len(data) < fixed_len:
+            if not start <= end <= len(data):
                 continue
 
-            val, final_data = data[:fixed_len], data[fixed_len:]
-            attr_val = t.LVBytes(val)
-            attr_type = 0x41  # The data type should be "Octet String"
-
             yield (
                 foundation.Attribute(
-                    attrid=attr_id,
-                    value=foundation.TypeValue(type=attr_type, value=attr_val),
+                    attrid=t.uint16_t(attr_id),
+                    # The data type should be "Octet String"
+                    value=foundation.TypeValue(
+                        type=0x41, value=t.LVBytes(data[start:end])
+                    ),
                 ),
-                final_data,
+                end,
             )
 
-    def _interpret_attr_reports(
-        self, data: bytes
-    ) -> Iterable[tuple[foundation.Attribute]]:
-        """Yield all valid interprations of a Xiaomi attribute report."""
+    def _parse_attr_reports(
+        self, data: bytes | memoryview
+    ) -> tuple[list[foundation.Attribute], int] | None:
+        """Parse a Xiaomi attribute report, repairing broken string lengths.
+
+        Attributes are parsed greedily, backtracking through the alternative
+        string lengths only when the rest of the report fails to parse. Results
+        are memoized per position, so every position is parsed at most once and
+        at most ``MAX_ATTR_REPORT_BRANCHES`` positions are explored in total.
+
+        Returns the first valid interpretation in (0, -1, +1) offset order and
+        the number of valid interpretations, or ``None`` if there are none.
+        """
+
+        data = memoryview(data)
+        end = len(data)
+        # position -> (attribute, next position, interpretations) or None
+        memo: dict[int, tuple[foundation.Attribute | None, int, int] | None] = {
+            end: (None, end, 1)
+        }
+        branches = 0
 
-        if not data:
-            yield ()
-            return
+        def parse(
+            position: int,
+        ) -> tuple[foundation.Attribute | None, int, int] | None:
+            nonlocal branches
 
-        try:
-            parsed = list(self._iter_parse_attr_report(data))
-        except (KeyError, ValueError):
-            return
+            if position in memo:
+                return memo[position]
+
+            memo[position] = None
+            branches += 1
+
+            if branches > MAX_ATTR_REPORT_BRANCHES:
+                return None
+
+            try:
+                candidates = list(self._iter_parse_attr_report(data, position))
+            except (KeyError, ValueError):
+                return None
+
+            result = None
+            count = 0
+
+            for attr, next_position in candidates:
+                parsed = parse(next_position)
+
+                if parsed is None:
+                    continue
+
+                if result is None:
+                    result = (attr, next_position)
 
-        for attr, remaining_data in parsed:
-            for remaining_attrs in self._interpret_attr_reports(remaining_data):
-                yield (attr,) + remaining_attrs
+                count += parsed[2]
+
+            if result is not None:
+                memo[position] = (*result, count)
+
+            return memo[position]
+
+        parsed = parse(0)
+
+        if parsed is None:
+            return None
+
+        attrs = []
+        count = parsed[2]
+
+        while parsed[0] is not None:
+            attrs.append(parsed[0])
+            parsed = memo[parsed[1]]
+
+        return attrs, count
 
     def deserialize(self, data):
         """Deserialize cluster data."""
-        hdr, data = foundation.ZCLHeader.deserialize(data)
+        offset = _attribute_report_offset(data)
 
-        # Only handle attribute reports differently
-        if (
-            hdr.frame_control.frame_type != foundation.FrameType.GLOBAL_COMMAND
-            or hdr.command_id != foundation.GeneralCommand.Report_Attributes
-        ):
-            return super().deserialize(hdr.serialize() + data)
+        # Only attribute reports with Xiaomi strings need to be handled differently
+        if offset is None or not _may_have_xiaomi_strings(data, offset):
+            return super().deserialize(data)
 
-        reports = list(self._interpret_attr_reports(data))
+        hdr, _ = foundation.ZCLHeader.deserialize(data[:offset])
+        parsed = self._parse_attr_reports(memoryview(data)[offset:])
 
-        if not reports:
-            _LOGGER.warning("Failed to parse Xiaomi attribute report: %r", data)
-            return super().deserialize(hdr.serialize() + data)
-        elif len(reports) > 1:
+        if parsed is None:
             _LOGGER.warning(
-                "Xiaomi attribute report has multiple valid interpretations: %r",
-                reports,
+                "Failed to parse Xiaomi attribute report: %r", data[offset:]
             )
+            return super().deserialize(data)
 
-        fixed_data = b"".join(attr.serialize() for attr in reports[0])
+        attrs, count = parsed
 
-        return super().deserialize(hdr.serialize() + fixed_data)
+        if count > 1:
+            _LOGGER.warning(
+                "Xiaomi attribute report has %d valid interpretations, using %r",
+                count,
+                attrs,
+            )
+
+        command = foundation.GENERAL_COMMANDS[hdr.command_id]
+        hdr.frame_control.direction = command.direction
+        response = command.schema(attribute_reports=attrs)
+        self.debug("Decoded ZCL frame: %s:%r", type(self).__name__, response)
+
+        return hdr, response
 
     def _update_attribute(self, attrid, value):
         if attrid in (XIAOMI_AQARA_ATTRIBUTE, XIAOMI_AQARA_ATTRIBUTE_E1):
@@ -256,172 +640,82 @@ class XiaomiCluster(CustomCluster):
             attrid,
             attributes,
         )
-        if BATTERY_VOLTAGE_MV in attributes:
-            # many Xiaomi devices report this, but not all quirks implement the XiaomiPowerConfiguration cluster,
-            # so we might error out if the method doesn't exist
-            if hasattr(self.endpoint.power, "battery_reported") and callable(
-                self.endpoint.power.battery_reported
-            ):
-                self.endpoint.power.battery_reported(attributes[BATTERY_VOLTAGE_MV])
-            else:
-                # log a debug message if the cluster is not implemented
-                _LOGGER.debug(
-                    "%s - Xiaomi battery voltage attribute received but XiaomiPowerConfiguration not used",
-                    self.endpoint.device.ieee,
-                )
-
-        if TEMPERATURE_MEASUREMENT in attributes:
-            self.endpoint.temperature.update_attribute(
-                TemperatureMeasurement.AttributeDefs.measured_value.id,
-                attributes[TEMPERATURE_MEASUREMENT],
-            )
-
-        if HUMIDITY_MEASUREMENT in attributes:
-            self.endpoint.humidity.update_attribute(
-                RelativeHumidity.AttributeDefs.measured_value.id,
-                attributes[HUMIDITY_MEASUREMENT],
-            )
-
-        if PRESSURE_MEASUREMENT in attributes:
-            self.endpoint.pressure.update_attribute(
-                PressureMeasurement.AttributeDefs.measured_value.id,
-                attributes[PRESSURE_MEASUREMENT],
-            )
-
-        if PRESSURE_MEASUREMENT_PRECISION in attributes:
-            self.endpoint.pressure.update_attribute(
-                PressureMeasurement.AttributeDefs.measured_value.id,
-                attributes[PRESSURE_MEASUREMENT_PRECISION] / 100,
-            )
+        targets = self._heartbeat_targets()
+        for key, attr_value in attributes.items():
+            handlers = targets.get(key)
+            if handlers is None:
+                continue
 
-        if POWER in attributes:
-            self.endpoint.electrical_measurement.update_attribute(
-                ElectricalMeasurement.AttributeDefs.active_power.id,
-                round(attributes[POWER] * 10),
-            )
+            for handler, scale in handlers:
+                handler(scale(attr_value))
 
-        if CONSUMPTION in attributes:
-            zcl_consumption = round(attributes[CONSUMPTION] * 1000)
-            self.endpoint.electrical_measurement.update_attribute(
-                ElectricalMeasurement.AttributeDefs.total_active_power.id,
-                zcl_consumption,
-            )
-            self.endpoint.smartenergy_metering.update_attribute(
-                Metering.AttributeDefs.current_summ_delivered.id, zcl_consumption
-            )
+    def _heartbeat_targets(
+        self,
+    ) -> dict[str, tuple[tuple[Callable[..., Any], Callable[[Any], Any]], ...]]:
+        """Return the heartbeat fan-out table for this cluster's endpoint.
 
-        if VOLTAGE in attributes:
-            self.endpoint.electrical_measurement.update_attribute(
-                ElectricalMeasurement.AttributeDefs.rms_voltage.id,
-                attributes[VOLTAGE] * 0.1,
-            )
+        The table is built on first use, once all clusters of the endpoint exist.
+        Targets whose cluster or handler is missing are left out of it.
+        """
+        if self._heartbeat_table is not None:
+            return self._heartbeat_table
 
-        if ILLUMINANCE_MEASUREMENT in attributes:
-            self.endpoint.illuminance.update_attribute(
-                IlluminanceMeasurement.AttributeDefs.measured_value.id,
-                attributes[ILLUMINANCE_MEASUREMENT],
-            )
+        table = {}
 
-        if TVOC_MEASUREMENT in attributes:
-            self.endpoint.voc_level.update_attribute(
-                0x0000, attributes[TVOC_MEASUREMENT]
-            )
+        for key, targets in XIAOMI_HEARTBEAT_TARGETS.items():
+            handlers = []
 
-        if TEMPERATURE in attributes:
-            if hasattr(self.endpoint, "device_temperature"):
-                self.endpoint.device_temperature.update_attribute(
-                    DeviceTemperature.AttributeDefs.current_temperature.id,
-                    attributes[TEMPERATURE] * 100,
-                )
+            for ep_attribute, target, scale in targets:
+                cluster = getattr(self.endpoint, ep_attribute, None)
 
-        if BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE in attributes:
-            self.endpoint.power.battery_percent_reported(
-                attributes[BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE]
+                if isinstance(target, str):
+                    handler = getattr(cluster, target, None)
+                elif cluster is not None:
+                    handler = functools.partial(cluster.update_attribute, target)
+                else:
+                    handler = None
+
+                if not callable(handler) and key == BATTERY_VOLTAGE_MV:
+                    # many Xiaomi devices report this, but not all quirks implement
+                    # the XiaomiPowerConfiguration cluster
+                    _LOGGER.debug(
+                        "%s - Xiaomi battery voltage attribute received but XiaomiPowerConfiguration not used",
+                        self.endpoint.device.ieee,
+                    )
+                    continue
+                elif not callable(handler):
+                    _LOGGER.debug(
+                        "%s - Xiaomi %s attribute has no target cluster %s",
+                        self.endpoint.device.ieee,
+                        key,
+                        ep_attribute,
+                    )
+                    continue
+
+                handlers.append((handler, scale))
+
+            if handlers:
+                table[key] = tuple(handlers)
+
+        self._heartbeat_table = table
+        return table
+
+    def _aqara_attribute_names(self) -> Mapping[int, str]:
+        """Return the heartbeat value names for this device's model."""
+        model = self.endpoint.device.model
+
+        if self._aqara_names is None or self._aqara_names[0] != model:
+            self._aqara_names = (
+                model,
+                AQARA_MODEL_ATTRIBUTE_NAMES.get(model, AQARA_ATTRIBUTE_NAMES),
             )
 
-        if SMOKE in attributes:
-            self.endpoint.ias_zone.update_attribute(
-                IasZone.AttributeDefs.zone_status.id, attributes[SMOKE]
-            )
+        return self._aqara_names[1]
 
     def _parse_aqara_attributes(self, value):
         """Parse non-standard attributes."""
         attributes = {}
-        attribute_names = {
-            1: BATTERY_VOLTAGE_MV,
-            3: TEMPERATURE,
-            4: XIAOMI_ATTR_4,
-            5: XIAOMI_ATTR_5,
-            6: XIAOMI_ATTR_6,
-            10: PATH,
-        }
-
-        if self.endpoint.device.model in [
-            "lumi.sensor_ht",
-            "lumi.sens",
-            "lumi.weather",
-            "lumi.airmonitor.acn01",
-            "lumi.sensor_ht.agl02",
-        ]:
-            # Temperature sensors send temperature/humidity/pressure updates through this
-            # cluster instead of the respective clusters
-            attribute_names.update(
-                {
-                    100: TEMPERATURE_MEASUREMENT,
-                    101: HUMIDITY_MEASUREMENT,
-                    102: TVOC_MEASUREMENT
-                    if self.endpoint.device.model == "lumi.airmonitor.acn01"
-                    else PRESSURE_MEASUREMENT_PRECISION
-                    if self.endpoint.device.model == "lumi.weather"
-                    else PRESSURE_MEASUREMENT,
-                }
-            )
-        elif self.endpoint.device.model in [
-            "lumi.plug",
-            "lumi.plug.maus01",
-            "lumi.plug.maeu01",
-            "lumi.plug.mmeu01",
-            "lumi.relay.c2acn01",
-            "lumi.switch.n0agl1",
-            "lumi.switch.n0acn2",
-        ]:
-            attribute_names.update({149: CONSUMPTION, 150: VOLTAGE, 152: POWER})
-        elif self.endpoint.device.model == "lumi.sensor_motion.aq2":
-            attribute_names.update({11: ILLUMINANCE_MEASUREMENT})
-        elif self.endpoint.device.model == "lumi.curtain.acn002":
-            attribute_names.update({101: BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE})
-        elif self.endpoint.device.model in [
-            "lumi.motion.agl02",
-            "lumi.motion.ac02",
-            "lumi.motion.acn001",
-        ]:
-            attribute_names.update({101: ILLUMINANCE_MEASUREMENT})
-            if self.endpoint.device.model == "lumi.motion.ac02":
-                attribute_names.update({105: DETECTION_INTERVAL})
-                attribute_names.update({106: MOTION_SENSITIVITY})
-        elif self.endpoint.device.model == "lumi.motion.agl04":
-            attribute_names.update({102: DETECTION_INTERVAL})
-            attribute_names.update({105: MOTION_SENSITIVITY})
-            attribute_names.update({258: DETECTION_INTERVAL})
-            attribute_names.update({268: MOTION_SENSITIVITY})
-        elif self.endpoint.device.model == "lumi.motion.ac01":
-            attribute_names.update({5: POWER_OUTAGE_COUNT})
-            attribute_names.update({101: PRESENCE_DETECTED})
-            attribute_names.update({102: PRESENCE_EVENT})
-            attribute_names.update({103: MONITORING_MODE})
-            attribute_names.update({105: APPROACH_DISTANCE})
-            attribute_names.update({268: MOTION_SENSITIVITY})
-            attribute_names.update({322: PRESENCE_DETECTED})
-            attribute_names.update({323: PRESENCE_EVENT})
-            attribute_names.update({324: MONITORING_MODE})
-            attribute_names.update({326: APPROACH_DISTANCE})
-        elif self.endpoint.device.model == "lumi.sensor_smoke.acn03":
-            attribute_names.update({160: SMOKE})
-            attribute_names.update({161: SMOKE_DENSITY})
-            attribute_names.update({162: SELF_TEST})
-            attribute_names.update({163: BUZZER_MANUAL_MUTE})
-            attribute_names.update({164: HEARTBEAT_INDICATOR})
-            attribute_names.update({165: LINKAGE_ALARM})
+        attribute_names = self._aqara_attribute_names()
         result = {}
 
         # Some attribute reports end with a stray null byte
@@ -730,6 +1024,17 @@ class OnOffCluster(OnOff, CustomCluster):
         )
 
 
+def _ignore_quick_init(ieee: t.EUI64) -> None:
+    """Skip quick init of a device for QUICK_INIT_NEGATIVE_CACHE_TTL seconds."""
+    now = time.monotonic()
+
+    for cached_ieee, ignore_until in list(_QUICK_INIT_NEGATIVE_CACHE.items()):
+        if ignore_until <= now:
+            del _QUICK_INIT_NEGATIVE_CACHE[cached_ieee]
+
+    _QUICK_INIT_NEGATIVE_CACHE[ieee] = now + QUICK_INIT_NEGATIVE_CACHE_TTL
+
+
 def handle_quick_init(
     sender: zigpy.device.Device,
     profile: int,
@@ -739,7 +1044,18 @@ def handle_quick_init(
     message: bytes,
 ) -> bool | None:
     """Handle message from an uninitialized device which could be a xiaomi."""
-    if src_ep == 0:
+    if src_ep == 0 or cluster != Basic.cluster_id:
+        return
+
+    ignore_until = _QUICK_INIT_NEGATIVE_CACHE.get(sender.ieee)
+
+    if ignore_until is not None:
+        if time.monotonic() < ignore_until:
+            return
+
+        del _QUICK_INIT_NEGATIVE_CACHE[sender.ieee]
+
+    if _attribute_report_offset(message) is None:
         return
 
     hdr, data = foundation.ZCLHeader.deserialize(message)
@@ -751,12 +1067,6 @@ def handle_quick_init(
         hdr,
         data,
     )
-    if hdr.frame_control.is_cluster:
-        return
-
-    if hdr.command_id not in foundation.COMMANDS:
-        sender.debug("Unknown ZCL global command: %s", hdr.command_id)
-        return
 
     try:
         params, data = foundation.COMMANDS[hdr.command_id].schema.deserialize(data)
@@ -766,12 +1076,6 @@ def handle_quick_init(
 
     sender.debug("Uninitialized device command '%s' params: %s", hdr.command_id, params)
 
-    if (
-        hdr.command_id != foundation.GeneralCommand.Report_Attributes
-        or cluster != 0x0000
-    ):
-        return
-
     for attr_rec in params.attribute_reports:
         # model_name
         if attr_rec.attrid == 0x0005:
@@ -784,10 +1088,7 @@ def handle_quick_init(
     if not model:
         return
 
-    for quirk in zigpy.quirks.get_quirk_list(LUMI, model):
-        if not issubclass(quirk, XiaomiQuickInitDevice):
-            continue
-
+    for quirk in get_quick_init_quirks(model):
         sender.debug("Found '%s' quirk for '%s' model", quirk.__name__, model)
 
         try:
@@ -797,6 +1098,8 @@ def handle_quick_init(
             continue
         break
     else:
+        # The model won't change, so skip this device's reports for a while
+        _ignore_quick_init(sender.ieee)
         return
 
     sender.cancel_initialization()
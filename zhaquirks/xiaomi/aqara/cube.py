@@ -1,5 +1,7 @@
 """Xiaomi mija lumi cube device."""
 
+from types import MappingProxyType
+
 from zigpy.profiles import zha
 from zigpy.zcl.clusters.general import (
     AnalogInput,
@@ -156,6 +158,29 @@ def extend_dict(dictionary, value, ranges):
 extend_dict(MOVEMENT_TYPE, FLIP, range(FLIP_BEGIN, FLIP_END))
 
 
+def movement_event_args(value, action):
+    """Return the event arguments of a movement type value."""
+    event_args = {VALUE: value}
+    if action in (SLIDE, KNOCK):
+        event_args[DESCRIPTION] = MOVEMENT_TYPE_DESCRIPTION[value]
+        event_args[ACTIVATED_FACE] = SIDES[value]
+
+    if action == FLIP:
+        if value > 108:
+            event_args[FLIP_DEGREES] = 180
+        else:
+            event_args[FLIP_DEGREES] = 90
+            event_args[DEACTIVATED_FACE] = (value // 8) % 8 + 1
+        event_args[ACTIVATED_FACE] = (value % 8) + 1
+    return event_args
+
+
+MOVEMENT_EVENTS = {
+    value: (action, MappingProxyType(movement_event_args(value, action)))
+    for value, action in MOVEMENT_TYPE.items()
+}
+
+
 class Cube(XiaomiQuickInitDevice):
     """Aqara magic cube device."""
 
@@ -175,24 +200,10 @@ class Cube(XiaomiQuickInitDevice):
         def _update_attribute(self, attrid, value):
             super()._update_attribute(attrid, value)
             if attrid == STATUS_TYPE_ATTR:
-                self._current_state[STATUS_TYPE_ATTR] = action = MOVEMENT_TYPE.get(
-                    value
-                )
-                event_args = {VALUE: value}
+                action, event_args = MOVEMENT_EVENTS.get(value, (None, None))
+                self._current_state[STATUS_TYPE_ATTR] = action
                 if action is not None:
-                    if action in (SLIDE, KNOCK):
-                        event_args[DESCRIPTION] = MOVEMENT_TYPE_DESCRIPTION[value]
-                        event_args[ACTIVATED_FACE] = SIDES[value]
-
-                    if action == FLIP:
-                        if value > 108:
-                            event_args[FLIP_DEGREES] = 180
-                        else:
-                            event_args[FLIP_DEGREES] = 90
-                            event_args[DEACTIVATED_FACE] = (value // 8) % 8 + 1
-                        event_args[ACTIVATED_FACE] = (value % 8) + 1
-
-                    self.listener_event(ZHA_SEND_EVENT, action, event_args)
+                    self.listener_event(ZHA_SEND_EVENT, action, dict(event_args))
 
                 # show something in the sensor in HA
                 super()._update_attribute(0, action)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+import dataclasses
 import logging
-from typing import Any
+import struct
+from typing import Any, NamedTuple
 
 from zigpy import types
 from zigpy.profiles import zgp, zha
@@ -58,6 +61,7 @@ ZCL_CHILD_LOCK = 0x138F
 ZCL_FEEDING_MODE = 0x1390
 ZCL_SERVING_SIZE = 0x1391
 ZCL_PORTION_WEIGHT = 0x1392
+ZCL_FEEDING_SCHEDULE = 0x1393
 
 AQARA_TO_ZCL: dict[int, int] = {
     FEEDING: ZCL_FEEDING,
@@ -67,6 +71,7 @@ AQARA_TO_ZCL: dict[int, int] = {
     FEEDING_MODE: ZCL_FEEDING_MODE,
     SERVING_SIZE: ZCL_SERVING_SIZE,
     PORTION_WEIGHT: ZCL_PORTION_WEIGHT,
+    SCHEDULING_STRING: ZCL_FEEDING_SCHEDULE,
 }
 
 ZCL_TO_AQARA: dict[int, int] = {
@@ -77,11 +82,157 @@ ZCL_TO_AQARA: dict[int, int] = {
     ZCL_SERVING_SIZE: SERVING_SIZE,
     ZCL_PORTION_WEIGHT: PORTION_WEIGHT,
     ZCL_ERROR_DETECTED: ERROR_DETECTED,
+    ZCL_FEEDING_SCHEDULE: SCHEDULING_STRING,
 }
 
+# Feeder TLV layout: reserved byte, direction, sequence, attribute id, value length
+FEEDER_PREFIX = struct.Struct(">xBBi")
+FEEDER_HEADER = struct.Struct(">xBBiB")
+FEEDER_DIRECTION_WRITE = 0x02
+FEEDER_DIRECTION_REPORT = 0x05
+
+# Aqara attribute id -> python type of its value, integers are big endian
+FEEDER_VALUE_TYPES: dict[int, type] = {
+    FEEDING: int,
+    FEEDING_REPORT: str,
+    PORTIONS_DISPENSED: int,
+    WEIGHT_DISPENSED: int,
+    ERROR_DETECTED: int,
+    SCHEDULING_STRING: str,
+    DISABLE_LED_INDICATOR: int,
+    CHILD_LOCK: int,
+    FEEDING_MODE: int,
+    SERVING_SIZE: int,
+    PORTION_WEIGHT: int,
+}
+
+# value length used when writing an attribute, the device expects 4 bytes here
+FEEDER_WRITE_LENGTHS: dict[int, int] = {
+    SERVING_SIZE: 4,
+    PORTION_WEIGHT: 4,
+}
+
+FEEDER_INT_FORMATS: dict[int, struct.Struct] = {
+    1: struct.Struct(">B"),
+    2: struct.Struct(">H"),
+    4: struct.Struct(">I"),
+}
+
+# schedule entries are hex encoded: days, hour, minute, portions, reserved
+FEEDING_SCHEDULE_ENTRY = struct.Struct(">BBBBx")
+FEEDING_SCHEDULE_SEPARATOR = ","
+
 LOGGER = logging.getLogger(__name__)
 
 
+class FeedingDays(types.bitmap8):
+    """Days a scheduled feeding is active on."""
+
+    Monday = 0x01
+    Tuesday = 0x02
+    Wednesday = 0x04
+    Thursday = 0x08
+    Friday = 0x10
+    Saturday = 0x20
+    Sunday = 0x40
+
+    Workdays = 0x1F
+    Weekend = 0x60
+    Everyday = 0x7F
+
+
+@dataclasses.dataclass(frozen=True)
+class FeedingScheduleEntry:
+    """A single scheduled feeding."""
+
+    days: FeedingDays
+    hour: int
+    minute: int
+    portions: int
+
+
+class FeederAttribute(NamedTuple):
+    """A decoded feeder TLV record."""
+
+    direction: int
+    sequence: int
+    attribute_id: int
+    value: Any
+
+
+def decode_feeding_schedule(value: str) -> tuple[FeedingScheduleEntry, ...]:
+    """Decode the feeding schedule string reported by the device."""
+    entries = []
+    for entry in value.split(FEEDING_SCHEDULE_SEPARATOR):
+        if not entry:
+            continue
+        days, hour, minute, portions = FEEDING_SCHEDULE_ENTRY.unpack(
+            bytes.fromhex(entry)
+        )
+        entries.append(FeedingScheduleEntry(FeedingDays(days), hour, minute, portions))
+    return tuple(entries)
+
+
+def encode_feeding_schedule(schedule: Iterable[FeedingScheduleEntry]) -> str:
+    """Encode feeding schedule entries to the string the device expects."""
+    return FEEDING_SCHEDULE_SEPARATOR.join(
+        FEEDING_SCHEDULE_ENTRY.pack(
+            entry.days, entry.hour, entry.minute, entry.portions
+        )
+        .hex()
+        .upper()
+        for entry in schedule
+    )
+
+
+def encode_feeder_attribute(
+    sequence: int,
+    attribute_id: int,
+    value: Any = None,
+    length: int | None = None,
+    direction: int = FEEDER_DIRECTION_WRITE,
+) -> bytes:
+    """Encode a single feeder TLV record."""
+    if value is None:
+        buf = bytearray(FEEDER_PREFIX.size)
+        FEEDER_PREFIX.pack_into(buf, 0, direction, sequence, attribute_id)
+        return bytes(buf)
+
+    int_format = FEEDER_INT_FORMATS.get(length)
+    if int_format is None:
+        if isinstance(value, int):
+            raise ValueError(f"Unsupported feeder value length: {length}")
+        payload = value.encode("utf-8") if isinstance(value, str) else bytes(value)
+        length = len(payload)
+
+    buf = bytearray(FEEDER_HEADER.size + length)
+    FEEDER_HEADER.pack_into(buf, 0, direction, sequence, attribute_id, length)
+    if int_format is not None:
+        int_format.pack_into(buf, FEEDER_HEADER.size, value)
+    else:
+        buf[FEEDER_HEADER.size :] = payload
+    return bytes(buf)
+
+
+def decode_feeder_attribute(data: bytes) -> FeederAttribute:
+    """Decode a single feeder TLV record."""
+    if len(data) < FEEDER_HEADER.size:
+        raise ValueError(f"Feeder attribute is too short: {data!r}")
+
+    direction, sequence, attribute_id, length = FEEDER_HEADER.unpack_from(data)
+    payload = bytes(data[FEEDER_HEADER.size : FEEDER_HEADER.size + length])
+
+    value_type = FEEDER_VALUE_TYPES.get(attribute_id)
+    int_format = FEEDER_INT_FORMATS.get(len(payload))
+    if value_type is str:
+        value = payload.decode("utf-8")
+    elif value_type is int and int_format is not None:
+        (value,) = int_format.unpack(payload)
+    else:
+        value = payload
+    return FeederAttribute(direction, sequence, attribute_id, value)
+
+
 class OppleCluster(XiaomiAqaraE1Cluster):
     """Opple cluster."""
 
@@ -109,6 +260,7 @@ class OppleCluster(XiaomiAqaraE1Cluster):
         ZCL_FEEDING_MODE: ("feeding_mode", FeedingMode, True),
         ZCL_SERVING_SIZE: ("serving_size", types.uint8_t, True),
         ZCL_PORTION_WEIGHT: ("portion_weight", types.uint8_t, True),
+        ZCL_FEEDING_SCHEDULE: ("feeding_schedule", types.CharacterString, True),
         FEEDER_ATTR: (FEEDER_ATTR_NAME, types.LVBytes, True),
     }
 
@@ -141,39 +293,33 @@ class OppleCluster(XiaomiAqaraE1Cluster):
 
     def _update_feeder_attribute(self, attrid: int, value: Any) -> None:
         zcl_attr_def = self.attributes.get(AQARA_TO_ZCL[attrid])
-        self._update_attribute(zcl_attr_def.id, zcl_attr_def.type.deserialize(value)[0])
+        self._update_attribute(zcl_attr_def.id, zcl_attr_def.type(value))
 
     def _parse_feeder_attribute(self, value: bytes) -> None:
         """Parse the feeder attribute."""
-        attribute, _ = types.int32s_be.deserialize(value[3:7])
-        LOGGER.debug("OppleCluster._parse_feeder_attribute: attribute: %s", attribute)
-        length, _ = types.uint8_t.deserialize(value[7:8])
-        LOGGER.debug("OppleCluster._parse_feeder_attribute: length: %s", length)
-        attribute_value = value[8 : (length + 8)]
-        LOGGER.debug("OppleCluster._parse_feeder_attribute: value: %s", attribute_value)
+        record = decode_feeder_attribute(value)
+        attribute = record.attribute_id
+        attribute_value = record.value
+        LOGGER.debug(
+            "OppleCluster._parse_feeder_attribute: attribute: %s value: %s",
+            attribute,
+            attribute_value,
+        )
 
         if attribute in AQARA_TO_ZCL:
             self._update_feeder_attribute(attribute, attribute_value)
         elif attribute == FEEDING_REPORT:
-            attr_str = attribute_value.decode("utf-8")
-            feeding_source = attr_str[0:2]
-            feeding_size = attr_str[3:4]
+            feeding_source = attribute_value[0:2]
+            feeding_size = attribute_value[3:4]
             self._update_attribute(
-                ZCL_LAST_FEEDING_SOURCE, OppleCluster.FeedingSource(feeding_source)
+                ZCL_LAST_FEEDING_SOURCE,
+                OppleCluster.FeedingSource(int(feeding_source, base=16)),
             )
             self._update_attribute(ZCL_LAST_FEEDING_SIZE, int(feeding_size, base=16))
         elif attribute == PORTIONS_DISPENSED:
-            portions_per_day, _ = types.uint16_t_be.deserialize(attribute_value)
-            self._update_attribute(ZCL_PORTIONS_DISPENSED, portions_per_day)
+            self._update_attribute(ZCL_PORTIONS_DISPENSED, attribute_value)
         elif attribute == WEIGHT_DISPENSED:
-            weight_per_day, _ = types.uint32_t_be.deserialize(attribute_value)
-            self._update_attribute(ZCL_WEIGHT_DISPENSED, weight_per_day)
-        elif attribute == SCHEDULING_STRING:
-            LOGGER.debug(
-                "OppleCluster._parse_feeder_attribute: schedule not currently handled: attribute: %s value: %s",
-                attribute,
-                attribute_value,
-            )
+            self._update_attribute(ZCL_WEIGHT_DISPENSED, attribute_value)
         else:
             LOGGER.debug(
                 "OppleCluster._parse_feeder_attribute: unhandled attribute: %s value: %s",
@@ -192,20 +338,8 @@ class OppleCluster(XiaomiAqaraE1Cluster):
             length,
         )
         self._send_sequence = ((self._send_sequence or 0) + 1) % 256
-        val = bytes([0x00, 0x02, self._send_sequence])
+        val = encode_feeder_attribute(self._send_sequence, attribute_id, value, length)
         self._send_sequence += 1
-        val += types.int32s_be(attribute_id).serialize()
-        if length is not None and value is not None:
-            val += types.uint8_t(length).serialize()
-        if value is not None:
-            if length == 1:
-                val += types.uint8_t(value).serialize()
-            elif length == 2:
-                val += types.uint16_t_be(value).serialize()
-            elif length == 4:
-                val += types.uint32_t_be(value).serialize()
-            else:
-                val += value
         LOGGER.debug(
             "OppleCluster.build_feeder_attribute: id: %s, cooked value: %s length: %s",
             attribute_id,
@@ -222,11 +356,17 @@ class OppleCluster(XiaomiAqaraE1Cluster):
         for attr, value in attributes.items():
             attr_def = self.find_attribute(attr)
             attr_id = attr_def.id
-            if attr_id in ZCL_TO_AQARA:
+            if attr_id == ZCL_FEEDING_SCHEDULE:
+                if not isinstance(value, str):
+                    value = encode_feeding_schedule(value)
                 attribute, cooked_value = self._build_feeder_attribute(
-                    ZCL_TO_AQARA[attr_id],
-                    value,
-                    4 if attr_def.name in ["serving_size", "portion_weight"] else 1,
+                    SCHEDULING_STRING, value
+                )
+                attrs[attribute] = cooked_value
+            elif attr_id in ZCL_TO_AQARA:
+                aqara_id = ZCL_TO_AQARA[attr_id]
+                attribute, cooked_value = self._build_feeder_attribute(
+                    aqara_id, value, FEEDER_WRITE_LENGTHS.get(aqara_id, 1)
                 )
                 attrs[attribute] = cooked_value
             else:
@@ -234,6 +374,21 @@ class OppleCluster(XiaomiAqaraE1Cluster):
         LOGGER.debug("OppleCluster.write_attributes: %s", attrs)
         return await super().write_attributes(attrs, manufacturer)
 
+    async def write_feeding_schedule(
+        self,
+        schedule: Iterable[FeedingScheduleEntry],
+        manufacturer: int | None = None,
+    ) -> list:
+        """Replace the whole feeding schedule with a single write."""
+        return await self.write_attributes(
+            {ZCL_FEEDING_SCHEDULE: encode_feeding_schedule(schedule)}, manufacturer
+        )
+
+    @property
+    def feeding_schedule(self) -> tuple[FeedingScheduleEntry, ...]:
+        """Feeding schedule last reported by the device."""
+        return decode_feeding_schedule(self._attr_cache.get(ZCL_FEEDING_SCHEDULE, ""))
+
     async def write_attributes_raw(
         self, attrs: list[foundation.Attribute], manufacturer: int | None = None
     ) -> list:
@@ -1,5 +1,11 @@
 """Xiaomi aqara opple remote devices."""
 
+from __future__ import annotations
+
+import dataclasses
+import functools
+from typing import Any
+
 from zigpy import types
 from zigpy.profiles import zha
 from zigpy.zcl.clusters.general import (
@@ -153,84 +159,155 @@ class OppleCluster(XiaomiAqaraE1Cluster):
         return result
 
 
-class RemoteB286OPCN01(XiaomiCustomDevice):
-    """Aqara Opple 2 button remote device."""
+OPPLE_NODE_DESC = NodeDescriptor(
+    0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
+)
 
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b286opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            # <SimpleDescriptor endpoint=2 profile=260 device_type=259
-            # device_version=1
-            # input_clusters=[3]
-            # output_clusters=[6, 3]>
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-            3: {},
-            4: {},
-            5: {},
-            6: {},
-        },
-    }
+# Endpoint 1 reports the battery and sends the default (command) mode commands
+# <SimpleDescriptor endpoint=1 profile=260 device_type=261
+# device_version=1
+# input_clusters=[0, 3, 1]
+# output_clusters=[3, 6, 8, 768]>
+SIGNATURE_ENDPOINT_1 = (
+    zha.DeviceType.COLOR_DIMMER_SWITCH,
+    (Basic.cluster_id, Identify.cluster_id, PowerConfigurationCluster.cluster_id),
+    (Identify.cluster_id, OnOff.cluster_id, LevelControl.cluster_id, Color.cluster_id),
+)
+REPLACEMENT_ENDPOINT_1 = (
+    zha.DeviceType.COLOR_DIMMER_SWITCH,
+    (
+        BasicCluster,
+        Identify.cluster_id,
+        PowerConfigurationCluster,
+        OppleCluster,
+        MultistateInputCluster,
+    ),
+    SIGNATURE_ENDPOINT_1[2],
+)
+
+# Layouts of endpoints 2 and up, which are all on/off light switches, as
+# (input clusters, output clusters). EMPTY is an endpoint without a descriptor.
+EMPTY = None
+# <SimpleDescriptor endpoint=2 profile=260 device_type=259
+# device_version=1
+# input_clusters=[3]
+# output_clusters=[6, 3]>
+SIGNATURE_SWITCH = ((Identify.cluster_id,), (Identify.cluster_id, OnOff.cluster_id))
+SIGNATURE_SWITCH_V2 = ((Identify.cluster_id,), (OnOff.cluster_id, Identify.cluster_id))
+SIGNATURE_BUTTON = (
+    (MultistateInput.cluster_id, Identify.cluster_id),
+    (OnOff.cluster_id,),
+)
+SIGNATURE_BUTTON_V2 = (
+    (Identify.cluster_id, MultistateInput.cluster_id),
+    (OnOff.cluster_id,),
+)
+REPLACEMENT_SWITCH = (
+    (Identify.cluster_id, MultistateInputCluster),
+    (Identify.cluster_id, OnOff.cluster_id),
+)
+REPLACEMENT_SWITCH_V2 = (
+    (MultistateInputCluster, Identify.cluster_id),
+    (OnOff.cluster_id, Identify.cluster_id),
+)
+REPLACEMENT_BUTTON = ((MultistateInputCluster,), ())
+REPLACEMENT_BUTTON_V2 = (
+    (MultistateInputCluster, Identify.cluster_id),
+    (OnOff.cluster_id,),
+)
 
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id, MultistateInputCluster],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-            3: {},
-            4: {},
-            5: {},
-            6: {},
-        },
-    }
 
-    device_automation_triggers = {
+@dataclasses.dataclass(frozen=True)
+class OppleRemoteVariant:
+    """Firmware variant of an Aqara Opple remote.
+
+    The endpoint layouts describe endpoints 2 and up, in order.
+    """
+
+    buttons: int
+    signature_endpoints: tuple[tuple | None, ...]
+    replacement_endpoints: tuple[tuple | None, ...]
+    description: str = ""
+
+    @property
+    def model(self) -> str:
+        """Model reported by the remote."""
+        return f"lumi.remote.b{self.buttons}86opcn01"
+
+
+OPPLE_REMOTE_VARIANTS = {
+    "RemoteB286OPCN01": OppleRemoteVariant(
+        2,
+        (SIGNATURE_SWITCH, EMPTY, EMPTY, EMPTY, EMPTY),
+        (REPLACEMENT_SWITCH, EMPTY, EMPTY, EMPTY, EMPTY),
+    ),
+    "RemoteB286OPCN01V2": OppleRemoteVariant(
+        2,
+        (),
+        (REPLACEMENT_SWITCH,) + (REPLACEMENT_BUTTON,) * 4,
+    ),
+    "RemoteB286OPCN01Alt": OppleRemoteVariant(
+        2,
+        (EMPTY,) * 5,
+        (REPLACEMENT_SWITCH, EMPTY, EMPTY, EMPTY, EMPTY),
+        " (after alternate mode is enabled)",
+    ),
+    "RemoteB486OPCN01": OppleRemoteVariant(
+        4,
+        (SIGNATURE_SWITCH, EMPTY, EMPTY, EMPTY, EMPTY),
+        (REPLACEMENT_SWITCH, REPLACEMENT_BUTTON, REPLACEMENT_BUTTON, EMPTY, EMPTY),
+    ),
+    "RemoteB686OPCN01": OppleRemoteVariant(
+        6,
+        (SIGNATURE_SWITCH, EMPTY, EMPTY, EMPTY, EMPTY),
+        (REPLACEMENT_SWITCH,) + (REPLACEMENT_BUTTON,) * 4,
+    ),
+    "RemoteB286OPCN01V3": OppleRemoteVariant(2, (SIGNATURE_SWITCH,), ()),
+    "RemoteB286OPCN01V4": OppleRemoteVariant(
+        2,
+        (SIGNATURE_SWITCH_V2,) + (SIGNATURE_BUTTON,) * 4,
+        (REPLACEMENT_SWITCH_V2,) + (REPLACEMENT_BUTTON_V2,) * 4,
+    ),
+    "RemoteB486OPCN01V2": OppleRemoteVariant(
+        4,
+        (),
+        (REPLACEMENT_SWITCH, REPLACEMENT_BUTTON, REPLACEMENT_BUTTON),
+    ),
+    "RemoteB486OPCN01V3": OppleRemoteVariant(
+        4,
+        (EMPTY,) * 5,
+        (REPLACEMENT_SWITCH, REPLACEMENT_BUTTON, REPLACEMENT_BUTTON, EMPTY, EMPTY),
+    ),
+    "RemoteB486OPCN01V4": OppleRemoteVariant(
+        4,
+        (SIGNATURE_SWITCH,) + (SIGNATURE_BUTTON_V2,) * 4,
+        (REPLACEMENT_SWITCH,) + (REPLACEMENT_BUTTON,) * 4,
+    ),
+    "RemoteB686OPCN01V2": OppleRemoteVariant(
+        6,
+        (),
+        (REPLACEMENT_SWITCH,) + (REPLACEMENT_BUTTON,) * 4,
+    ),
+    "RemoteB686OPCN01V3": OppleRemoteVariant(
+        6,
+        (SIGNATURE_SWITCH_V2,) + (SIGNATURE_BUTTON,) * 4,
+        (REPLACEMENT_SWITCH_V2,) + (REPLACEMENT_BUTTON_V2,) * 4,
+    ),
+    "RemoteB686OPCN01V4": OppleRemoteVariant(
+        6,
+        (SIGNATURE_SWITCH_V2, SIGNATURE_BUTTON, SIGNATURE_BUTTON, EMPTY, EMPTY),
+        (REPLACEMENT_SWITCH_V2,) + (REPLACEMENT_BUTTON_V2,) * 4,
+    ),
+    "RemoteB686OPCN01V5": OppleRemoteVariant(
+        6,
+        (EMPTY,) * 5,
+        (REPLACEMENT_SWITCH_V2,) + (REPLACEMENT_BUTTON_V2,) * 4,
+    ),
+}
+
+# Triggers for the commands sent from endpoint 1 in the default (command) mode
+COMMAND_MODE_TRIGGERS = {
+    2: {
         (DOUBLE_PRESS, BUTTON_1): {
             COMMAND: COMMAND_STEP,
             ENDPOINT_ID: 1,
@@ -253,264 +330,8 @@ class RemoteB286OPCN01(XiaomiCustomDevice):
             ENDPOINT_ID: 1,
             PARAMS: {"step_mode": 3},
         },
-        (ALT_SHORT_PRESS, BUTTON_1): {COMMAND: COMMAND_1_SINGLE},
-        (ALT_DOUBLE_PRESS, BUTTON_1): {COMMAND: COMMAND_1_DOUBLE},
-        (TRIPLE_PRESS, BUTTON_1): {COMMAND: COMMAND_1_TRIPLE},
-        (ALT_LONG_PRESS, BUTTON_1): {COMMAND: COMMAND_1_HOLD},
-        (LONG_RELEASE, BUTTON_1): {COMMAND: COMMAND_1_RELEASE},
-        (ALT_SHORT_PRESS, BUTTON_2): {COMMAND: COMMAND_2_SINGLE},
-        (ALT_DOUBLE_PRESS, BUTTON_2): {COMMAND: COMMAND_2_DOUBLE},
-        (TRIPLE_PRESS, BUTTON_2): {COMMAND: COMMAND_2_TRIPLE},
-        (ALT_LONG_PRESS, BUTTON_2): {COMMAND: COMMAND_2_HOLD},
-        (LONG_RELEASE, BUTTON_2): {COMMAND: COMMAND_2_RELEASE},
-    }
-
-
-class RemoteB286OPCN01V2(XiaomiCustomDevice):
-    """Aqara Opple 2 button remote device."""
-
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b286opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            }
-        },
-    }
-
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id, MultistateInputCluster],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            5: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            6: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-        },
-    }
-
-    device_automation_triggers = RemoteB286OPCN01.device_automation_triggers
-
-
-class RemoteB286OPCN01Alt(XiaomiCustomDevice):
-    """Aqara Opple 2 button remote device (after alternate mode is enabled)."""
-
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b286opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {},
-            3: {},
-            4: {},
-            5: {},
-            6: {},
-        },
-    }
-
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id, MultistateInputCluster],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-            3: {},
-            4: {},
-            5: {},
-            6: {},
-        },
-    }
-
-    device_automation_triggers = RemoteB286OPCN01.device_automation_triggers
-
-
-class RemoteB486OPCN01(XiaomiCustomDevice):
-    """Aqara Opple 4 button remote device."""
-
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b486opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            # <SimpleDescriptor endpoint=2 profile=260 device_type=259
-            # device_version=1
-            # input_clusters=[3]
-            # output_clusters=[6, 3]>
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-            3: {},
-            4: {},
-            5: {},
-            6: {},
-        },
-    }
-
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id, MultistateInputCluster],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            5: {},
-            6: {},
-        },
-    }
-
-    device_automation_triggers = {
+    },
+    4: {
         (SHORT_PRESS, BUTTON_1): {COMMAND: COMMAND_OFF, ENDPOINT_ID: 1},
         (SHORT_PRESS, BUTTON_2): {COMMAND: COMMAND_ON, ENDPOINT_ID: 1},
         (SHORT_PRESS, BUTTON_3): {
@@ -533,127 +354,8 @@ class RemoteB486OPCN01(XiaomiCustomDevice):
             ENDPOINT_ID: 1,
             PARAMS: {"step_mode": 3},
         },
-        (ALT_SHORT_PRESS, BUTTON_1): {COMMAND: COMMAND_1_SINGLE},
-        (ALT_DOUBLE_PRESS, BUTTON_1): {COMMAND: COMMAND_1_DOUBLE},
-        (TRIPLE_PRESS, BUTTON_1): {COMMAND: COMMAND_1_TRIPLE},
-        (ALT_LONG_PRESS, BUTTON_1): {COMMAND: COMMAND_1_HOLD},
-        (LONG_RELEASE, BUTTON_1): {COMMAND: COMMAND_1_RELEASE},
-        (ALT_SHORT_PRESS, BUTTON_2): {COMMAND: COMMAND_2_SINGLE},
-        (ALT_DOUBLE_PRESS, BUTTON_2): {COMMAND: COMMAND_2_DOUBLE},
-        (TRIPLE_PRESS, BUTTON_2): {COMMAND: COMMAND_2_TRIPLE},
-        (ALT_LONG_PRESS, BUTTON_2): {COMMAND: COMMAND_2_HOLD},
-        (LONG_RELEASE, BUTTON_2): {COMMAND: COMMAND_2_RELEASE},
-        (ALT_SHORT_PRESS, BUTTON_3): {COMMAND: COMMAND_3_SINGLE},
-        (ALT_DOUBLE_PRESS, BUTTON_3): {COMMAND: COMMAND_3_DOUBLE},
-        (TRIPLE_PRESS, BUTTON_3): {COMMAND: COMMAND_3_TRIPLE},
-        (ALT_LONG_PRESS, BUTTON_3): {COMMAND: COMMAND_3_HOLD},
-        (LONG_RELEASE, BUTTON_3): {COMMAND: COMMAND_3_RELEASE},
-        (ALT_SHORT_PRESS, BUTTON_4): {COMMAND: COMMAND_4_SINGLE},
-        (ALT_DOUBLE_PRESS, BUTTON_4): {COMMAND: COMMAND_4_DOUBLE},
-        (TRIPLE_PRESS, BUTTON_4): {COMMAND: COMMAND_4_TRIPLE},
-        (ALT_LONG_PRESS, BUTTON_4): {COMMAND: COMMAND_4_HOLD},
-        (LONG_RELEASE, BUTTON_4): {COMMAND: COMMAND_4_RELEASE},
-    }
-
-
-class RemoteB686OPCN01(XiaomiCustomDevice):
-    """Aqara Opple 6 button remote device."""
-
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b686opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            # <SimpleDescriptor endpoint=2 profile=260 device_type=259
-            # device_version=1
-            # input_clusters=[3]
-            # output_clusters=[6, 3]>
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-            3: {},
-            4: {},
-            5: {},
-            6: {},
-        },
-    }
-
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id, MultistateInputCluster],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            5: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            6: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-        },
-    }
-
-    device_automation_triggers = {
+    },
+    6: {
         (SHORT_PRESS, BUTTON_1): {COMMAND: COMMAND_OFF, ENDPOINT_ID: 1},
         (SHORT_PRESS, BUTTON_2): {COMMAND: COMMAND_ON, ENDPOINT_ID: 1},
         (SHORT_PRESS, BUTTON_3): {
@@ -696,924 +398,117 @@ class RemoteB686OPCN01(XiaomiCustomDevice):
             ENDPOINT_ID: 1,
             PARAMS: {"move_mode": 3},
         },
-        (ALT_SHORT_PRESS, BUTTON_1): {COMMAND: COMMAND_1_SINGLE},
-        (ALT_DOUBLE_PRESS, BUTTON_1): {COMMAND: COMMAND_1_DOUBLE},
-        (TRIPLE_PRESS, BUTTON_1): {COMMAND: COMMAND_1_TRIPLE},
-        (ALT_LONG_PRESS, BUTTON_1): {COMMAND: COMMAND_1_HOLD},
-        (LONG_RELEASE, BUTTON_1): {COMMAND: COMMAND_1_RELEASE},
-        (ALT_SHORT_PRESS, BUTTON_2): {COMMAND: COMMAND_2_SINGLE},
-        (ALT_DOUBLE_PRESS, BUTTON_2): {COMMAND: COMMAND_2_DOUBLE},
-        (TRIPLE_PRESS, BUTTON_2): {COMMAND: COMMAND_2_TRIPLE},
-        (ALT_LONG_PRESS, BUTTON_2): {COMMAND: COMMAND_2_HOLD},
-        (LONG_RELEASE, BUTTON_2): {COMMAND: COMMAND_2_RELEASE},
-        (ALT_SHORT_PRESS, BUTTON_3): {COMMAND: COMMAND_3_SINGLE},
-        (ALT_DOUBLE_PRESS, BUTTON_3): {COMMAND: COMMAND_3_DOUBLE},
-        (TRIPLE_PRESS, BUTTON_3): {COMMAND: COMMAND_3_TRIPLE},
-        (ALT_LONG_PRESS, BUTTON_3): {COMMAND: COMMAND_3_HOLD},
-        (LONG_RELEASE, BUTTON_3): {COMMAND: COMMAND_3_RELEASE},
-        (ALT_SHORT_PRESS, BUTTON_4): {COMMAND: COMMAND_4_SINGLE},
-        (ALT_DOUBLE_PRESS, BUTTON_4): {COMMAND: COMMAND_4_DOUBLE},
-        (TRIPLE_PRESS, BUTTON_4): {COMMAND: COMMAND_4_TRIPLE},
-        (ALT_LONG_PRESS, BUTTON_4): {COMMAND: COMMAND_4_HOLD},
-        (LONG_RELEASE, BUTTON_4): {COMMAND: COMMAND_4_RELEASE},
-        (ALT_SHORT_PRESS, BUTTON_5): {COMMAND: COMMAND_5_SINGLE},
-        (ALT_DOUBLE_PRESS, BUTTON_5): {COMMAND: COMMAND_5_DOUBLE},
-        (TRIPLE_PRESS, BUTTON_5): {COMMAND: COMMAND_5_TRIPLE},
-        (ALT_LONG_PRESS, BUTTON_5): {COMMAND: COMMAND_5_HOLD},
-        (LONG_RELEASE, BUTTON_5): {COMMAND: COMMAND_5_RELEASE},
-        (ALT_SHORT_PRESS, BUTTON_6): {COMMAND: COMMAND_6_SINGLE},
-        (ALT_DOUBLE_PRESS, BUTTON_6): {COMMAND: COMMAND_6_DOUBLE},
-        (TRIPLE_PRESS, BUTTON_6): {COMMAND: COMMAND_6_TRIPLE},
-        (ALT_LONG_PRESS, BUTTON_6): {COMMAND: COMMAND_6_HOLD},
-        (LONG_RELEASE, BUTTON_6): {COMMAND: COMMAND_6_RELEASE},
-    }
-
-
-class RemoteB286OPCN01V3(XiaomiCustomDevice):
-    """Aqara Opple 2 button remote device."""
-
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b286opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            # <SimpleDescriptor endpoint=2 profile=260 device_type=259
-            # device_version=1
-            # input_clusters=[3]
-            # output_clusters=[6, 3]>
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-        },
-    }
-
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            }
-        },
-    }
-
-    device_automation_triggers = RemoteB286OPCN01.device_automation_triggers
-
-
-class RemoteB286OPCN01V4(XiaomiCustomDevice):
-    """Aqara Opple 2 button remote device."""
-
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b286opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id, Identify.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [
-                    MultistateInputCluster.cluster_id,
-                    Identify.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [
-                    MultistateInputCluster.cluster_id,
-                    Identify.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            5: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [
-                    MultistateInputCluster.cluster_id,
-                    Identify.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            6: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [
-                    MultistateInputCluster.cluster_id,
-                    Identify.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-        },
-    }
-
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id, Identify.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            5: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            6: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-        },
-    }
-
-    device_automation_triggers = RemoteB286OPCN01.device_automation_triggers
+    },
+}
 
+# Press types sent by MultistateInputCluster, in multi-click mode
+ALT_MODE_TRIGGERS = (
+    (ALT_SHORT_PRESS, "single"),
+    (ALT_DOUBLE_PRESS, "double"),
+    (TRIPLE_PRESS, "triple"),
+    (ALT_LONG_PRESS, "hold"),
+    (LONG_RELEASE, "release"),
+)
 
-class RemoteB486OPCN01V2(XiaomiCustomDevice):
-    """Aqara Opple 4 button remote device."""
-
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b486opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            }
-        },
-    }
-
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id, MultistateInputCluster],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-        },
-    }
-
-    device_automation_triggers = RemoteB486OPCN01.device_automation_triggers
-
-
-class RemoteB486OPCN01V3(XiaomiCustomDevice):
-    """Aqara Opple 4 button remote device."""
-
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b486opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {},
-            3: {},
-            4: {},
-            5: {},
-            6: {},
-        },
-    }
-
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id, MultistateInputCluster],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            5: {},
-            6: {},
-        },
-    }
-
-    device_automation_triggers = RemoteB486OPCN01.device_automation_triggers
-
-
-class RemoteB486OPCN01V4(XiaomiCustomDevice):
-    """Aqara Opple 4 button remote device."""
-
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b486opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            # <SimpleDescriptor endpoint=2 profile=260 device_type=259
-            # device_version=1
-            # input_clusters=[3]
-            # output_clusters=[6, 3]>
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-            # <SimpleDescriptor endpoint=2 profile=260 device_type=259
-            # device_version=1
-            # input_clusters=[3, 18]
-            # output_clusters=[6]>
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id, MultistateInput.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id, MultistateInput.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            5: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id, MultistateInput.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            6: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id, MultistateInput.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-        },
-    }
-
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id, MultistateInputCluster],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            5: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            6: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-        },
-    }
-
-    device_automation_triggers = RemoteB486OPCN01.device_automation_triggers
-
-
-class RemoteB686OPCN01V2(XiaomiCustomDevice):
-    """Aqara Opple 6 button remote device."""
-
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b686opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            }
-        },
-    }
-
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id, MultistateInputCluster],
-                OUTPUT_CLUSTERS: [Identify.cluster_id, OnOff.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            5: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-            6: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster],
-                OUTPUT_CLUSTERS: [],
-            },
-        },
-    }
-
-    device_automation_triggers = RemoteB686OPCN01.device_automation_triggers
-
-
-class RemoteB686OPCN01V3(XiaomiCustomDevice):
-    """Aqara Opple 6 button remote device."""
-
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b686opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id, Identify.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [
-                    MultistateInputCluster.cluster_id,
-                    Identify.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [
-                    MultistateInputCluster.cluster_id,
-                    Identify.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            5: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [
-                    MultistateInputCluster.cluster_id,
-                    Identify.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            6: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [
-                    MultistateInputCluster.cluster_id,
-                    Identify.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-        },
-    }
-
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id, Identify.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            5: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            6: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-        },
-    }
-
-    device_automation_triggers = RemoteB686OPCN01.device_automation_triggers
-
-
-class RemoteB686OPCN01V4(XiaomiCustomDevice):
-    """Aqara Opple 6 button remote device."""
-
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b686opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id, Identify.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [
-                    MultistateInputCluster.cluster_id,
-                    Identify.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [
-                    MultistateInputCluster.cluster_id,
-                    Identify.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            5: {},
-            6: {},
-        },
-    }
+BUTTONS = (BUTTON_1, BUTTON_2, BUTTON_3, BUTTON_4, BUTTON_5, BUTTON_6)
 
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id, Identify.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            5: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            6: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-        },
-    }
 
-    device_automation_triggers = RemoteB686OPCN01.device_automation_triggers
+@functools.cache
+def opple_remote_triggers(buttons: int) -> dict[tuple[str, str], dict[str, Any]]:
+    """Return the automation triggers of an Opple remote with this many buttons."""
+    triggers = dict(COMMAND_MODE_TRIGGERS[buttons])
 
+    for number, button in enumerate(BUTTONS[:buttons], start=1):
+        for trigger, press_type in ALT_MODE_TRIGGERS:
+            triggers[(trigger, button)] = {COMMAND: f"{number}_{press_type}"}
 
-class RemoteB686OPCN01V5(XiaomiCustomDevice):
-    """Aqara Opple 6 button remote device."""
+    return triggers
 
-    signature = {
-        # <SimpleDescriptor endpoint=1 profile=260 device_type=261
-        # device_version=1
-        # input_clusters=[0, 3, 1]
-        # output_clusters=[3, 6, 8, 768]>
-        MODELS_INFO: [(LUMI, "lumi.remote.b686opcn01")],
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {},
-            3: {},
-            4: {},
-            5: {},
-            6: {},
-        },
-    }
 
-    replacement = {
-        NODE_DESCRIPTOR: NodeDescriptor(
-            0x02, 0x40, 0x80, 0x115F, 0x7F, 0x0064, 0x2C00, 0x0064, 0x00
-        ),
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.COLOR_DIMMER_SWITCH,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    Identify.cluster_id,
-                    PowerConfigurationCluster,
-                    OppleCluster,
-                    MultistateInputCluster,
-                ],
-                OUTPUT_CLUSTERS: [
-                    Identify.cluster_id,
-                    OnOff.cluster_id,
-                    LevelControl.cluster_id,
-                    Color.cluster_id,
-                ],
-            },
-            2: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id, Identify.cluster_id],
-            },
-            3: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            4: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            5: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-            6: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
-                INPUT_CLUSTERS: [MultistateInputCluster, Identify.cluster_id],
-                OUTPUT_CLUSTERS: [OnOff.cluster_id],
-            },
-        },
-    }
+class OppleRemoteTriggers:
+    """Automation triggers built on first access, shared by remotes of a size."""
 
-    device_automation_triggers = RemoteB686OPCN01.device_automation_triggers
+    def __init__(self, buttons: int) -> None:
+        """Init."""
+        self.buttons = buttons
+
+    def __get__(self, obj, objtype=None) -> dict[tuple[str, str], dict[str, Any]]:
+        """Return the triggers."""
+        return opple_remote_triggers(self.buttons)
+
+
+def _endpoints(
+    endpoint_1: tuple, layouts: tuple[tuple | None, ...]
+) -> dict[int, dict[str, Any]]:
+    """Expand endpoint layouts into a signature or replacement endpoint dict."""
+    device_type, input_clusters, output_clusters = endpoint_1
+    endpoints = {
+        1: {
+            PROFILE_ID: zha.PROFILE_ID,
+            DEVICE_TYPE: device_type,
+            INPUT_CLUSTERS: list(input_clusters),
+            OUTPUT_CLUSTERS: list(output_clusters),
+        }
+    }
+
+    for endpoint_id, layout in enumerate(layouts, start=2):
+        if layout is EMPTY:
+            endpoints[endpoint_id] = {}
+            continue
+
+        input_clusters, output_clusters = layout
+        endpoints[endpoint_id] = {
+            PROFILE_ID: zha.PROFILE_ID,
+            DEVICE_TYPE: zha.DeviceType.ON_OFF_LIGHT_SWITCH,
+            INPUT_CLUSTERS: list(input_clusters),
+            OUTPUT_CLUSTERS: list(output_clusters),
+        }
+
+    return endpoints
+
+
+def _opple_remote_quirk(name: str) -> type[XiaomiCustomDevice]:
+    """Create the quirk class of an Opple remote variant."""
+    variant = OPPLE_REMOTE_VARIANTS[name]
+
+    return type(
+        name,
+        (XiaomiCustomDevice,),
+        {
+            "__module__": __name__,
+            "__qualname__": name,
+            "__doc__": (
+                f"Aqara Opple {variant.buttons} button remote device"
+                f"{variant.description}."
+            ),
+            "signature": {
+                MODELS_INFO: [(LUMI, variant.model)],
+                ENDPOINTS: _endpoints(
+                    SIGNATURE_ENDPOINT_1, variant.signature_endpoints
+                ),
+            },
+            "replacement": {
+                NODE_DESCRIPTOR: OPPLE_NODE_DESC,
+                ENDPOINTS: _endpoints(
+                    REPLACEMENT_ENDPOINT_1, variant.replacement_endpoints
+                ),
+            },
+            "device_automation_triggers": OppleRemoteTriggers(variant.buttons),
+        },
+    )
+
+
+RemoteB286OPCN01 = _opple_remote_quirk("RemoteB286OPCN01")
+RemoteB286OPCN01V2 = _opple_remote_quirk("RemoteB286OPCN01V2")
+RemoteB286OPCN01Alt = _opple_remote_quirk("RemoteB286OPCN01Alt")
+RemoteB486OPCN01 = _opple_remote_quirk("RemoteB486OPCN01")
+RemoteB686OPCN01 = _opple_remote_quirk("RemoteB686OPCN01")
+RemoteB286OPCN01V3 = _opple_remote_quirk("RemoteB286OPCN01V3")
+RemoteB286OPCN01V4 = _opple_remote_quirk("RemoteB286OPCN01V4")
+RemoteB486OPCN01V2 = _opple_remote_quirk("RemoteB486OPCN01V2")
+RemoteB486OPCN01V3 = _opple_remote_quirk("RemoteB486OPCN01V3")
+RemoteB486OPCN01V4 = _opple_remote_quirk("RemoteB486OPCN01V4")
+RemoteB686OPCN01V2 = _opple_remote_quirk("RemoteB686OPCN01V2")
+RemoteB686OPCN01V3 = _opple_remote_quirk("RemoteB686OPCN01V3")
+RemoteB686OPCN01V4 = _opple_remote_quirk("RemoteB686OPCN01V4")
+RemoteB686OPCN01V5 = _opple_remote_quirk("RemoteB686OPCN01V5")
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from functools import reduce
+import functools
 import math
 import struct
-from typing import Any
+from typing import Any, NamedTuple
 
 from zigpy.profiles import zha
 from zigpy.quirks import CustomCluster
@@ -62,6 +62,13 @@ DAYS_MAP = {
 }
 NEXT_DAY_FLAG = 1 << 15
 
+# magic byte, day selection and four events of time, padding and temperature
+SCHEDULE_MAGIC_BYTE = 0x04
+SCHEDULE_EVENTS = 4
+SCHEDULE_EVENT_STRUCT = struct.Struct(">HxxH")
+SCHEDULE_STRUCT = struct.Struct(">BB" + "HxxH" * SCHEDULE_EVENTS)
+SCHEDULE_CACHE_SIZE = 64
+
 
 class ThermostatCluster(CustomCluster, Thermostat):
     """Thermostat cluster."""
@@ -139,6 +146,142 @@ class ThermostatCluster(CustomCluster, Thermostat):
         return result
 
 
+def _parse_time(string: str) -> int:
+    parts = string.split(":")
+    if len(parts) != 2:
+        raise ValueError("Time must contain ':' separator")
+    return int(parts[0]) * 60 + int(parts[1])
+
+
+def _validate_time(time: int) -> None:
+    if time <= 0 or time > 24 * 60:
+        raise ValueError("Time must be between 00:00 and 23:59")
+
+
+def _validate_temp(temp: float) -> None:
+    if temp < 5 or temp > 30:
+        raise ValueError("Temperature must be between 5 and 30 °C")
+    if (temp * 10) % 5 != 0:
+        raise ValueError("Temperature must be whole or half degrees")
+
+
+def _parse_event(string: str) -> tuple[int, float]:
+    groups = string.split(",")
+    if len(groups) != 2:
+        raise ValueError("Time and temperature must contain ',' separator")
+    time = _parse_time(groups[0])
+    temp = float(groups[1])
+    _validate_time(time)
+    _validate_temp(temp)
+    return time, temp
+
+
+def _unpack_event(raw_time: int, raw_temp: int) -> tuple[int, float]:
+    time = raw_time & ~NEXT_DAY_FLAG
+    temp = raw_temp / 100
+    _validate_time(time)
+    _validate_temp(temp)
+    return time, temp
+
+
+def _format_event(time: int, temp: float) -> str:
+    return f"{math.floor(time / 60)}:{f'{time % 60:0>2}'},{f'{temp:.1f}'}"
+
+
+def _parse_days(days: list[str]) -> int:
+    if len(days) == 0 or len(days) > 7:
+        raise ValueError("Number of days selected must be between 1 and 7")
+    if len(days) != len(set(days)):
+        raise ValueError("Duplicate day names present")
+    day_selection = 0x00
+    for d in days:
+        if d not in DAYS_MAP:
+            raise ValueError(
+                f"String: {d} is not a valid day name, valid names: mon, tue, wed, thu, fri, sat, sun"
+            )
+        day_selection |= DAYS_MAP[d]
+    return day_selection
+
+
+class Schedule(NamedTuple):
+    """Validated schedule in the layout used by the device."""
+
+    day_selection: int
+    times: tuple[int, ...]
+    temperatures: tuple[float, ...]
+    encoded: bytes
+
+    @property
+    def days(self) -> list[str]:
+        """Return the selected day names."""
+        return [d for d, v in DAYS_MAP.items() if self.day_selection & v]
+
+    def __str__(self) -> str:
+        """Return schedule as string."""
+        return "|".join(
+            [",".join(self.days)]
+            + [_format_event(*e) for e in zip(self.times, self.temperatures)]
+        )
+
+
+def _compile_schedule(day_selection: int, events: list[tuple[int, float]]) -> Schedule:
+    full_day = 24 * 60
+    fields = [SCHEDULE_MAGIC_BYTE, day_selection]
+    durations = []
+    prev_time = None
+    for time, temp in events:
+        raw_time = time
+        if prev_time is not None:
+            if time < prev_time:
+                raw_time |= NEXT_DAY_FLAG
+                durations.append(full_day - prev_time + time)
+            else:
+                durations.append(time - prev_time)
+        prev_time = time
+        fields += (raw_time, int(temp * 100))
+
+    if any(d < 60 for d in durations):
+        raise ValueError("The individual times must be at least 1 hour apart")
+    if sum(durations) > full_day:
+        raise ValueError("The start and end times must be at most 24 hours apart")
+
+    return Schedule(
+        day_selection,
+        tuple(time for time, _ in events),
+        tuple(temp for _, temp in events),
+        SCHEDULE_STRUCT.pack(*fields),
+    )
+
+
+@functools.lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def parse_schedule(value: str | bytes) -> Schedule:
+    """Parse and validate a schedule from its string or device representation."""
+    if isinstance(value, bytes):
+        if len(value) != SCHEDULE_STRUCT.size:
+            raise ValueError(f"Buffer size must equal {SCHEDULE_STRUCT.size}")
+        magic, day_selection, *raw_events = SCHEDULE_STRUCT.unpack(value)
+        if magic != SCHEDULE_MAGIC_BYTE:
+            raise ValueError("Magic byte must be equal to 0x04")
+        if day_selection & 0x01 or not day_selection:
+            raise ValueError("Incorrect day selected")
+        events = [
+            _unpack_event(raw_events[i], raw_events[i + 1])
+            for i in range(0, len(raw_events), 2)
+        ]
+    elif isinstance(value, str):
+        groups = value.split("|")
+        if len(groups) != SCHEDULE_EVENTS + 1:
+            raise ValueError("There must be 5 groups in a string")
+        day_selection = _parse_days(groups[0].split(","))
+        events = [_parse_event(group) for group in groups[1:]]
+    else:
+        raise TypeError(
+            f"Cannot create ScheduleSettings object from type: {type(value)}"
+        )
+
+    return _compile_schedule(day_selection, events)
+
+
 class ScheduleEvent:
     """Schedule event object."""
 
@@ -147,80 +290,17 @@ class ScheduleEvent:
     def __init__(self, value, is_next_day=False):
         """Create ScheduleEvent object from bytes or string."""
         if isinstance(value, bytes):
-            self._verify_buffer_len(value)
-            self._time = self._read_time_from_buf(value)
-            self._temp = self._read_temp_from_buf(value)
-            self._validate_time(self._time)
-            self._validate_temp(self._temp)
+            if len(value) != SCHEDULE_EVENT_STRUCT.size:
+                raise ValueError("Buffer size must equal 6")
+            self._time, self._temp = _unpack_event(*SCHEDULE_EVENT_STRUCT.unpack(value))
         elif isinstance(value, str):
-            groups = value.split(",")
-            if len(groups) != 2:
-                raise ValueError("Time and temperature must contain ',' separator")
-            self._time = self._parse_time(groups[0])
-            self._temp = self._parse_temp(groups[1])
-            self._validate_time(self._time)
-            self._validate_temp(self._temp)
+            self._time, self._temp = _parse_event(value)
         else:
             raise TypeError(
                 f"Cannot create ScheduleEvent object from type: {type(value)}"
             )
         self._is_next_day = is_next_day
 
-    @staticmethod
-    def _verify_buffer_len(buf):
-        if len(buf) != 6:
-            raise ValueError("Buffer size must equal 6")
-
-    @staticmethod
-    def _read_time_from_buf(buf):
-        time = struct.unpack_from(">H", buf, offset=0)[0]
-        time &= ~NEXT_DAY_FLAG
-        return time
-
-    @staticmethod
-    def _parse_time(string):
-        parts = string.split(":")
-        if len(parts) != 2:
-            raise ValueError("Time must contain ':' separator")
-
-        hours = int(parts[0])
-        minutes = int(parts[1])
-
-        return hours * 60 + minutes
-
-    @staticmethod
-    def _read_temp_from_buf(buf):
-        return struct.unpack_from(">H", buf, offset=4)[0] / 100
-
-    @staticmethod
-    def _parse_temp(string):
-        return float(string)
-
-    @staticmethod
-    def _validate_time(time):
-        if time <= 0:
-            raise ValueError("Time must be between 00:00 and 23:59")
-        if time > 24 * 60:
-            raise ValueError("Time must be between 00:00 and 23:59")
-
-    @staticmethod
-    def _validate_temp(temp):
-        if temp < 5:
-            raise ValueError("Temperature must be between 5 and 30 °C")
-        if temp > 30:
-            raise ValueError("Temperature must be between 5 and 30 °C")
-        if (temp * 10) % 5 != 0:
-            raise ValueError("Temperature must be whole or half degrees")
-
-    def _write_time_to_buf(self, buf):
-        time = self._time
-        if self._is_next_day:
-            time |= NEXT_DAY_FLAG
-        struct.pack_into(">H", buf, 0, time)
-
-    def _write_temp_to_buf(self, buf):
-        struct.pack_into(">H", buf, 4, int(self._temp * 100))
-
     def is_next_day(self):
         """Return if event is on the next day."""
         return self._is_next_day
@@ -235,14 +315,14 @@ class ScheduleEvent:
 
     def __str__(self):
         """Return event as string."""
-        return f"{math.floor(self._time / 60)}:{f'{self._time % 60:0>2}'},{f'{self._temp:.1f}'}"
+        return _format_event(self._time, self._temp)
 
     def serialize(self):
         """Serialize event to bytes."""
-        result = bytearray(6)
-        self._write_time_to_buf(result)
-        self._write_temp_to_buf(result)
-        return result
+        time = self._time
+        if self._is_next_day:
+            time |= NEXT_DAY_FLAG
+        return bytearray(SCHEDULE_EVENT_STRUCT.pack(time, int(self._temp * 100)))
 
 
 class ScheduleSettings(t.LVBytes):
@@ -250,123 +330,16 @@ class ScheduleSettings(t.LVBytes):
 
     def __new__(cls, value):
         """Create ScheduleSettings object from bytes or string."""
-        day_selection = None
-        events = [None] * 4
-        if isinstance(value, bytes):
-            ScheduleSettings._verify_buffer_len(value)
-            ScheduleSettings._verify_magic_byte(value)
-            day_selection = ScheduleSettings._read_day_selection(value)
-            for i in range(4):
-                events[i] = ScheduleSettings._read_event(value, i)
-        elif isinstance(value, str):
-            groups = value.split("|")
-            ScheduleSettings._verify_string(groups)
-            day_selection = ScheduleSettings._read_day_selection(groups[0])
-            for i in range(4):
-                events[i] = ScheduleSettings._read_event(groups[i + 1], i)
-        else:
-            raise TypeError(
-                f"Cannot create ScheduleSettings object from type: {type(value)}"
-            )
-
-        for i in range(1, 4):
-            if events[i].get_time() < events[i - 1].get_time():
-                events[i].set_next_day(True)
-        ScheduleSettings._verify_event_durations(events)
-
-        result = bytearray(b"\x04")
-        result.append(ScheduleSettings._get_day_selection_byte(day_selection))
-        for e in events:
-            result.extend(e.serialize())
-        return super().__new__(cls, bytes(result))
-
-    @staticmethod
-    def _verify_buffer_len(buf):
-        if len(buf) != 26:
-            raise ValueError("Buffer size must equal 26")
-
-    @staticmethod
-    def _verify_magic_byte(buf):
-        if struct.unpack_from("c", buf, offset=0)[0][0] != 0x04:
-            raise ValueError("Magic byte must be equal to 0x04")
+        return super().__new__(cls, parse_schedule(value).encoded)
 
-    @staticmethod
-    def _verify_string(groups):
-        if len(groups) != 5:
-            raise ValueError("There must be 5 groups in a string")
-        days = groups[0].split(",")
-        ScheduleSettings._verify_day_selection_in_str(days)
-
-    @staticmethod
-    def _verify_day_selection_in_str(days):
-        if len(days) == 0 or len(days) > 7:
-            raise ValueError("Number of days selected must be between 1 and 7")
-        if len(days) != len(set(days)):
-            raise ValueError("Duplicate day names present")
-        for d in days:
-            if d not in DAYS_MAP:
-                raise ValueError(
-                    f"String: {d} is not a valid day name, valid names: mon, tue, wed, thu, fri, sat, sun"
-                )
-
-    @staticmethod
-    def _read_day_selection(value):
-        day_selection = []
-        if isinstance(value, bytes):
-            byte = struct.unpack_from("c", value, offset=1)[0][0]
-            if byte & 0x01:
-                raise ValueError("Incorrect day selected")
-            for i, v in DAYS_MAP.items():
-                if byte & v:
-                    day_selection.append(i)
-            ScheduleSettings._verify_day_selection_in_str(day_selection)
-        elif isinstance(value, str):
-            day_selection = value.split(",")
-            ScheduleSettings._verify_day_selection_in_str(day_selection)
-        return day_selection
-
-    @staticmethod
-    def _read_event(value, index):
-        if isinstance(value, bytes):
-            event_buf = value[2 + index * 6 : 8 + index * 6]
-            return ScheduleEvent(event_buf)
-        elif isinstance(value, str):
-            return ScheduleEvent(value)
-
-    @staticmethod
-    def _verify_event_durations(events):
-        full_day = 24 * 60
-        prev_time = events[0].get_time()
-        durations = []
-        for i in range(1, 4):
-            event = events[i]
-            if event.is_next_day():
-                durations.append(full_day - prev_time + event.get_time())
-            else:
-                durations.append(event.get_time() - prev_time)
-            prev_time = event.get_time()
-        if any(d < 60 for d in durations):
-            raise ValueError("The individual times must be at least 1 hour apart")
-        if reduce((lambda x, y: x + y), durations) > full_day:
-            raise ValueError("The start and end times must be at most 24 hours apart")
-
-    @staticmethod
-    def _get_day_selection_byte(day_selection):
-        byte = 0x00
-        for d in day_selection:
-            byte |= DAYS_MAP[d]
-        return byte
+    @property
+    def schedule(self) -> Schedule:
+        """Return the parsed schedule."""
+        return parse_schedule(bytes(self))
 
     def __str__(self):
         """Return ScheduleSettings as string."""
-        day_selection = ScheduleSettings._read_day_selection(self)
-        events = [None] * 4
-        for i in range(4):
-            events[i] = ScheduleSettings._read_event(self, i)
-        result = ",".join(day_selection)
-        for e in events:
-            result += f"|{e}"
-        return result
+        return str(self.schedule)
 
 
 class AqaraThermostatSpecificCluster(XiaomiAqaraE1Cluster):
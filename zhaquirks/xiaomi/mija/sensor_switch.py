@@ -1,7 +1,5 @@
 """Xiaomi mija button device."""
 
-import asyncio
-
 from zigpy.profiles import zha
 from zigpy.zcl.clusters.general import (
     Basic,
@@ -13,7 +11,7 @@ from zigpy.zcl.clusters.general import (
     Scenes,
 )
 
-from zhaquirks import CustomCluster
+from zhaquirks import CustomCluster, TimerWheel
 from zhaquirks.const import (
     ARGS,
     BUTTON,
@@ -79,8 +77,7 @@ class MijaButton(XiaomiQuickInitDevice):
         def __init__(self, *args, **kwargs):
             """Init."""
             self._current_state = {}
-            self._loop = asyncio.get_running_loop()
-            self._timer_handle = None
+            self._hold_timer = TimerWheel.for_loop().timer(self._hold_timeout)
             super().__init__(*args, **kwargs)
 
         def _update_attribute(self, attrid, value):
@@ -91,14 +88,8 @@ class MijaButton(XiaomiQuickInitDevice):
                 value = not value
 
                 if value:
-                    if self._timer_handle:
-                        self._timer_handle.cancel()
-                    self._timer_handle = self._loop.call_later(
-                        self.hold_duration, self._hold_timeout
-                    )
-                elif self._timer_handle:
-                    self._timer_handle.cancel()
-                    self._timer_handle = None
+                    self._hold_timer.rearm(self.hold_duration)
+                elif self._hold_timer.cancel():
                     click_type = COMMAND_SINGLE
                 else:
                     self.listener_event(ZHA_SEND_EVENT, COMMAND_RELEASE, [])
@@ -117,7 +108,6 @@ class MijaButton(XiaomiQuickInitDevice):
         def _hold_timeout(self):
             """Handle hold timeout."""
 
-            self._timer_handle = None
             self.listener_event(ZHA_SEND_EVENT, COMMAND_HOLD, [])
 
     signature = {